@@ -0,0 +1,38 @@
+import time
+
+from libresvip.core.time_sync import TimeSynchronizer
+from libresvip.model.base import SongTempo
+from libresvip.plugins.acep import base_pitch_curve
+from libresvip.plugins.acep.base_pitch_curve import BasePitchCurve
+from libresvip.plugins.acep.model import AcepNote
+
+# 10 minutes at 120 bpm
+NOTE_COUNT = 2_400
+NOTE_LENGTH = 240
+
+
+def main() -> None:
+    notes = [
+        AcepNote(pos=i * NOTE_LENGTH, dur=NOTE_LENGTH, pitch=60 + i % 12) for i in range(NOTE_COUNT)
+    ]
+    synchronizer = TimeSynchronizer([SongTempo(position=0, bpm=120)])
+    seconds = [i * 0.005 for i in range(120_000)]
+    numpy_module = base_pitch_curve.np
+    for label, module in (("numpy", numpy_module), ("pure python", None)):
+        if label == "numpy" and module is None:
+            continue
+        base_pitch_curve.np = module
+        start = time.perf_counter()
+        curve = BasePitchCurve(notes, synchronizer)
+        build_secs = time.perf_counter() - start
+        start = time.perf_counter()
+        curve.semitone_values_at(seconds)
+        print(  # noqa: T201
+            f"{label}: build {build_secs:.3f}s, "
+            f"{len(seconds)} lookups {time.perf_counter() - start:.3f}s"
+        )
+    base_pitch_curve.np = numpy_module
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import io
+import math
+import pathlib
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from collections.abc import Callable
+
+from pydantic import BaseModel
+
+from libresvip.core.compat import json
+from libresvip.extension.manager import get_svs_plugin_by_value
+from libresvip.model.base import (
+    Note,
+    ParamCurve,
+    Params,
+    Points,
+    Project,
+    SingingTrack,
+    SongTempo,
+    TimeSignature,
+)
+from libresvip.model.point import PointColumns
+from libresvip.plugins.ace.model import AceProject
+from libresvip.plugins.s5p.model import S5pProject
+from libresvip.plugins.svp.model import SVProject
+from libresvip.plugins.tlp.model import TuneLabProject
+from libresvip.plugins.ufdata.model import UFData
+from libresvip.plugins.vfp.model import VOXFactoryProject
+from libresvip.plugins.vpr.model import VocaloidProject
+from libresvip.plugins.vvproj.model import VoiceVoxProject
+from libresvip.plugins.y77.model import Y77Project
+from libresvip.utils.jsonutils import dump_model_json
+
+POINT_COUNT = 50_000
+LYRICS = ("あ", "か", "さ", "た", "な")
+# plugin identifier -> vendor model and the archive member holding its JSON, if any
+VENDOR_MODELS: dict[str, tuple[type[BaseModel], str | None]] = {
+    "ace": (AceProject, None),
+    "json": (Project, None),
+    "s5p": (S5pProject, None),
+    "svp": (SVProject, None),
+    "tlp": (TuneLabProject, None),
+    "ufdata": (UFData, None),
+    "vfp": (VOXFactoryProject, "project.json"),
+    "vpr": (VocaloidProject, "Project/sequence.json"),
+    "vvproj": (VoiceVoxProject, None),
+    "y77": (Y77Project, None),
+}
+
+
+def make_project() -> Project:
+    xs = list(range(0, POINT_COUNT * 5, 5))
+    pitch = [6000 + round(300 * math.sin(x / 400)) for x in xs]
+    return Project(
+        song_tempo_list=[SongTempo(position=0, bpm=120)],
+        time_signature_list=[TimeSignature()],
+        track_list=[
+            SingingTrack(
+                title="トラック",
+                note_list=[
+                    Note(
+                        start_pos=i * 480,
+                        length=480,
+                        key_number=60 + i % 12,
+                        lyric=LYRICS[i % len(LYRICS)],
+                    )
+                    for i in range(POINT_COUNT * 5 // 480)
+                ],
+                edited_params=Params(
+                    pitch=ParamCurve(points=Points(root=PointColumns.from_columns(xs, pitch)))
+                ),
+            )
+        ],
+    )
+
+
+def load_vendor_model(plugin_id: str, project: Project, tmp_dir: pathlib.Path) -> BaseModel:
+    plugin = get_svs_plugin_by_value(plugin_id)
+    path = tmp_dir / f"project.{plugin_id}"
+    plugin.dump(path, project, plugin.output_option_cls().model_dump())
+    model_cls, member = VENDOR_MODELS[plugin_id]
+    content = path.read_bytes()
+    if member is not None:
+        content = zipfile.ZipFile(io.BytesIO(content)).read(member)
+    return model_cls.model_validate_json(content.rstrip(b"\x00"))
+
+
+def measure(func: Callable[[], bytes]) -> tuple[float, int, bytes]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    data = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, data
+
+
+def main() -> None:
+    project = make_project()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for plugin_id in VENDOR_MODELS:
+            model = load_vendor_model(plugin_id, project, pathlib.Path(tmp_dir))
+            dict_time, dict_peak, dict_data = measure(
+                lambda model=model: json.dumps(
+                    model.model_dump(mode="json", by_alias=True, exclude_none=True),
+                    ensure_ascii=False,
+                ).encode("utf-8")
+            )
+            direct_time, direct_peak, direct_data = measure(
+                lambda model=model: dump_model_json(model)
+            )
+            print(  # noqa: T201
+                f"{plugin_id}, {len(direct_data) / 2**20:.1f} MiB: "
+                f"model_dump + json.dumps {dict_time:.3f}s, peak {dict_peak / 2**20:.1f} MiB; "
+                f"dump_model_json {direct_time:.3f}s, peak {direct_peak / 2**20:.1f} MiB"
+            )
+            assert json.loads(direct_data) == json.loads(dict_data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import math
+import time
+
+from libresvip.utils.binary.midi import (
+    MIDI_TRACK_CHUNK,
+    MIDIFile,
+    RawMidiFile,
+    encode_pitch_bend,
+    encode_var_int,
+)
+
+EVENT_COUNT = 300_000
+
+
+def make_midi() -> bytes:
+    track = bytearray(b"\x00\xff\x51\x03\x07\xa1\x20")
+    for i in range(EVENT_COUNT):
+        track += encode_var_int(5)
+        if i % 3:
+            # running status pitch wheel
+            track += bytes(encode_pitch_bend(round(4000 * math.sin(i / 50))))
+        else:
+            track += bytes((0xB0, 0x0B, 64 + i % 64))
+            track += encode_var_int(0)
+            track += bytes((0xE0, *encode_pitch_bend(0)))
+    track += b"\x00\xff\x2f\x00"
+    header = b"MThd\x00\x00\x00\x06\x00\x01\x00\x01\x01\xe0"
+    return header + MIDI_TRACK_CHUNK + len(track).to_bytes(4, "big") + bytes(track)
+
+
+def main() -> None:
+    content = make_midi()
+    print(f"{len(content) / 2**20:.1f} MiB")  # noqa: T201
+
+    start = time.perf_counter()
+    reference = MIDIFile.parse(content)
+    print(f"MIDIFile.parse: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    midi_file = RawMidiFile.parse(content)
+    print(f"RawMidiFile.parse: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    for message in reference.tracks[0]:
+        # the construct definition only builds explicit status bytes
+        message._next = message.status
+    start = time.perf_counter()
+    MIDIFile.build(reference)
+    print(f"MIDIFile.build: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    midi_file.build()
+    print(f"RawMidiFile.build: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    assert len(midi_file.tracks[0]) == len(reference.tracks[0])
+
+
+if __name__ == "__main__":
+    main()
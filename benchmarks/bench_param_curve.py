@@ -0,0 +1,46 @@
+import math
+import time
+import tracemalloc
+
+from libresvip.middlewares.pitch_shift.pitch_shift import PitchShiftMiddleware
+from libresvip.model.base import ParamCurve, Params, Project, SingingTrack, TimeSignature
+from libresvip.model.point import Point
+from libresvip.model.reset_time_axis import zoom_project
+
+POINT_COUNT = 1_000_000
+
+
+def make_curve() -> ParamCurve:
+    return ParamCurve(
+        points=[Point.start_point()]
+        + [Point(i * 5, 6000 + round(50 * math.sin(i / 20))) for i in range(POINT_COUNT)]
+        + [Point.end_point()]
+    )
+
+
+def main() -> None:
+    tracemalloc.start()
+    curve = make_curve()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{POINT_COUNT} points: {current / 2**20:.1f} MiB")  # noqa: T201
+
+    start = time.perf_counter()
+    curve.reduce_sample_rate(20, -100)
+    print(f"reduce_sample_rate: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    project = Project(
+        time_signature_list=[TimeSignature()],
+        track_list=[SingingTrack(edited_params=Params(pitch=curve))],
+    )
+    start = time.perf_counter()
+    PitchShiftMiddleware.process(project, {"key": 2})
+    print(f"pitch shift: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    zoom_project(project, 2.0)
+    print(f"zoom: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
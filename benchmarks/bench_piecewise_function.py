@@ -0,0 +1,58 @@
+import time
+
+import portion
+
+from libresvip.core.time_interval import PiecewiseFunction, PiecewiseIntervalDict
+from libresvip.utils.music_math import cosine_easing_in_out_interpolation
+
+NOTE_COUNT = 5_000
+SAMPLE_INTERVAL = 0.005
+
+
+def main() -> None:
+    interval_dict = PiecewiseIntervalDict()
+    function = PiecewiseFunction()
+    start = time.perf_counter()
+    for i in range(NOTE_COUNT):
+        key, next_key = 60 + i % 12, 60 + (i + 1) % 12
+        interval_dict[portion.closedopen(i, i + 0.9)] = key
+        interval_dict[portion.closedopen(i + 0.9, i + 1)] = (
+            lambda x, i=i, key=key, next_key=next_key: cosine_easing_in_out_interpolation(
+                x, (i + 0.9, key), (i + 1, next_key)
+            )
+        )
+    print(f"PiecewiseIntervalDict build: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    for i in range(NOTE_COUNT):
+        key, next_key = 60 + i % 12, 60 + (i + 1) % 12
+        function.set_constant(i, i + 0.9, key)
+        function.set_portamento(
+            (i + 0.9, key), (i + 1, next_key), cosine_easing_in_out_interpolation
+        )
+    print(f"PiecewiseFunction build: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    secs_list = [i * SAMPLE_INTERVAL for i in range(int(NOTE_COUNT / SAMPLE_INTERVAL))]
+
+    start = time.perf_counter()
+    expected = [interval_dict.get(secs) for secs in secs_list]
+    print(f"PiecewiseIntervalDict get: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    values = [function.get(secs) for secs in secs_list]
+    print(f"PiecewiseFunction get: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    batch_values = function.get_many(secs_list)
+    print(f"PiecewiseFunction get_many: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    function.evaluate(secs_list)
+    print(f"PiecewiseFunction evaluate: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    assert values == expected
+    assert batch_values == expected
+
+
+if __name__ == "__main__":
+    main()
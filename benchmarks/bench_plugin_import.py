@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+from libresvip.extension.manager import plugin_manager
+
+# shared by every plugin, so imported before the clock starts
+IMPORT_SCRIPT = """
+import importlib
+import time
+
+import libresvip.extension.base
+import libresvip.model.base
+
+start = time.perf_counter()
+for module in sys.argv[1:]:
+    importlib.import_module(module)
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(*modules: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{IMPORT_SCRIPT}", *modules],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return float(output.splitlines()[-1])
+
+
+def main() -> None:
+    modules = {
+        identifier: entry.module
+        for identifier, entry in sorted(plugin_manager.entries.get("svs", {}).items())
+    }
+    for identifier, module in modules.items():
+        print(f"{identifier}: {import_time(module) * 1000:.1f}ms")  # noqa: T201
+    print(f"all plugins: {import_time(*modules.values()) * 1000:.1f}ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import math
+import time
+
+from libresvip.model.base import (
+    Note,
+    ParamCurve,
+    Params,
+    Points,
+    Project,
+    SingingTrack,
+    SongTempo,
+    TimeSignature,
+)
+from libresvip.model.point import PointColumns
+
+POINT_COUNT = 500_000
+
+
+def make_project() -> Project:
+    xs = list(range(0, POINT_COUNT * 5, 5))
+    pitch = [6000 + round(300 * math.sin(x / 400)) for x in xs]
+    volume = [round(100 * math.cos(x / 900)) for x in xs[::10]]
+    return Project(
+        song_tempo_list=[SongTempo(position=0, bpm=120)],
+        time_signature_list=[TimeSignature()],
+        track_list=[
+            SingingTrack(
+                title="track",
+                note_list=[
+                    Note(start_pos=i * 480, length=480, key_number=60 + i % 12, lyric="la")
+                    for i in range(POINT_COUNT * 5 // 480)
+                ],
+                edited_params=Params(
+                    pitch=ParamCurve(points=Points(root=PointColumns.from_columns(xs, pitch))),
+                    volume=ParamCurve(
+                        points=Points(root=PointColumns.from_columns(xs[::10], volume))
+                    ),
+                ),
+            )
+        ],
+    )
+
+
+def main() -> None:
+    project = make_project()
+
+    start = time.perf_counter()
+    json_data = project.model_dump_json()
+    dump_time = time.perf_counter() - start
+    start = time.perf_counter()
+    json_project = Project.model_validate_json(json_data)
+    load_time = time.perf_counter() - start
+    print(  # noqa: T201
+        f"json: {len(json_data) / 2**20:.1f} MiB, dump {dump_time:.3f}s, load {load_time:.3f}s"
+    )
+
+    start = time.perf_counter()
+    binary_data = project.to_bytes()
+    dump_time = time.perf_counter() - start
+    start = time.perf_counter()
+    binary_project = Project.from_bytes(binary_data)
+    load_time = time.perf_counter() - start
+    print(  # noqa: T201
+        f"binary: {len(binary_data) / 2**20:.1f} MiB, dump {dump_time:.3f}s, load {load_time:.3f}s"
+    )
+
+    assert binary_project == json_project == project
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import math
+import time
+
+from libresvip.model.point import Point
+from libresvip.plugins.ust import rdp_simplification
+from libresvip.plugins.ust.constants import MODE2_PITCH_MAX_POINT_COUNT
+from libresvip.plugins.ust.rdp_simplification import simplify_shape_to
+
+POINT_COUNTS = (1_000, 10_000, 50_000)
+
+
+def make_curve(point_count: int) -> list[Point]:
+    return [
+        Point(x * 5, round(300 * math.sin(x / 40) + 40 * math.sin(x / 3)))
+        for x in range(point_count)
+    ]
+
+
+def main() -> None:
+    numpy = rdp_simplification.np
+    for point_count in POINT_COUNTS:
+        point_list = make_curve(point_count)
+        results = []
+        for label, module in (("numpy", numpy), ("pure", None)):
+            if label == "numpy" and module is None:
+                continue
+            rdp_simplification.np = module
+            start = time.perf_counter()
+            results.append(simplify_shape_to(point_list, MODE2_PITCH_MAX_POINT_COUNT))
+            print(  # noqa: T201
+                f"{point_count} points, {label}: {time.perf_counter() - start:.3f}s"
+            )
+        rdp_simplification.np = numpy
+        assert all(len(result) < MODE2_PITCH_MAX_POINT_COUNT for result in results)
+
+
+if __name__ == "__main__":
+    main()
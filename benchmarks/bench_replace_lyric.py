@@ -0,0 +1,40 @@
+import functools
+import time
+
+from libresvip.core.config import LyricsReplacement, LyricsReplaceMode
+from libresvip.middlewares.replace_lyric.replace_lyric import get_replacement_plan, replace_lyric
+
+RULE_COUNT = 300
+NOTE_COUNT = 20_000
+
+
+def make_rules() -> list[LyricsReplacement]:
+    rules = [
+        LyricsReplacement(replacement=f"r{i}", pattern_main=f"syl{i}") for i in range(RULE_COUNT)
+    ]
+    rules.append(
+        LyricsReplacement(replacement="", pattern_main=r"\s+", mode=LyricsReplaceMode.REGEX)
+    )
+    return rules
+
+
+def main() -> None:
+    rules = make_rules()
+    lyrics = [f"syl{i % 500}" for i in range(NOTE_COUNT)]
+
+    start = time.perf_counter()
+    expected = [
+        functools.reduce(lambda text, rule: replace_lyric(text, rule), rules, lyric)
+        for lyric in lyrics
+    ]
+    print(f"rule by rule: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    plan = get_replacement_plan(rules)
+    result = [plan.replace(lyric) for lyric in lyrics]
+    print(f"compiled plan: {time.perf_counter() - start:.3f}s")  # noqa: T201
+    assert result == expected
+
+
+if __name__ == "__main__":
+    main()
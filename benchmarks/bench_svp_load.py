@@ -0,0 +1,76 @@
+import math
+import pathlib
+import tempfile
+import time
+
+from libresvip.model.base import (
+    Note,
+    ParamCurve,
+    Params,
+    Project,
+    SingingTrack,
+    SongTempo,
+    TimeSignature,
+)
+from libresvip.model.point import Point
+from libresvip.plugins.svp.synthv_studio_converter import SynthVStudioConverter
+
+NOTE_COUNTS = (200, 2_000)
+NOTE_LENGTH = 240
+ROUNDS = 3
+
+
+def make_project(note_count: int) -> Project:
+    notes = [
+        Note(
+            start_pos=i * NOTE_LENGTH,
+            length=NOTE_LENGTH,
+            key_number=60 + i % 12,
+            lyric="la",
+        )
+        for i in range(note_count)
+    ]
+    end_tick = note_count * NOTE_LENGTH
+    pitch_points = [Point.start_point()]
+    pitch_points.extend(
+        Point(tick, 6000 + (tick // NOTE_LENGTH) % 12 * 100 + round(30 * math.sin(tick / 40)))
+        for tick in range(0, end_tick, 5)
+    )
+    pitch_points.append(Point.end_point())
+    volume_points = [Point.start_point(0)]
+    volume_points.extend(
+        Point(tick, round(500 * math.sin(tick / 200))) for tick in range(0, end_tick, 15)
+    )
+    volume_points.append(Point.end_point(0))
+    return Project(
+        song_tempo_list=[SongTempo(position=0, bpm=120)],
+        time_signature_list=[TimeSignature()],
+        track_list=[
+            SingingTrack(
+                note_list=notes,
+                edited_params=Params(
+                    pitch=ParamCurve(points=pitch_points),
+                    volume=ParamCurve(points=volume_points),
+                ),
+            )
+        ],
+    )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for note_count in NOTE_COUNTS:
+            path = pathlib.Path(tmp_dir) / f"bench_{note_count}.svp"
+            SynthVStudioConverter.dump(path, make_project(note_count), {})
+            timings = []
+            for _ in range(ROUNDS):
+                start = time.perf_counter()
+                SynthVStudioConverter.load(path, {})
+                timings.append(time.perf_counter() - start)
+            print(  # noqa: T201
+                f"svp load, {note_count} notes: first {timings[0]:.3f}s, best {min(timings):.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
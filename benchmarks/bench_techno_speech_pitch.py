@@ -0,0 +1,67 @@
+import math
+import random
+import time
+
+from libresvip.model.base import SongTempo
+from libresvip.model.techno_speech_pitch import (
+    TechnoSpeechParamEvent,
+    TechnoSpeechTrackPitchData,
+    generate_for_techno_speech,
+    pitch_from_techno_speech_track,
+)
+
+EVENT_COUNT = 50_000
+ROUNDS = 3
+
+
+def make_track(event_count: int) -> TechnoSpeechTrackPitchData:
+    rng = random.Random(1)
+    events = []
+    idx = 100
+    for i in range(event_count):
+        gap = rng.randint(10, 200) if rng.random() < 0.01 else 0
+        idx += gap
+        repeat = rng.choice([None, None, None, 2, 3])
+        semitone = rng.randint(48, 80) + math.sin(i / 30)
+        events.append(
+            TechnoSpeechParamEvent(
+                idx if gap or i % 20 == 0 else None,
+                repeat,
+                math.log(440 * 2 ** ((semitone - 69) / 12)),
+            )
+        )
+        idx += repeat or 1
+    amplitude_events = []
+    frequency_events = []
+    for start in range(200, idx, 1000):
+        amplitude_events.append(TechnoSpeechParamEvent(start, 300, 20 * rng.random()))
+        frequency_events.append(TechnoSpeechParamEvent(start, 300, 5 + rng.random()))
+    tempos = [
+        SongTempo(position=0, bpm=120),
+        SongTempo(position=19200, bpm=97.3),
+        SongTempo(position=80000, bpm=143),
+    ]
+    return TechnoSpeechTrackPitchData(events, tempos, 1920, amplitude_events, frequency_events)
+
+
+def main() -> None:
+    data = make_track(EVENT_COUNT)
+    load_times = []
+    dump_times = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        curve = pitch_from_techno_speech_track(data)
+        load_times.append(time.perf_counter() - start)
+        assert curve is not None
+        start = time.perf_counter()
+        generate_for_techno_speech(curve, data.tempos, data.tick_prefix)
+        dump_times.append(time.perf_counter() - start)
+    print(  # noqa: T201
+        f"{EVENT_COUNT} events, {len(curve.points)} points: "
+        f"pitch_from_techno_speech_track {min(load_times):.3f}s, "
+        f"generate_for_techno_speech {min(dump_times):.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
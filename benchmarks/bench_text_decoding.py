@@ -0,0 +1,44 @@
+import time
+
+import charset_normalizer
+
+from libresvip.utils.text import decode_text
+
+NOTE_COUNT = 50_000
+LYRICS = ("あ", "か", "さ", "た", "な", "は", "ま", "や", "ら", "わ", "ん")
+
+
+def make_ustx(note_count: int) -> str:
+    lines = ["name: ベンチマーク", "bpm: 120", "voice_parts:", "- name: トラック", "  notes:"]
+    for i in range(note_count):
+        lines.extend(
+            [
+                f"  - position: {i * 480}",
+                "    duration: 480",
+                f"    tone: {60 + i % 12}",
+                f"    lyric: {LYRICS[i % len(LYRICS)]}",
+            ]
+        )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    text = make_ustx(NOTE_COUNT)
+    for encoding in ("utf-8", "shift_jis"):
+        content = text.encode(encoding)
+        start = time.perf_counter()
+        detected = charset_normalizer.detect(content)["encoding"]
+        detect_time = time.perf_counter() - start
+        start = time.perf_counter()
+        decoded = decode_text(content)
+        decode_time = time.perf_counter() - start
+        print(  # noqa: T201
+            f"{encoding}, {len(content) / 2**20:.1f} MiB: "
+            f"full detection {detect_time:.3f}s ({detected}), "
+            f"decode_text {decode_time:.3f}s ({decoded.encoding})"
+        )
+        assert decoded.text == text
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import random
+import time
+
+from libresvip.model.base import (
+    ParamCurve,
+    Params,
+    Points,
+    Project,
+    SingingTrack,
+    SongTempo,
+    TimeSignature,
+)
+from libresvip.model.point import Point
+from libresvip.model.reset_time_axis import reset_time_axis
+
+TEMPO_COUNT = 2_000
+PITCH_POINT_COUNT = 500_000
+
+
+def make_project() -> Project:
+    rng = random.Random(0)
+    tempo_list = [SongTempo(position=i * 480, bpm=rng.uniform(60, 240)) for i in range(TEMPO_COUNT)]
+    step = TEMPO_COUNT * 480 // PITCH_POINT_COUNT or 1
+    pitch = ParamCurve(
+        points=Points(
+            root=[Point(1920 + i * step, rng.randint(5000, 7000)) for i in range(PITCH_POINT_COUNT)]
+        )
+    )
+    return Project(
+        song_tempo_list=tempo_list,
+        time_signature_list=[TimeSignature(bar_index=0, numerator=4, denominator=4)],
+        track_list=[SingingTrack(edited_params=Params(pitch=pitch))],
+    )
+
+
+def main() -> None:
+    project = make_project()
+    start = time.perf_counter()
+    reset_time_axis(project)
+    elapsed = time.perf_counter() - start
+    print(  # noqa: T201
+        f"reset_time_axis: {TEMPO_COUNT} tempo changes, "
+        f"{PITCH_POINT_COUNT} pitch points: {elapsed:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
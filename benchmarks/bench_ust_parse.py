@@ -0,0 +1,60 @@
+import pathlib
+import tempfile
+import time
+
+from libresvip.plugins.ust.ust_converter import USTConverter
+
+NOTE_COUNTS = (100, 1_000, 10_000)
+ROUNDS = 3
+
+
+def make_ust(note_count: int) -> str:
+    lines = [
+        "[#VERSION]",
+        "UST Version1.2",
+        "[#SETTING]",
+        "Tempo=120.00",
+        "Tracks=1",
+        "ProjectName=bench",
+        "Mode2=True",
+    ]
+    for i in range(note_count):
+        lines.extend(
+            [
+                f"[#{i:04d}]",
+                "Length=480",
+                "Lyric=a" if i % 8 else "Lyric=R",
+                f"NoteNum={60 + i % 12}",
+                "PreUtterance=",
+                "Intensity=100",
+                "Modulation=0",
+                "PBS=-40;0",
+                "PBW=80,120",
+                "PBY=0,",
+                "PBM=,",
+            ]
+        )
+    lines.append("[#TRACKEND]")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for note_count in NOTE_COUNTS:
+            path = pathlib.Path(tmp_dir) / f"bench_{note_count}.ust"
+            path.write_text(make_ust(note_count), encoding="utf-8")
+            for fast_parse in (False, True):
+                timings = []
+                for _ in range(ROUNDS):
+                    start = time.perf_counter()
+                    USTConverter.load(path, {"encoding": "utf-8", "fast_parse": fast_parse})
+                    timings.append(time.perf_counter() - start)
+                parser_name = "reader" if fast_parse else "grammar"
+                print(  # noqa: T201
+                    f"ust load ({parser_name}), {note_count} notes: "
+                    f"first {timings[0]:.3f}s, best {min(timings):.3f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
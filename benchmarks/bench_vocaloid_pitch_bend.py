@@ -0,0 +1,54 @@
+import math
+import time
+
+from libresvip.model.vocaloid.controller_models import ControllerCurve, ControllerEvent
+from libresvip.model.vocaloid.pitch_handler import VocaloidPitchHandler
+from libresvip.utils.binary.midi import DEFAULT_PITCH_BEND_SENSITIVITY
+
+EVENT_COUNT = 200_000
+
+
+def main() -> None:
+    pit = ControllerCurve(
+        name="pitch_bend",
+        events=[
+            ControllerEvent(pos=i * 5, value=round(4000 * math.sin(i / 50)))
+            for i in range(EVENT_COUNT)
+        ],
+        min_value=-8192,
+        max_value=8191,
+    )
+    pbs = ControllerCurve(
+        name="pitch_bend_sens",
+        events=[
+            ControllerEvent(pos=i * 4800 + 3, value=2 + i % 12) for i in range(EVENT_COUNT // 960)
+        ],
+        default_value=DEFAULT_PITCH_BEND_SENSITIVITY,
+        min_value=1,
+        max_value=24,
+    )
+    handler = VocaloidPitchHandler(
+        synchronizer=None,  # type: ignore[arg-type]
+        note_list=[],
+        time_signature_list=[],
+        first_bar_length=0,
+    )
+
+    start = time.perf_counter()
+    points = handler.combine_pit_pbs(pit, pbs)
+    print(f"combine_pit_pbs: {time.perf_counter() - start:.3f}s, {len(points)} points")  # noqa: T201
+
+    start = time.perf_counter()
+    for pos in range(0, EVENT_COUNT * 5, 5):
+        pit.get_value_at(pos)
+    print(f"get_value_at x {EVENT_COUNT}: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+    start = time.perf_counter()
+    for part_start in range(0, EVENT_COUNT * 5, 19200):
+        pit.get_value_range(part_start, part_start + 19200)
+        pit.to_points(part_start, part_start + 19200)
+    print(f"get_value_range + to_points: {time.perf_counter() - start:.3f}s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
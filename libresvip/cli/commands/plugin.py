@@ -7,8 +7,8 @@ from rich.console import Console
 from rich.table import Table
 
 from libresvip.core.config import save_settings, settings
-from libresvip.extension.base import SVSConverter
 from libresvip.extension.manager import plugin_manager
+from libresvip.extension.plugin_index import PluginIndexEntry
 from libresvip.model.base import BaseComplexModel
 from libresvip.utils.translation import gettext_lazy as _
 
@@ -17,7 +17,7 @@ app = typer.Typer()
 
 @app.command()
 def toggle(identifier: str) -> None:
-    if identifier in plugin_manager.plugins.get("svs", {}):
+    if identifier in plugin_manager.available_entries("svs"):
         settings.disabled_plugins.append(identifier)
         save_settings()
         typer.secho(_("The plugin is successfully disabled."), fg="green")
@@ -31,19 +31,19 @@ def toggle(identifier: str) -> None:
 
 @app.command("list")
 def list_plugins() -> None:
-    print_plugin_summary(plugin_manager.plugins.get("svs", {}).values())
+    print_plugin_summary(plugin_manager.available_entries("svs").values())
 
 
 @app.command()
 def detail(plugin_name: str) -> None:
-    if plugin_name in plugin_manager.plugins.get("svs", {}):
-        print_plugin_details(plugin_manager.plugins.get("svs", {})[plugin_name])
+    if (entry := plugin_manager.available_entries("svs").get(plugin_name)) is not None:
+        print_plugin_details(entry)
     else:
         typer.echo(_("Cannot find plugin ") + f"{plugin_name}!", err=True)
 
 
 def print_plugin_summary(
-    plugins: ValuesView[SVSConverter],
+    plugins: ValuesView[PluginIndexEntry],
 ) -> None:
     console = Console(color_system="256")
     if not plugins:
@@ -72,7 +72,7 @@ def print_plugin_summary(
     console.print(table)
 
 
-def print_plugin_details(plugin: SVSConverter) -> None:
+def print_plugin_details(plugin: PluginIndexEntry) -> None:
     if plugin.info is None:
         return
     typer.echo()
@@ -98,8 +98,8 @@ def print_plugin_details(plugin: SVSConverter) -> None:
         typer.echo(f"\n{_('Description: ')}\n{_(plugin.info.description)}")
     op_arr = [_("input"), _("output")]
     options_arr = [
-        plugin.input_option_cls,
-        plugin.output_option_cls,
+        plugin.load_option_cls("input_option_cls"),
+        plugin.load_option_cls("output_option_cls"),
     ]
     for op, options in zip(op_arr, options_arr):
         if options is None:
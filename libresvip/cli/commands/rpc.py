@@ -1,9 +1,11 @@
 import asyncio
 import sys
+from typing import Annotated
 
 import typer
 
 from libresvip.cli.rpc.server import run_grpc_server
+from libresvip.utils.translation import gettext_lazy as _
 
 app = typer.Typer()
 
@@ -12,10 +14,25 @@ app = typer.Typer()
 def server(
     host: str = "127.0.0.1",
     port: int = 15150,
+    workers: Annotated[
+        int, typer.Option(help=_("Number of conversion worker processes (0 to use threads)"))
+    ] = 0,
+    max_request_concurrency: Annotated[
+        int | None,
+        typer.Option(help=_("Maximum number of groups converted at once for a single request")),
+    ] = None,
 ) -> None:
     run_kwargs = {}
     if sys.platform == "win32":
         import winloop
 
         run_kwargs["loop_factory"] = winloop.new_event_loop
-    asyncio.run(run_grpc_server(host=host, port=port), **run_kwargs)
+    asyncio.run(
+        run_grpc_server(
+            host=host,
+            port=port,
+            workers=workers,
+            max_request_concurrency=max_request_concurrency,
+        ),
+        **run_kwargs,
+    )
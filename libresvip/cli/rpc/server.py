@@ -1,6 +1,9 @@
 import asyncio
+import concurrent.futures
+import contextlib
+import functools
+import multiprocessing
 import os
-import traceback
 from typing import get_args, get_type_hints
 
 import rich
@@ -11,29 +14,27 @@ from pydantic._internal._core_utils import CoreSchemaOrField
 from pydantic.json_schema import GenerateJsonSchema, JsonSchemaValue
 from pydantic_core import core_schema
 from typing_extensions import override
-from upath import UPath
 
 from libresvip.core.compat import json
+from libresvip.core.config import ConversionMode as UIConversionMode
 from libresvip.core.config import LibreSVIPSettingsContainer, settings
-from libresvip.core.warning_types import CatchWarnings
 from libresvip.extension.base import (
     OptionsDict,
     ReadOnlyConverterMixin,
-    SVSConverter,
     WriteOnlyConverterMixin,
 )
+from libresvip.extension.conversion import init_conversion_worker, run_conversion
 from libresvip.extension.manager import (
-    get_svs_plugin_by_suffix,
+    get_svs_plugin_by_value,
     get_translation,
     middleware_manager,
     plugin_manager,
+    start_model_warmup,
 )
-from libresvip.model.base import Project
 from libresvip.utils.translation import gettext_lazy as _
 from libresvip.utils.translation import lazy_translation
 
 from .libresvip_pb import (
-    ConversionGroup,
     ConversionMode,
     ConversionRequest,
     ConversionResponse,
@@ -86,103 +87,86 @@ def model_json_schema(option_cls: BaseModel) -> JsonSchemaValue:
     return json_schema
 
 
+def _middleware_options(middleware_options: dict[str, str]) -> dict[str, OptionsDict]:
+    middlewares = middleware_manager.plugins.get("middleware", {})
+    options = {}
+    for middleware_id, middleware_option_str in middleware_options.items():
+        if middleware := middlewares.get(middleware_id):
+            try:
+                process_options = middleware.process_option_cls.model_validate_json(
+                    middleware_option_str
+                )
+            except ValidationError:
+                process_options = middleware.process_option_cls()
+            options[middleware_id] = process_options.model_dump()
+    return options
+
+
 def convert_one_group(
-    fs: UPath,
     mode: ConversionMode,
     max_track_count: int,
-    group: ConversionGroup,
-    input_plugin: SVSConverter,
-    output_plugin: SVSConverter,
+    group_id: str,
+    file_contents: list[bytes],
+    input_format: str,
+    output_format: str,
     input_options: OptionsDict,
     output_options: OptionsDict,
     middleware_options: dict[str, str],
 ) -> tuple[str, SingleConversionResult]:
-    result = SingleConversionResult()
-    group_path = fs / group.group_id
-    group_path.mkdir()
-    project = None
-    if mode == ConversionMode.MERGE:
-        child_projects = []
-        for i, content in enumerate(group.file_contents):
-            child_path = group_path / str(i)
-            child_path.write_bytes(content)
-            try:
-                with CatchWarnings() as w:
-                    child_projects.append(input_plugin.load(child_path, input_options))
-                if w.output:
-                    result.warning_messages.append(w.output)
-            except Exception:
-                result.success = False
-                result.error_message = traceback.format_exc()
-                project = None
-                break
-        else:
-            project = Project.merge_projects(child_projects)
-    else:
-        child_path = group_path / "0"
-        child_path.write_bytes(group.file_contents[0])
-        try:
-            with CatchWarnings() as w:
-                project = input_plugin.load(child_path, input_options)
-            if w.output:
-                result.warning_messages.append(w.output)
-        except Exception:
-            result.success = False
-            result.error_message = traceback.format_exc()
-    group_path.rmdir()
-    if project is not None:
-        middlewares = middleware_manager.plugins.get("middleware", {})
-        for middleware_id, middleware_option_str in middleware_options.items():
-            if middleware := middlewares.get(middleware_id):
-                try:
-                    process_options = middleware.process_option_cls.model_validate_json(
-                        middleware_option_str
-                    )
-                except ValidationError:
-                    process_options = middleware.process_option_cls()
-                try:
-                    with CatchWarnings() as w:
-                        project = middleware.process(project, process_options.model_dump())
-                    if w.output:
-                        result.warning_messages.append(w.output)
-                except Exception:
-                    result.success = False
-                    result.error_message = traceback.format_exc()
-                    project = None
-                    break
-    if project is not None:
-        group_path.mkdir()
-        if mode == ConversionMode.SPLIT:
-            for i, sub_proj in enumerate(project.split_tracks(max_track_count)):
-                child_path = group_path / str(i)
-                try:
-                    with CatchWarnings() as w:
-                        output_plugin.dump(child_path, sub_proj, output_options)
-                    if w.output:
-                        result.warning_messages.append(w.output)
-                    result.file_contents.append(child_path.read_bytes())
-                except Exception:
-                    result.success = False
-                    result.error_message = traceback.format_exc()
-                    break
-            else:
-                result.success = True
-        else:
-            child_path = group_path / "0"
-            try:
-                output_plugin.dump(child_path, project, output_options)
-                result.file_contents.append(child_path.read_bytes())
-                result.success = True
-            except Exception:
-                result.success = False
-                result.error_message = traceback.format_exc()
-        group_path.rmdir()
-    return group.group_id, result
+    output = run_conversion(
+        file_contents,
+        mode=UIConversionMode[mode.name],
+        input_format=input_format,
+        output_format=output_format,
+        input_options=input_options,
+        output_options=output_options,
+        middleware_options=_middleware_options(middleware_options),
+        max_track_count=max_track_count,
+    )
+    return group_id, SingleConversionResult(
+        success=output.success,
+        file_contents=output.file_contents,
+        error_message=output.error or "",
+        warning_messages=[output.warning] if output.warning else [],
+    )
+
+
+def _ping_conversion_worker() -> int:
+    return os.getpid()
+
+
+def create_conversion_pool(workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_conversion_worker,
+    )
 
 
 class Conversion(ConversionBase):
-    def __init__(self) -> None:
-        self._fs = UPath("memory://")
+    def __init__(
+        self,
+        executor: concurrent.futures.Executor | None = None,
+        *,
+        max_concurrency: int | None = None,
+        max_request_concurrency: int | None = None,
+    ) -> None:
+        self._executor = executor
+        capacity = max_concurrency or os.cpu_count() or 1
+        # groups waiting for a slot are served in FIFO order, so capping the
+        # groups each request may queue keeps one big batch from starving others
+        self._slots = asyncio.Semaphore(capacity)
+        self._max_request_concurrency = max_request_concurrency or capacity
+
+    async def _run_group(
+        self, request_slots: asyncio.Semaphore, *args: object
+    ) -> tuple[str, SingleConversionResult]:
+        async with request_slots, self._slots:
+            if self._executor is None:
+                return await asyncio.to_thread(convert_one_group, *args)
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, functools.partial(convert_one_group, *args)
+            )
 
     async def plugin_infos(self, plugin_infos_request: PluginInfosRequest) -> PluginInfosResponse:
         lazy_translation.set(get_translation(plugin_infos_request.language))
@@ -249,15 +233,8 @@ class Conversion(ConversionBase):
     async def convert(self, conversion_request: ConversionRequest) -> ConversionResponse:
         group_id2results = {}
         futures = []
-        svs_plugins = plugin_manager.plugins.get("svs", {})
-        input_plugin = svs_plugins.get(
-            conversion_request.input_format,
-            get_svs_plugin_by_suffix(conversion_request.input_format),
-        )
-        output_plugin = svs_plugins.get(
-            conversion_request.output_format,
-            get_svs_plugin_by_suffix(conversion_request.output_format),
-        )
+        input_plugin = get_svs_plugin_by_value(conversion_request.input_format)
+        output_plugin = get_svs_plugin_by_value(conversion_request.output_format)
         try:
             input_options = input_plugin.input_option_cls.model_validate_json(
                 conversion_request.input_options
@@ -270,18 +247,19 @@ class Conversion(ConversionBase):
             )
         except ValidationError:
             output_options = output_plugin.output_option_cls()
+        request_slots = asyncio.Semaphore(self._max_request_concurrency)
         for group in conversion_request.groups:
-            coro = asyncio.to_thread(
-                convert_one_group,
-                self._fs,
+            coro = self._run_group(
+                request_slots,
                 conversion_request.mode,
                 conversion_request.max_track_count,
-                group,
-                input_plugin,
-                output_plugin,
+                group.group_id,
+                list(group.file_contents),
+                conversion_request.input_format,
+                conversion_request.output_format,
                 input_options.model_dump(),
                 output_options.model_dump(),
-                conversion_request.middleware_options,
+                dict(conversion_request.middleware_options),
             )
             futures.append(asyncio.create_task(coro))
         for future in asyncio.as_completed(futures):
@@ -300,11 +278,33 @@ def _warmup_json_schemas() -> None:
         model_json_schema(middleware.process_option_cls)
 
 
-async def run_grpc_server(*, host: str = "127.0.0.1", port: int = 15150) -> None:
+async def run_grpc_server(
+    *,
+    host: str = "127.0.0.1",
+    port: int = 15150,
+    workers: int = 0,
+    max_request_concurrency: int | None = None,
+) -> None:
     os.environ["LIBRESVIP_SETTINGS_BACKEND"] = "remote"
     _warmup_json_schemas()
-    grpc_server = Server([Conversion()], codec=ProtobufPyCodec())
-    with LibreSVIPSettingsContainer.state.init(settings), graceful_exit([grpc_server]):
+    with contextlib.ExitStack() as stack:
+        executor = None
+        if workers > 0:
+            executor = stack.enter_context(create_conversion_pool(workers))
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(loop.run_in_executor(executor, _ping_conversion_worker) for _ in range(workers))
+            )
+        conversion = Conversion(
+            executor,
+            max_concurrency=workers or None,
+            max_request_concurrency=max_request_concurrency,
+        )
+        grpc_server = Server([conversion], codec=ProtobufPyCodec())
+        stack.enter_context(LibreSVIPSettingsContainer.state.init(settings))
+        if executor is None:
+            start_model_warmup()
+        stack.enter_context(graceful_exit([grpc_server]))
         await grpc_server.start(host, port)
         rich.print(f"Serving on {host}:{port}")
         await grpc_server.wait_closed()
@@ -290,26 +290,19 @@ class LyricsReplacement(BaseModel):
     flags: Annotated[re.RegexFlag, pydantic_enum(re.RegexFlag)] = re.IGNORECASE
     mode: Annotated[LyricsReplaceMode, pydantic_enum(LyricsReplaceMode)] = LyricsReplaceMode.FULL
 
-    def __post_init__(self) -> None:
-        if self.mode.value in LYRIC_REPLACE_MODE_PREFIX_SUFFIX:
-            self.pattern_prefix, self.pattern_suffix = LYRIC_REPLACE_MODE_PREFIX_SUFFIX[
-                self.mode.value
-            ]
-        if self.mode != LyricsReplaceMode.REGEX:
-            self.pattern_main = re.escape(self.pattern_main)
-        else:
-            try:
-                self.compiled_pattern
-            except re.error as e:
-                msg = f"Invalid pattern: {self._pattern}"
-                raise ValueError(msg) from e
-
     @property
     def compiled_pattern(self) -> re.Pattern[str]:
-        return re.compile(self._pattern, self.flags)
+        try:
+            return re.compile(self._pattern, self.flags)
+        except re.error as e:
+            msg = f"Invalid pattern: {self._pattern}"
+            raise ValueError(msg) from e
 
     @property
     def _pattern(self) -> str:
+        if self.mode.value in LYRIC_REPLACE_MODE_PREFIX_SUFFIX:
+            prefix, suffix = LYRIC_REPLACE_MODE_PREFIX_SUFFIX[self.mode.value]
+            return f"{prefix}{re.escape(self.pattern_main)}{suffix}"
         return f"{self.pattern_prefix}{self.pattern_main}{self.pattern_suffix}"
 
     def replace(self, text: str) -> str:
@@ -378,6 +371,9 @@ class LibreSvipBaseUISettings(YamlSettings):
     auto_detect_input_format: bool = Field(default=True)
     reset_tasks_on_input_change: bool = Field(default=True)
     max_track_count: int = Field(default=1)
+    project_cache_size: int = Field(default=0, ge=0)
+    project_cache_on_disk: bool = Field(default=False)
+    warm_up_models: bool = Field(default=True)
     lyric_replace_rules: dict[str, list[LyricsReplacement]] = Field(default_factory=dict)
 
     @field_validator("language", mode="before")
@@ -437,6 +433,7 @@ class LibreSvipSettings(LibreSvipBaseUISettings):
         default=ConflictPolicy.PROMPT
     )
     multi_threaded_conversion: bool = Field(default=True)
+    conversion_workers: int = Field(default=0, ge=0)
     open_save_folder_on_completion: bool = Field(default=True)
     auto_set_output_extension: bool = Field(default=True)
     auto_check_for_updates: bool = Field(default=True)
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+import bisect
 import dataclasses
+import enum
+import itertools
+import math
 import operator
 from functools import reduce, singledispatchmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import portion
 
+from libresvip.utils.music_math import linear_interpolation
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping
+    from collections.abc import Callable, Iterable, Mapping, Sequence
 
     UnaryFunction = Callable[[int | float], float]
     UnaryFunctionOrConstant = UnaryFunction | int | float
+    InterpolationFunction = Callable[[float, tuple[float, float], tuple[float, float]], float]
+    Bounds = tuple[float, float, bool, bool]
 
 
 class PiecewiseIntervalDict(portion.IntervalDict):
@@ -59,6 +72,339 @@ class PiecewiseIntervalDict(portion.IntervalDict):
         raise KeyError(key)
 
 
+def _overlaps(first: Bounds, second: Bounds) -> bool:
+    lower, lower_open = max((first[0], not first[2]), (second[0], not second[2]))
+    upper, upper_closed = min((first[1], first[3]), (second[1], second[3]))
+    return lower < upper or (lower == upper and not lower_open and upper_closed)
+
+
+def _difference(bounds: Bounds, cut: Bounds) -> list[Bounds]:
+    lower, upper, lower_closed, upper_closed = bounds
+    cut_lower, cut_upper, cut_lower_closed, cut_upper_closed = cut
+    if not _overlaps(bounds, cut):
+        return [bounds]
+    parts = []
+    if lower < cut_lower or (lower == cut_lower and lower_closed and not cut_lower_closed):
+        parts.append((lower, cut_lower, lower_closed, not cut_lower_closed))
+    if cut_upper < upper or (cut_upper == upper and upper_closed and not cut_upper_closed):
+        parts.append((cut_upper, upper, not cut_upper_closed, upper_closed))
+    return parts
+
+
+class SegmentKind(enum.IntEnum):
+    CONSTANT = 0
+    LINEAR = 1
+    PORTAMENTO = 2
+    VIBRATO = 3
+    FUNCTION = 4
+
+
+class PiecewiseFunction:
+    """
+    Piecewise function over disjoint intervals kept in parallel sorted lists.
+
+    Where assigned intervals overlap, the one starting first wins, matching the
+    lookup order of :class:`PiecewiseIntervalDict`, but point queries are a
+    bisection and sorted batch queries a single merge walk. ``__setitem__`` treats
+    each part of a multi-part key as its own segment, so it matches a dict that was
+    given the parts one by one, not one that stores the whole union as a single key.
+    """
+
+    def __init__(self) -> None:
+        self._lowers: list[float] = []
+        self._uppers: list[float] = []
+        self._lower_closed: list[bool] = []
+        self._upper_closed: list[bool] = []
+        self._kinds: list[SegmentKind] = []
+        self._params: list[tuple[Any, ...]] = []
+        self._origins: list[tuple[float, bool, Bounds]] = []
+        self._arrays: dict[str, Any] | None = None
+
+    def __len__(self) -> int:
+        return len(self._lowers)
+
+    def set_constant(
+        self,
+        lower: float,
+        upper: float,
+        value: float,
+        *,
+        lower_closed: bool = True,
+        upper_closed: bool = False,
+    ) -> None:
+        self._insert(lower, upper, lower_closed, upper_closed, SegmentKind.CONSTANT, (value,))
+
+    def set_linear(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        *,
+        lower_closed: bool = True,
+        upper_closed: bool = False,
+    ) -> None:
+        self._insert(
+            start[0], end[0], lower_closed, upper_closed, SegmentKind.LINEAR, (*start, *end)
+        )
+
+    def set_portamento(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        interpolation: InterpolationFunction,
+        *,
+        lower_closed: bool = True,
+        upper_closed: bool = False,
+    ) -> None:
+        if interpolation is linear_interpolation:
+            self.set_linear(start, end, lower_closed=lower_closed, upper_closed=upper_closed)
+            return
+        self._insert(
+            start[0],
+            end[0],
+            lower_closed,
+            upper_closed,
+            SegmentKind.PORTAMENTO,
+            (*start, *end, interpolation),
+        )
+
+    def set_vibrato(
+        self,
+        lower: float,
+        upper: float,
+        *,
+        origin: float,
+        frequency: float,
+        phase: float,
+        amplitude: float,
+        lower_closed: bool = True,
+        upper_closed: bool = True,
+    ) -> None:
+        """``sin(pi * (2 * (x - origin) * frequency - phase)) * amplitude`` on the interval."""
+        self._insert(
+            lower,
+            upper,
+            lower_closed,
+            upper_closed,
+            SegmentKind.VIBRATO,
+            (origin, frequency, phase, amplitude),
+        )
+
+    def set_function(
+        self,
+        lower: float,
+        upper: float,
+        func: UnaryFunction,
+        *,
+        lower_closed: bool = True,
+        upper_closed: bool = False,
+    ) -> None:
+        self._insert(lower, upper, lower_closed, upper_closed, SegmentKind.FUNCTION, (func,))
+
+    def __setitem__(self, key: portion.Interval, value: UnaryFunctionOrConstant) -> None:
+        for atomic in key:
+            lower = -math.inf if atomic.lower == -portion.inf else atomic.lower
+            upper = math.inf if atomic.upper == portion.inf else atomic.upper
+            lower_closed = atomic.left == portion.CLOSED
+            upper_closed = atomic.right == portion.CLOSED
+            if callable(value):
+                self.set_function(
+                    lower, upper, value, lower_closed=lower_closed, upper_closed=upper_closed
+                )
+            else:
+                self.set_constant(
+                    lower, upper, value, lower_closed=lower_closed, upper_closed=upper_closed
+                )
+
+    def _insert(
+        self,
+        lower: float,
+        upper: float,
+        lower_closed: bool,
+        upper_closed: bool,
+        kind: SegmentKind,
+        params: tuple[Any, ...],
+    ) -> None:
+        if lower > upper or (lower == upper and not (lower_closed and upper_closed)):
+            return
+        self._arrays = None
+        bounds = (lower, upper, lower_closed, upper_closed)
+        origin = (lower, not lower_closed, bounds)
+        if (
+            not self._lowers
+            or lower > self._uppers[-1]
+            or (lower == self._uppers[-1] and not (lower_closed and self._upper_closed[-1]))
+        ):
+            self._splice(len(self._lowers), len(self._lowers), [(*bounds, kind, params, origin)])
+            return
+        start = bisect.bisect_left(self._uppers, lower)
+        stop = bisect.bisect_right(self._lowers, upper)
+        segments = []
+        pieces = [bounds]
+        for i in range(start, stop):
+            segment = self._segment(i)
+            if not _overlaps(segment[:4], bounds):
+                segments.append(segment)
+            elif segment[6][:2] <= origin[:2] and segment[6][2] != bounds:
+                # the segment starting first keeps the overlap, reassigning replaces it
+                segments.append(segment)
+                pieces = [part for piece in pieces for part in _difference(piece, segment[:4])]
+            else:
+                segments.extend((*part, *segment[4:]) for part in _difference(segment[:4], bounds))
+        segments.extend((*piece, kind, params, origin) for piece in pieces)
+        segments.sort(key=lambda segment: (segment[0], not segment[2]))
+        self._splice(start, stop, segments)
+
+    def _segment(self, index: int) -> tuple[Any, ...]:
+        return (
+            self._lowers[index],
+            self._uppers[index],
+            self._lower_closed[index],
+            self._upper_closed[index],
+            self._kinds[index],
+            self._params[index],
+            self._origins[index],
+        )
+
+    def _splice(self, start: int, stop: int, segments: list[tuple[Any, ...]]) -> None:
+        columns = list(zip(*segments)) if segments else [()] * 7
+        (
+            self._lowers[start:stop],
+            self._uppers[start:stop],
+            self._lower_closed[start:stop],
+            self._upper_closed[start:stop],
+            self._kinds[start:stop],
+            self._params[start:stop],
+            self._origins[start:stop],
+        ) = columns
+
+    def _contains(self, index: int, x: float) -> bool:
+        lower, upper = self._lowers[index], self._uppers[index]
+        return (lower < x or (x == lower and self._lower_closed[index])) and (
+            x < upper or (x == upper and self._upper_closed[index])
+        )
+
+    def _find(self, x: float, hint: int | None = None) -> int | None:
+        index = bisect.bisect_right(self._lowers, x) - 1 if hint is None else hint
+        if index >= 0 and self._contains(index, x):
+            return index
+        if index > 0 and self._contains(index - 1, x):
+            return index - 1
+        return None
+
+    def _evaluate(self, index: int, x: float) -> float:
+        kind = self._kinds[index]
+        params = self._params[index]
+        if kind == SegmentKind.CONSTANT:
+            return params[0]
+        elif kind == SegmentKind.LINEAR:
+            x0, y0, x1, y1 = params
+            return y0 + (y1 - y0) * ((x - x0) / (x1 - x0))
+        elif kind == SegmentKind.PORTAMENTO:
+            x0, y0, x1, y1, interpolation = params
+            return interpolation(x, (x0, y0), (x1, y1))
+        elif kind == SegmentKind.VIBRATO:
+            origin, frequency, phase, amplitude = params
+            return math.sin(math.pi * (2 * (x - origin) * frequency - phase)) * amplitude
+        return params[0](x)
+
+    def get(self, x: float, default: Any = None) -> Any:
+        if (index := self._find(x)) is None:
+            return default
+        return self._evaluate(index, x)
+
+    def __getitem__(self, x: float) -> float:
+        if (index := self._find(x)) is None:
+            raise KeyError(x)
+        return self._evaluate(index, x)
+
+    def __contains__(self, x: float) -> bool:
+        return self._find(x) is not None
+
+    def get_many(self, xs: Sequence[float], default: Any = None) -> list[Any]:
+        """Point queries for many positions, a single merge walk when they are ascending."""
+        if any(current < previous for previous, current in itertools.pairwise(xs)):
+            return [self.get(x, default) for x in xs]
+        results = []
+        index = 0
+        count = len(self._lowers)
+        for x in xs:
+            while index < count and self._lowers[index] <= x:
+                index += 1
+            if (found := self._find(x, index - 1)) is None:
+                results.append(default)
+            else:
+                results.append(self._evaluate(found, x))
+        return results
+
+    def evaluate(self, xs: Sequence[float], default: float = math.nan) -> list[float]:
+        """
+        Like :meth:`get_many` but always yields floats.
+
+        Uses NumPy when it is installed; constant, linear and vibrato segments are
+        evaluated as arrays and only the remaining kinds point by point.
+        """
+        if np is None or not self._lowers or not len(xs):
+            return [float(value) for value in self.get_many(xs, default)]
+        arrays = self._get_arrays()
+        points = np.asarray(xs, dtype=np.float64)
+        index = np.searchsorted(arrays["lowers"], points, side="right") - 1
+        found = np.full(len(points), -1, dtype=np.int64)
+        for candidate in (index, index - 1):
+            clipped = np.clip(candidate, 0, len(self._lowers) - 1)
+            inside = (
+                (candidate >= 0)
+                & (found < 0)
+                & (
+                    (arrays["lowers"][clipped] < points)
+                    | ((arrays["lowers"][clipped] == points) & arrays["lower_closed"][clipped])
+                )
+                & (
+                    (points < arrays["uppers"][clipped])
+                    | ((points == arrays["uppers"][clipped]) & arrays["upper_closed"][clipped])
+                )
+            )
+            found[inside] = clipped[inside]
+        results = np.full(len(points), default, dtype=np.float64)
+        kinds = np.where(found >= 0, arrays["kinds"][found], -1)
+        params = arrays["params"][found]
+        mask = kinds == SegmentKind.CONSTANT
+        results[mask] = params[mask, 0]
+        mask = kinds == SegmentKind.LINEAR
+        x0, y0, x1, y1 = params[mask].T
+        results[mask] = y0 + (y1 - y0) * ((points[mask] - x0) / (x1 - x0))
+        mask = kinds == SegmentKind.VIBRATO
+        origin, frequency, phase, amplitude = params[mask].T
+        results[mask] = (
+            np.sin(np.pi * (2 * (points[mask] - origin) * frequency - phase)) * amplitude
+        )
+        for i in np.flatnonzero(
+            (kinds == SegmentKind.PORTAMENTO) | (kinds == SegmentKind.FUNCTION)
+        ).tolist():
+            results[i] = self._evaluate(int(found[i]), float(points[i]))
+        return results.tolist()
+
+    def _get_arrays(self) -> dict[str, Any]:
+        if self._arrays is None:
+            self._arrays = {
+                "lowers": np.asarray(self._lowers, dtype=np.float64),
+                "uppers": np.asarray(self._uppers, dtype=np.float64),
+                "lower_closed": np.asarray(self._lower_closed, dtype=bool),
+                "upper_closed": np.asarray(self._upper_closed, dtype=bool),
+                "kinds": np.asarray(self._kinds, dtype=np.int8),
+                "params": np.asarray(
+                    [
+                        [
+                            float(param) if isinstance(param, int | float) else math.nan
+                            for param in (*params, 0, 0, 0)[:4]
+                        ]
+                        for params in self._params
+                    ],
+                    dtype=np.float64,
+                ),
+            }
+        return self._arrays
+
+
 @dataclasses.dataclass
 class RangeInterval:
     _sub_ranges: dataclasses.InitVar[list[tuple[int, int]] | None] = None
@@ -12,6 +12,7 @@ class TimeSynchronizer:
     tempo_list: list[SongTempo] = field(init=False)
     _positions: list[int] = field(init=False)
     _cum_secs: list[float] = field(init=False)
+    _cum_actual_ticks: list[float] = field(init=False)
     ori_tempo_list: InitVar[list[SongTempo]]
     skip_ticks: InitVar[int] = 0
     _is_absolute_time_code: InitVar[bool] = False
@@ -37,6 +38,12 @@ class TimeSynchronizer:
         for i in range(1, n):
             dt = self._positions[i] - self._positions[i - 1]
             self._cum_secs[i] = self._cum_secs[i - 1] + dt / self.tempo_list[i - 1].bpm / 8
+        self._cum_actual_ticks = [0.0] * n
+        for i in range(1, n):
+            dt = self._positions[i] - self._positions[i - 1]
+            self._cum_actual_ticks[i] = self._cum_actual_ticks[i - 1] + dt * (
+                self.default_tempo / self.tempo_list[i - 1].bpm
+            )
 
     def _secs_at_tick(self, ticks: int) -> float:
         idx = bisect.bisect_right(self._positions, ticks) - 1
@@ -53,16 +60,33 @@ class TimeSynchronizer:
     def get_actual_ticks_from_ticks(self, ticks: int) -> float:
         if not self.is_absolute_time_code:
             return ticks
-        res = 0.0
         idx = bisect.bisect_right(self._positions, ticks) - 1
         if idx < 0:
             idx = 0
-        for i in range(idx):
-            res += (self._positions[i + 1] - self._positions[i]) * (
-                self.default_tempo / self.tempo_list[i].bpm
+        return (
+            self._cum_actual_ticks[idx]
+            + (ticks - self._positions[idx]) * self.default_tempo / self.tempo_list[idx].bpm
+        )
+
+    def get_actual_ticks_from_ticks_batch(self, ticks_list: list[int]) -> list[float]:
+        if not self.is_absolute_time_code:
+            return list(ticks_list)
+        if not ticks_list:
+            return []
+        indexed = sorted(enumerate(ticks_list), key=lambda x: x[1])
+        results: list[float] = [0.0] * len(ticks_list)
+        seg_idx = 0
+        n = len(self._positions)
+        for orig_idx, ticks in indexed:
+            while seg_idx + 1 < n and self._positions[seg_idx + 1] <= ticks:
+                seg_idx += 1
+            results[orig_idx] = (
+                self._cum_actual_ticks[seg_idx]
+                + (ticks - self._positions[seg_idx])
+                * self.default_tempo
+                / self.tempo_list[seg_idx].bpm
             )
-        res += (ticks - self._positions[idx]) * self.default_tempo / self.tempo_list[idx].bpm
-        return res
+        return results
 
     def get_duration_secs_from_ticks(self, start_ticks: int, end_ticks: int) -> float:
         if self.is_absolute_time_code:
@@ -93,6 +117,13 @@ class TimeSynchronizer:
     def get_actual_secs_from_ticks_batch(self, ticks_list: list[int]) -> list[float]:
         if not ticks_list:
             return []
+        if self.is_absolute_time_code:
+            origin = self.get_actual_ticks_from_ticks(0)
+            return [
+                (actual_ticks - origin) / self.default_tempo / 8
+                for actual_ticks in self.get_actual_ticks_from_ticks_batch(ticks_list)
+            ]
+        origin = self._secs_at_tick(0)
         indexed = sorted(enumerate(ticks_list), key=lambda x: x[1])
         results: list[float] = [0.0] * len(ticks_list)
         seg_idx = 0
@@ -103,5 +134,6 @@ class TimeSynchronizer:
             results[orig_idx] = (
                 self._cum_secs[seg_idx]
                 + (ticks - self._positions[seg_idx]) / self.tempo_list[seg_idx].bpm / 8
+                - origin
             )
         return results
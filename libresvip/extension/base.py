@@ -1,4 +1,7 @@
+import contextlib
 import pathlib
+import uuid
+from collections.abc import Iterator
 from typing import Any, ClassVar, TypeAlias
 
 from pydantic import BaseModel
@@ -9,6 +12,19 @@ from libresvip.model.base import Project
 from .meta_info import FormatProviderPluginInfo, MiddlewarePluginInfo
 
 OptionsDict: TypeAlias = dict[str, Any]
+ProjectContent: TypeAlias = bytes | memoryview
+
+
+@contextlib.contextmanager
+def _memory_file(suffix: str) -> Iterator[pathlib.Path]:
+    from upath import UPath
+
+    path = UPath("memory:/") / "libresvip" / f"{uuid.uuid4().hex}{suffix}"
+    try:
+        yield path
+    finally:
+        if path.exists():
+            path.unlink()
 
 
 @pluginlib.Parent("svs")
@@ -25,6 +41,24 @@ class SVSConverter:
     @pluginlib.abstractmethod
     def dump(cls, path: pathlib.Path, project: Project, options: OptionsDict) -> None: ...
 
+    @classmethod
+    def loads(cls, content: ProjectContent, options: OptionsDict) -> Project:
+        """Load a project from file content; path-based plugins read it from an in-memory file."""
+        with _memory_file(cls._content_suffix()) as path:
+            path.write_bytes(content)
+            return cls.load(path, options)
+
+    @classmethod
+    def dumps(cls, project: Project, options: OptionsDict) -> bytes:
+        """Serialize a project to file content; path-based plugins write an in-memory file."""
+        with _memory_file(cls._content_suffix()) as path:
+            cls.dump(path, project, options)
+            return path.read_bytes()
+
+    @classmethod
+    def _content_suffix(cls) -> str:
+        return f".{cls.info.suffix}" if cls.info is not None and cls.info.suffix else ""
+
 
 class WriteOnlyConverterMixin:
     input_option_cls: ClassVar[type[BaseModel]] = BaseModel
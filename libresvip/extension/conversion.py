@@ -0,0 +1,129 @@
+import contextlib
+import dataclasses
+import os
+import pathlib
+import traceback
+import uuid
+from collections.abc import Callable, Sequence
+from zipfile import ZipFile
+
+from libresvip.core.config import (
+    ConversionMode,
+    LibreSvipBaseUISettings,
+    LibreSVIPSettingsContainer,
+    settings,
+)
+from libresvip.core.warning_types import CatchWarnings
+from libresvip.extension.base import OptionsDict, ProjectContent
+from libresvip.extension.manager import (
+    get_svs_plugin_by_value,
+    middleware_manager,
+    plugin_manager,
+    start_model_warmup,
+)
+from libresvip.extension.project_cache import load_project
+from libresvip.model.base import Project
+from libresvip.utils.archive import compression_for
+
+
+@dataclasses.dataclass
+class ConversionOutput:
+    success: bool
+    file_contents: list[bytes] = dataclasses.field(default_factory=list)
+    warning: str | None = None
+    error: str | None = None
+
+
+def _write_atomically(output_path: pathlib.Path, write: Callable[[pathlib.Path], None]) -> None:
+    # written next to the target first, so a failed conversion never leaves a partial file
+    tmp_path = output_path.with_name(f".{output_path.stem}.{uuid.uuid4().hex}{output_path.suffix}")
+    try:
+        write(tmp_path)
+        tmp_path.replace(output_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def run_conversion(
+    sources: Sequence[pathlib.Path | ProjectContent],
+    *,
+    mode: ConversionMode,
+    input_format: str,
+    output_format: str,
+    input_options: OptionsDict,
+    output_options: OptionsDict,
+    middleware_options: dict[str, OptionsDict],
+    max_track_count: int = 1,
+    output_path: pathlib.Path | None = None,
+) -> ConversionOutput:
+    """Load, process and dump one conversion task.
+
+    Merge mode combines every source, the other modes convert only the first one. With
+    ``output_path`` the result is written there once the conversion succeeded, split mode
+    writing a zip archive of the child projects. Otherwise the converted contents are
+    returned, one per child project in split mode.
+    """
+    file_contents: list[bytes] = []
+    try:
+        with CatchWarnings() as w:
+            input_plugin = get_svs_plugin_by_value(input_format)
+            output_plugin = get_svs_plugin_by_value(output_format)
+            if mode == ConversionMode.MERGE:
+                project = Project.merge_projects(
+                    [load_project(input_plugin, source, input_options) for source in sources]
+                )
+            else:
+                project = load_project(input_plugin, sources[0], input_options)
+            middlewares = middleware_manager.plugins.get("middleware", {})
+            for middleware_id, middleware_option in middleware_options.items():
+                if middleware := middlewares.get(middleware_id):
+                    project = middleware.process(project, middleware_option)
+            if mode != ConversionMode.SPLIT:
+                if output_path is None:
+                    file_contents.append(output_plugin.dumps(project, output_options))
+                else:
+                    _write_atomically(
+                        output_path,
+                        lambda path: output_plugin.dump(path, project, output_options),
+                    )
+            elif output_path is None:
+                file_contents.extend(
+                    output_plugin.dumps(child_project, output_options)
+                    for child_project in project.split_tracks(max_track_count)
+                )
+            else:
+
+                def write_archive(path: pathlib.Path) -> None:
+                    with ZipFile(path, "w") as zip_file:
+                        for i, child_project in enumerate(
+                            project.split_tracks(max_track_count), start=1
+                        ):
+                            filename = f"{output_path.stem}_{i:0=2d}.{output_format}"
+                            zip_file.writestr(
+                                filename,
+                                output_plugin.dumps(child_project, output_options),
+                                compress_type=compression_for(filename),
+                            )
+
+                _write_atomically(output_path, write_archive)
+    except Exception:
+        return ConversionOutput(
+            success=False, warning=w.output or None, error=traceback.format_exc()
+        )
+    return ConversionOutput(success=True, file_contents=file_contents, warning=w.output or None)
+
+
+_worker_exit_stack = contextlib.ExitStack()
+
+
+def init_conversion_worker(ui_settings: LibreSvipBaseUISettings | None = None) -> None:
+    """Initializer of spawned conversion worker processes."""
+    # spawned workers see the settings of the app session, not the saved yaml file
+    os.environ["LIBRESVIP_SETTINGS_BACKEND"] = "remote"
+    _worker_exit_stack.enter_context(
+        LibreSVIPSettingsContainer.state.init(settings if ui_settings is None else ui_settings)
+    )
+    # import every plugin module up front so conversions don't pay for it
+    plugin_manager.plugins.get("svs", {}).values()
+    middleware_manager.plugins.get("middleware", {}).values()
+    start_model_warmup()
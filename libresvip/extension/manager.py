@@ -4,22 +4,25 @@ import copy
 import gettext
 import importlib
 import itertools
-from importlib.resources import files
+import threading
 from typing import TYPE_CHECKING
 
 from loguru import logger
+from pydantic import BaseModel
 
 from libresvip.core.config import get_settings, settings
 from libresvip.core.constants import app_dir, res_dir
-from libresvip.extension.vendor import pluginlib
+from libresvip.extension.plugin_index import LazyPluginLoader
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from libresvip.core.compat import Traversable
     from libresvip.extension.base import SVSConverter
 
 
-def _build_plugin_manager() -> pluginlib.PluginLoader:
-    pm = pluginlib.PluginLoader(
+def _build_plugin_manager() -> LazyPluginLoader:
+    pm = LazyPluginLoader(
         modules=["libresvip.plugins"],
         paths=[str(app_dir.user_config_path / "plugins")],
         type_filter=["svs"],
@@ -27,19 +30,17 @@ def _build_plugin_manager() -> pluginlib.PluginLoader:
         blacklist=[("svs", each) for each in settings.disabled_plugins],
     )
     pm.load_modules()
-    pm.loaded = True
     return pm
 
 
-def _build_middleware_manager() -> pluginlib.PluginLoader:
-    mm = pluginlib.PluginLoader(
+def _build_middleware_manager() -> LazyPluginLoader:
+    mm = LazyPluginLoader(
         modules=["libresvip.middlewares"],
         paths=[str(app_dir.user_config_path / "middlewares")],
         type_filter=["middleware"],
         prefix_package="libresvip",
     )
     mm.load_modules()
-    mm.loaded = True
     return mm
 
 
@@ -54,7 +55,7 @@ plugin_manager = _build_plugin_manager()
 middleware_manager = _build_middleware_manager()
 
 
-_svs_suffix_map: dict[str, type[SVSConverter]] | None = None
+_svs_suffix_map: dict[str, str] | None = None
 
 
 def invalidate_plugin_caches() -> None:
@@ -62,24 +63,29 @@ def invalidate_plugin_caches() -> None:
     _svs_suffix_map = None
 
 
-def _build_svs_suffix_map() -> dict[str, type[SVSConverter]]:
+def _build_svs_suffix_map() -> dict[str, str]:
     global _svs_suffix_map
     if _svs_suffix_map is not None:
         return _svs_suffix_map
-    suffix_map: dict[str, type[SVSConverter]] = {}
-    for plugin in plugin_manager.plugins.get("svs", {}).values():
-        for suffix in plugin.info.suffixes:
+    suffix_map: dict[str, str] = {}
+    for identifier, entry in plugin_manager.entries.get("svs", {}).items():
+        for suffix in entry.suffixes:
             if suffix in suffix_map:
                 logger.warning(
-                    f"Duplicate suffix '{suffix}' declared by plugins '{suffix_map[suffix].__name__}' and '{plugin.__name__}'"
+                    f"Duplicate suffix '{suffix}' declared by plugins '{suffix_map[suffix]}' and '{identifier}'"
                 )
-            suffix_map[suffix] = plugin
+            suffix_map[suffix] = identifier
     _svs_suffix_map = suffix_map
     return suffix_map
 
 
 def get_svs_plugin_by_suffix(suffix: str) -> type[SVSConverter] | None:
-    return _build_svs_suffix_map().get(suffix)
+    while (identifier := _build_svs_suffix_map().get(suffix)) is not None:
+        if (plugin := plugin_manager.plugins.get("svs", {}).get(identifier)) is not None:
+            return plugin
+        # the plugin failed to load and left the index, so another one may declare the suffix
+        invalidate_plugin_caches()
+    return None
 
 
 def get_svs_plugin_by_value(value: str) -> type[SVSConverter] | None:
@@ -87,16 +93,17 @@ def get_svs_plugin_by_value(value: str) -> type[SVSConverter] | None:
 
 
 def get_svs_plugin_suffixes(value: str) -> tuple[str, ...]:
-    plugin = get_svs_plugin_by_value(value)
-    if plugin is None:
+    svs_entries = plugin_manager.entries.get("svs", {})
+    entry = svs_entries.get(value) or svs_entries.get(_build_svs_suffix_map().get(value, ""))
+    if entry is None:
         return ()
-    return plugin.info.suffixes
+    return entry.suffixes
 
 
 def get_duplicate_suffixes() -> dict[str, list[str]]:
     suffix_to_plugins: dict[str, list[str]] = {}
-    for plugin_id, plugin in plugin_manager.plugins.get("svs", {}).items():
-        for suffix in plugin.info.suffixes:
+    for plugin_id, entry in plugin_manager.entries.get("svs", {}).items():
+        for suffix in entry.suffixes:
             suffix_to_plugins.setdefault(suffix, []).append(plugin_id)
     return {suffix: plugins for suffix, plugins in suffix_to_plugins.items() if len(plugins) > 1}
 
@@ -139,10 +146,46 @@ def get_translation(
     translation = get_core_translation(lang)
     if not include_plugins:
         return translation
-    for plugin in itertools.chain(
-        plugin_manager.plugins.get("svs", {}).values(),
-        middleware_manager.plugins.get("middleware", {}).values(),
+    for entry in itertools.chain(
+        plugin_manager.entries.get("svs", {}).values(),
+        middleware_manager.entries.get("middleware", {}).values(),
     ):
-        plugin_base_dir = files(plugin.__module__.rsplit(".", 1)[0])
-        translation = merge_translation(translation, plugin_base_dir, lang)
+        translation = merge_translation(translation, entry.resource_dir, lang)
     return translation
+
+
+def _iter_model_classes() -> Iterator[type[BaseModel]]:
+    seen: set[type[BaseModel]] = set()
+    pending = [BaseModel]
+    while pending:
+        for model_cls in pending.pop().__subclasses__():
+            if model_cls not in seen:
+                seen.add(model_cls)
+                pending.append(model_cls)
+                yield model_cls
+
+
+def warm_up_models() -> None:
+    """Import every enabled plugin and build the validators and serializers of all models.
+
+    Models defer building them until first use, so this moves that cost out of the first
+    conversion.
+    """
+    for manager in (plugin_manager, middleware_manager):
+        _ = manager.plugins_all
+    for model_cls in _iter_model_classes():
+        if model_cls.__pydantic_complete__:
+            continue
+        try:
+            model_cls.model_rebuild(raise_errors=False)
+        except Exception as e:
+            logger.debug(f"Failed to build model {model_cls.__qualname__}: {e}")
+
+
+def start_model_warmup() -> threading.Thread | None:
+    """Run :func:`warm_up_models` in a daemon thread, unless the settings disable it."""
+    if not get_settings().warm_up_models:
+        return None
+    thread = threading.Thread(target=warm_up_models, name="model-warmup", daemon=True)
+    thread.start()
+    return thread
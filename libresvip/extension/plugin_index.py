@@ -0,0 +1,457 @@
+from __future__ import annotations
+
+import ast
+import dataclasses
+import functools
+import importlib
+import importlib.util
+import os
+import pathlib
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from importlib.resources import files
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+from packaging.version import InvalidVersion, Version
+
+from libresvip import __version__
+from libresvip.core.compat import json
+from libresvip.core.constants import app_dir
+from libresvip.extension.meta_info import FormatProviderPluginInfo, MiddlewarePluginInfo
+from libresvip.extension.vendor import pluginlib
+from libresvip.extension.vendor.pluginlib._loader import (
+    _import_module,
+    _recursive_import,
+    _recursive_path_import,
+)
+from libresvip.extension.vendor.pluginlib._parent import get_plugins
+from libresvip.extension.vendor.pluginlib._util import OPERATORS, DictWithDotNotation
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from libresvip.core.compat import Traversable
+
+INDEX_FORMAT_VERSION = 1
+PLUGIN_PARENT_CLASSES = {
+    "svs": "SVSConverter",
+    "middleware": "Middleware",
+}
+OPTION_CLASS_ATTRS = ("input_option_cls", "output_option_cls", "process_option_cls")
+MIXIN_OPTION_DEFAULTS = {
+    "WriteOnlyConverterMixin": "input_option_cls",
+    "ReadOnlyConverterMixin": "output_option_cls",
+}
+
+
+@dataclasses.dataclass
+class PluginIndexEntry:
+    plugin_type: str
+    identifier: str
+    module: str
+    class_name: str
+    version: str | None
+    metadata_file: str
+    suffixes: tuple[str, ...] = ()
+    option_classes: dict[str, str] = dataclasses.field(default_factory=dict)
+    read_only: bool = False
+    write_only: bool = False
+    path_root: str | None = None
+
+    @property
+    def package(self) -> str:
+        return self.module.rpartition(".")[0]
+
+    @property
+    def resource_dir(self) -> Traversable:
+        if self.path_root is not None:
+            return pathlib.Path(self.metadata_file).parent
+        return files(self.package)
+
+    @functools.cached_property
+    def info(self) -> FormatProviderPluginInfo | MiddlewarePluginInfo | None:
+        info_cls = FormatProviderPluginInfo if self.plugin_type == "svs" else MiddlewarePluginInfo
+        return info_cls.load(self.resource_dir / pathlib.PurePath(self.metadata_file).name)
+
+    def load_option_cls(self, attr_name: str) -> type[BaseModel] | None:
+        if (import_path := self.option_classes.get(attr_name)) is None:
+            return None
+        module_name, _, qualname = import_path.partition(":")
+        obj: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+        return obj
+
+    def to_dict(self) -> dict[str, Any]:
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PluginIndexEntry:
+        return cls(**{**data, "suffixes": tuple(data.get("suffixes", ()))})
+
+
+def _resolve_import_from(node: ast.ImportFrom, package: str) -> str:
+    if not node.level:
+        return node.module or ""
+    base = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+    return f"{base}.{node.module}" if node.module else base
+
+
+def _base_name(node: ast.expr) -> str:
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return ""
+
+
+def _scan_module_source(source: str, module_name: str, plugin_type: str) -> list[dict[str, Any]]:
+    tree = ast.parse(source)
+    package = module_name.rpartition(".")[0]
+    imported_names: dict[str, str] = {}
+    results = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            source_module = _resolve_import_from(node, package)
+            for alias in node.names:
+                imported_names[alias.asname or alias.name] = f"{source_module}:{alias.name}"
+        elif isinstance(node, ast.ClassDef):
+            base_names = [_base_name(base) for base in node.bases]
+            if PLUGIN_PARENT_CLASSES[plugin_type] not in base_names:
+                continue
+            attrs: dict[str, Any] = {}
+            option_classes = {
+                attr_name: "pydantic:BaseModel"
+                for mixin, attr_name in MIXIN_OPTION_DEFAULTS.items()
+                if mixin in base_names
+            }
+            for stmt in node.body:
+                if not (isinstance(stmt, ast.Assign) and len(stmt.targets) == 1):
+                    continue
+                target = stmt.targets[0]
+                if not isinstance(target, ast.Name):
+                    continue
+                if target.id in ("_alias_", "_version_") and isinstance(stmt.value, ast.Constant):
+                    attrs[target.id] = stmt.value.value
+                elif target.id in OPTION_CLASS_ATTRS and isinstance(stmt.value, ast.Name):
+                    option_classes[target.id] = imported_names.get(
+                        stmt.value.id, f"{module_name}:{stmt.value.id}"
+                    )
+            results.append(
+                {
+                    "identifier": attrs.get("_alias_") or node.name,
+                    "class_name": node.name,
+                    "version": attrs.get("_version_"),
+                    "option_classes": option_classes,
+                    "read_only": "ReadOnlyConverterMixin" in base_names,
+                    "write_only": "WriteOnlyConverterMixin" in base_names,
+                }
+            )
+    return results
+
+
+def _iter_plugin_dirs(root: pathlib.Path) -> Iterator[pathlib.Path]:
+    if not root.is_dir():
+        return
+    for child in sorted(root.iterdir()):
+        if child.is_dir() and any(child.glob("*.yapsy-plugin")):
+            yield child
+
+
+def _entries_from_import(
+    package_name: str, plugin_type: str, metadata_file: str
+) -> list[PluginIndexEntry]:
+    # Frozen builds ship bytecode only, so fall back to importing the package.
+    if (package := _import_module(package_name)) is None:
+        return []
+    _recursive_import(package)
+    entries = []
+    for plugin in get_plugins()["_default"].get(plugin_type, {}).values():
+        if not plugin.__module__.startswith(f"{package_name}."):
+            continue
+        entries.append(
+            PluginIndexEntry(
+                plugin_type=plugin_type,
+                identifier=plugin.name,
+                module=plugin.__module__,
+                class_name=plugin.__name__,
+                version=plugin.version,
+                metadata_file=metadata_file,
+                option_classes={
+                    attr_name: f"{option_cls.__module__}:{option_cls.__qualname__}"
+                    for attr_name in OPTION_CLASS_ATTRS
+                    if (option_cls := getattr(plugin, attr_name, None)) is not None
+                },
+                read_only=any(base.__name__ == "ReadOnlyConverterMixin" for base in plugin.__mro__),
+                write_only=any(
+                    base.__name__ == "WriteOnlyConverterMixin" for base in plugin.__mro__
+                ),
+            )
+        )
+    return entries
+
+
+def _scan_plugin_dir(
+    plugin_dir: pathlib.Path,
+    package_name: str,
+    plugin_type: str,
+    path_root: str | None,
+) -> list[PluginIndexEntry]:
+    metadata_file = next(plugin_dir.glob("*.yapsy-plugin"))
+    suffixes: tuple[str, ...] = ()
+    if plugin_type == "svs":
+        info = FormatProviderPluginInfo.load(metadata_file)
+        if info is not None:
+            suffixes = info.suffixes
+    entries = []
+    for module_file in sorted(plugin_dir.glob("*.py")):
+        module_name = f"{package_name}.{module_file.stem}"
+        try:
+            scanned = _scan_module_source(
+                module_file.read_text(encoding="utf-8"), module_name, plugin_type
+            )
+        except (OSError, SyntaxError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to scan plugin module {module_file}: {e}")
+            continue
+        entries.extend(
+            PluginIndexEntry(
+                plugin_type=plugin_type,
+                module=module_name,
+                metadata_file=str(metadata_file),
+                suffixes=suffixes,
+                path_root=path_root,
+                **each,
+            )
+            for each in scanned
+        )
+    if not entries and path_root is None:
+        entries = _entries_from_import(package_name, plugin_type, str(metadata_file))
+        for entry in entries:
+            entry.suffixes = suffixes
+    return entries
+
+
+def _package_roots(
+    modules: Iterable[str], paths: Iterable[str | pathlib.Path], prefix_package: str | None
+) -> list[tuple[pathlib.Path, str, str | None]]:
+    roots = []
+    for module_name in modules:
+        spec = importlib.util.find_spec(module_name)
+        if spec is None or spec.submodule_search_locations is None:
+            continue
+        roots.extend(
+            (pathlib.Path(location), module_name, None)
+            for location in spec.submodule_search_locations
+        )
+    for path in paths:
+        path = pathlib.Path(path)
+        roots.append((path, f"{prefix_package}.{path.name}", str(path)))
+    return roots
+
+
+def _index_signature(roots: list[tuple[pathlib.Path, str, str | None]]) -> list[list[Any]]:
+    signature: list[list[Any]] = []
+    for root, _, _ in roots:
+        for plugin_dir in _iter_plugin_dirs(root):
+            with os.scandir(plugin_dir) as it:
+                for dir_entry in sorted(it, key=lambda x: x.name):
+                    if dir_entry.name.endswith((".py", ".yapsy-plugin")):
+                        stat = dir_entry.stat()
+                        signature.append([dir_entry.path, stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+def build_plugin_index(
+    plugin_type: str,
+    modules: Iterable[str] = (),
+    paths: Iterable[str | pathlib.Path] = (),
+    prefix_package: str | None = None,
+) -> dict[str, PluginIndexEntry]:
+    roots = _package_roots(modules, paths, prefix_package)
+    cache_path = app_dir.user_cache_path / f"{plugin_type}_plugin_index.json"
+    signature = _index_signature(roots)
+    cache_key = {
+        "format": INDEX_FORMAT_VERSION,
+        "libresvip": __version__,
+        "signature": signature,
+    }
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+        if cached.get("key") == cache_key:
+            return {
+                each["identifier"]: PluginIndexEntry.from_dict(each) for each in cached["entries"]
+            }
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    index: dict[str, PluginIndexEntry] = {}
+    for root, package_name, path_root in roots:
+        for plugin_dir in _iter_plugin_dirs(root):
+            for entry in _scan_plugin_dir(
+                plugin_dir, f"{package_name}.{plugin_dir.name}", plugin_type, path_root
+            ):
+                if entry.identifier in index:
+                    logger.warning(
+                        f"Duplicate plugin identifier '{entry.identifier}' found in {entry.module}"
+                    )
+                    continue
+                index[entry.identifier] = entry
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps(
+                {"key": cache_key, "entries": [entry.to_dict() for entry in index.values()]}
+            ),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logger.debug(f"Failed to write plugin index cache {cache_path}: {e}")
+    return index
+
+
+def _skips_load(plugin: Any) -> bool:
+    skipload = getattr(plugin, "_skipload_", False)
+    if callable(skipload):
+        skipload = skipload()
+        if isinstance(skipload, tuple):
+            skipload = skipload[0]
+    return bool(skipload)
+
+
+def _is_blacklisted(entry: PluginIndexEntry, blacklist: Iterable[pluginlib.BlacklistEntry]) -> bool:
+    for blacklist_entry in blacklist:
+        if blacklist_entry.type not in (None, entry.plugin_type):
+            continue
+        if blacklist_entry.name not in (None, entry.identifier):
+            continue
+        if blacklist_entry.version is None:
+            return True
+        try:
+            if OPERATORS[blacklist_entry.operator](
+                Version(entry.version or "0"), Version(blacklist_entry.version)
+            ):
+                return True
+        except InvalidVersion:
+            continue
+    return False
+
+
+class LazyPluginMapping(Mapping[str, Any]):
+    def __init__(self, loader: LazyPluginLoader, plugin_type: str) -> None:
+        self._loader = loader
+        self._plugin_type = plugin_type
+
+    @property
+    def _entries(self) -> dict[str, PluginIndexEntry]:
+        return self._loader.entries.get(self._plugin_type, {})
+
+    def __getitem__(self, key: str) -> Any:
+        entry = self._entries[key]
+        plugin = self._loader.resolve(entry)
+        if plugin is None:
+            raise KeyError(key)
+        return plugin
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def items(self) -> list[tuple[str, Any]]:  # type: ignore[override]
+        return [
+            (key, plugin)
+            for key, entry in list(self._entries.items())
+            if (plugin := self._loader.resolve(entry)) is not None
+        ]
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        return [plugin for _, plugin in self.items()]
+
+
+class LazyPluginLoader(pluginlib.PluginLoader):
+    """
+    Plugin loader backed by an index of the ``*.yapsy-plugin`` metadata.
+
+    Plugin modules are only imported when a plugin class is requested.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._index: dict[str, dict[str, PluginIndexEntry]] | None = None
+        self._resolved: dict[tuple[str, str], Any] = {}
+        self._imported_paths: set[str] = set()
+        self.failed_identifiers: set[str] = set()
+
+    def load_modules(self) -> None:
+        self._index = {
+            plugin_type: build_plugin_index(
+                plugin_type, self.modules, self.paths, self.prefix_package
+            )
+            for plugin_type in (self.type_filter or PLUGIN_PARENT_CLASSES)
+        }
+        self.loaded = True
+
+    @property
+    def entries(self) -> dict[str, dict[str, PluginIndexEntry]]:
+        if self._index is None:
+            self.load_modules()
+        assert self._index is not None
+        return {
+            plugin_type: {
+                identifier: entry
+                for identifier, entry in type_index.items()
+                if identifier not in self.failed_identifiers
+                and not _is_blacklisted(entry, self.blacklist)
+            }
+            for plugin_type, type_index in self._index.items()
+        }
+
+    def resolve(self, entry: PluginIndexEntry) -> Any:
+        key = (entry.plugin_type, entry.identifier)
+        if key in self._resolved:
+            return self._resolved[key]
+        plugin = None
+        if entry.path_root is not None:
+            if entry.path_root not in self._imported_paths:
+                self._imported_paths.add(entry.path_root)
+                _recursive_path_import(pathlib.Path(entry.path_root), self.prefix_package)
+            if (module := sys.modules.get(entry.module)) is not None:
+                plugin = getattr(module, entry.class_name, None)
+        elif (module := _import_module(entry.module)) is not None:
+            plugin = getattr(module, entry.class_name, None)
+        if plugin is not None and _skips_load(plugin):
+            # the eager loader never registers these, e.g. when an optional dependency is missing
+            plugin = None
+        if plugin is None:
+            self.failed_identifiers.add(entry.identifier)
+        self._resolved[key] = plugin
+        return plugin
+
+    def available_entries(self, plugin_type: str) -> dict[str, PluginIndexEntry]:
+        """Entries of ``plugin_type`` whose plugin class actually loads."""
+        for entry in self.entries.get(plugin_type, {}).values():
+            self.resolve(entry)
+        return self.entries.get(plugin_type, {})
+
+    @property
+    def plugins(self) -> DictWithDotNotation:
+        return DictWithDotNotation(
+            {plugin_type: LazyPluginMapping(self, plugin_type) for plugin_type in self.entries}
+        )
+
+    @property
+    def plugins_all(self) -> DictWithDotNotation:
+        for type_entries in self.entries.values():
+            for entry in type_entries.values():
+                self.resolve(entry)
+        return super().plugins_all
+
+    def get_plugin(self, plugin_type: str, name: str, version: str | None = None) -> Any:
+        entry = self.entries.get(plugin_type, {}).get(name)
+        if entry is None or (version is not None and entry.version != version):
+            return None
+        return self.resolve(entry)
@@ -0,0 +1,238 @@
+import collections
+import dataclasses
+import hashlib
+import pathlib
+import threading
+from collections.abc import Sequence
+
+import cbor2
+from loguru import logger
+
+from libresvip import __version__
+from libresvip.core.compat import json
+from libresvip.core.config import get_settings
+from libresvip.core.constants import app_dir
+from libresvip.core.warning_types import CatchWarnings, show_warning
+from libresvip.extension.base import OptionsDict, ProjectContent, SVSConverter
+from libresvip.model import project_codec
+from libresvip.model.base import Project
+
+DEFAULT_DISK_CACHE_SIZE = 1 << 30
+
+
+@dataclasses.dataclass
+class ProjectCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class ProjectCache:
+    """Cache of parsed projects keyed by input content and path, plugin version and options.
+
+    Entries are kept serialized, so callers always get a fresh ``Project`` they are free
+    to mutate, and the memory tier can be bounded by the size of what it holds. Evicted
+    entries stay available from the optional disk tier in ``cache_dir``. The warnings the
+    parser showed are stored with each entry and shown again on a hit.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        cache_dir: pathlib.Path | None = None,
+        max_disk_size: int = DEFAULT_DISK_CACHE_SIZE,
+    ) -> None:
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        self.max_disk_size = max_disk_size
+        self.stats = ProjectCacheStats()
+        self._entries: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        content: ProjectContent,
+        plugin: type[SVSConverter],
+        options: OptionsDict,
+        path: pathlib.Path | None = None,
+    ) -> str:
+        """Key of a parse result.
+
+        Parsers may read the input path too, to name tracks after the file or to resolve
+        sibling audio files, so a file's resolved ``path`` is part of its key.
+        """
+        hasher = hashlib.sha256(content)
+        hasher.update(
+            json.dumps(
+                [
+                    __version__,
+                    project_codec.FORMAT_VERSION,
+                    f"{plugin.__module__}.{plugin.__qualname__}",
+                    plugin.version,
+                    options,
+                    None if path is None else str(path.resolve()),
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        return hasher.hexdigest()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Project | None:
+        with self._lock:
+            if (data := self._entries.get(key)) is not None:
+                self._entries.move_to_end(key)
+        from_disk = data is None
+        if from_disk:
+            data = self._read_disk(key)
+        if data is not None:
+            try:
+                warnings, project_data = cbor2.loads(data)
+                project = Project.from_bytes(project_data)
+            except (ValueError, TypeError, cbor2.CBORDecodeError) as e:
+                # truncated files and entries of older formats count as misses
+                logger.debug(f"Dropping unreadable project cache entry {key}: {e}")
+                self._forget(key)
+            else:
+                if from_disk:
+                    self._remember(key, data)
+                with self._lock:
+                    if from_disk:
+                        self.stats.disk_hits += 1
+                    else:
+                        self.stats.hits += 1
+                for message in warnings:
+                    show_warning(message)
+                return project
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def put(self, key: str, project: Project, warnings: Sequence[str] = ()) -> None:
+        data = cbor2.dumps([list(warnings), project.to_bytes()])
+        self._remember(key, data)
+        self._write_disk(key, data)
+
+    def load(
+        self,
+        plugin: type[SVSConverter],
+        source: pathlib.Path | ProjectContent,
+        options: OptionsDict,
+    ) -> Project:
+        """Load ``source`` with ``plugin``, parsing it only if no cached copy exists."""
+        if isinstance(source, pathlib.Path):
+            key = self.make_key(source.read_bytes(), plugin, options, source)
+        else:
+            key = self.make_key(source, plugin, options)
+        if (project := self.get(key)) is not None:
+            return project
+        catch_warnings = CatchWarnings()
+        try:
+            with catch_warnings:
+                if isinstance(source, pathlib.Path):
+                    project = plugin.load(source, options)
+                else:
+                    project = plugin.loads(source, options)
+        finally:
+            # collected here to be cached, so pass them on to the caller's CatchWarnings too
+            warnings = catch_warnings.output.splitlines()
+            for message in warnings:
+                show_warning(message)
+        self.put(key, project, warnings)
+        return project
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_size:
+            return
+        with self._lock:
+            if (previous := self._entries.pop(key, None)) is not None:
+                self._size -= len(previous)
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.stats.evictions += 1
+
+    def _forget(self, key: str) -> None:
+        with self._lock:
+            if (data := self._entries.pop(key, None)) is not None:
+                self._size -= len(data)
+        if self.cache_dir is not None:
+            (self.cache_dir / f"{key}.bin").unlink(missing_ok=True)
+
+    def _read_disk(self, key: str) -> bytes | None:
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.bin"
+        try:
+            data = path.read_bytes()
+            # pruning drops the least recently used files first
+            path.touch()
+        except OSError:
+            return None
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if self.cache_dir is None or len(data) > self.max_disk_size:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.{threading.get_ident()}.tmp"
+            tmp_path.write_bytes(data)
+            tmp_path.replace(self.cache_dir / f"{key}.bin")
+            self._prune_disk()
+        except OSError as e:
+            logger.debug(f"Failed to write project cache entry {key}: {e}")
+
+    def _prune_disk(self) -> None:
+        if self.cache_dir is None:
+            return
+        # entries of the earlier JSON layout are never read again
+        for path in self.cache_dir.glob("*.json"):
+            path.unlink(missing_ok=True)
+        entries = sorted(
+            ((path.stat(), path) for path in self.cache_dir.glob("*.bin")),
+            key=lambda entry: entry[0].st_mtime_ns,
+        )
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if total <= self.max_disk_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+
+project_cache = ProjectCache(0)
+
+
+def load_project(
+    plugin: type[SVSConverter],
+    source: pathlib.Path | ProjectContent,
+    options: OptionsDict,
+) -> Project:
+    """Load a project, going through :data:`project_cache` when the settings enable it."""
+    ui_settings = get_settings()
+    if ui_settings.project_cache_size <= 0:
+        if isinstance(source, pathlib.Path):
+            return plugin.load(source, options)
+        return plugin.loads(source, options)
+    project_cache.max_size = ui_settings.project_cache_size << 20
+    project_cache.cache_dir = (
+        app_dir.user_cache_path / "projects" if ui_settings.project_cache_on_disk else None
+    )
+    return project_cache.load(plugin, source, options)
@@ -10,6 +10,7 @@ from __feature__ import snake_case, true_property  # isort:skip # noqa: F401
 
 from libresvip.core.config import Language, config_path, settings
 from libresvip.core.constants import res_dir
+from libresvip.extension.manager import start_model_warmup
 from libresvip.gui.modules import (
     app,
     app_close_event,
@@ -102,6 +103,7 @@ def startup() -> None:
     if not qml_engine.root_objects():
         sys.exit(-1)
     QTimer.single_shot(0, _hide_splash_screen)
+    start_model_warmup()
     with contextlib.suppress(RuntimeError), event_loop:
         event_loop.run_until_complete(app_close_event.wait())
 
@@ -40,6 +40,7 @@ from libresvip.extension.manager import (
     middleware_manager,
     plugin_manager,
 )
+from libresvip.extension.project_cache import load_project
 from libresvip.gui.models.base_task import BaseTask
 from libresvip.gui.models.list_models import ModelProxy
 from libresvip.gui.models.table_models import PluginCadidatesTableModel
@@ -122,7 +123,8 @@ class ConversionWorker(QRunnable):
             with CatchWarnings() as w:
                 input_plugin = get_svs_plugin_by_value(self.input_format)
                 output_plugin = get_svs_plugin_by_value(self.output_format)
-                project = input_plugin.load(
+                project = load_project(
+                    input_plugin,
                     pathlib.Path(self.input_path),
                     self.input_options,
                 )
@@ -187,7 +189,8 @@ class SplitWorker(QRunnable):
             with CatchWarnings() as w:
                 input_plugin = get_svs_plugin_by_value(self.input_format)
                 output_plugin = get_svs_plugin_by_value(self.output_format)
-                project = input_plugin.load(
+                project = load_project(
+                    input_plugin,
                     pathlib.Path(self.input_path),
                     self.input_options,
                 )
@@ -253,7 +256,8 @@ class MergeWorker(QRunnable):
                 input_plugin = get_svs_plugin_by_value(self.input_format)
                 output_plugin = get_svs_plugin_by_value(self.output_format)
                 child_projects = [
-                    input_plugin.load(
+                    load_project(
+                        input_plugin,
                         pathlib.Path(input_path),
                         self.input_options,
                     )
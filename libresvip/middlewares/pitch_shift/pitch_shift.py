@@ -1,7 +1,9 @@
+from array import array
 from importlib.resources import files
 
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import ParamCurve, Points, Project, SingingTrack
+from libresvip.model.point import PointColumns
 
 from .options import ProcessOptions
 
@@ -14,6 +16,18 @@ class PitchShiftMiddleware(plugin_base.Middleware):
     _alias_ = "pitch_shift"
     _version_ = "1.0.0"
 
+    @staticmethod
+    def shift_pitch_curve(curve: ParamCurve, key: int) -> ParamCurve:
+        xs, ys = curve.points.root.xs, curve.points.root.ys
+        return ParamCurve(
+            points=Points(
+                root=PointColumns.from_columns(
+                    array(xs.typecode, xs),
+                    [y if y == -100 else y + key * 100 for y in ys],
+                )
+            )
+        )
+
     @classmethod
     def process(cls, project: Project, options: plugin_base.OptionsDict) -> Project:
         options_obj = cls.process_option_cls.model_validate(options)
@@ -31,17 +45,8 @@ class PitchShiftMiddleware(plugin_base.Middleware):
                                 ],
                                 "edited_params": track.edited_params.model_copy(
                                     update={
-                                        "pitch": ParamCurve(
-                                            points=Points(
-                                                root=[
-                                                    point
-                                                    if point.y == -100
-                                                    else point._replace(
-                                                        y=point.y + options_obj.key * 100
-                                                    )
-                                                    for point in track.edited_params.pitch.points.root
-                                                ]
-                                            )
+                                        "pitch": cls.shift_pitch_curve(
+                                            track.edited_params.pitch, options_obj.key
                                         )
                                     }
                                 ),
@@ -1,15 +1,24 @@
 # mypy: disable-error-code="arg-type"
 import functools
-from collections.abc import MutableMapping
+import re
+from collections.abc import Callable, MutableMapping, Sequence
 from importlib.resources import files
 from typing import Any
 
-from libresvip.core.config import LyricsReplacement, get_settings
+from retrie.trie import Trie
+
+from libresvip.core.config import LyricsReplacement, LyricsReplaceMode, get_settings
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project, SingingTrack
 
 from .options import ProcessOptions
 
+MERGEABLE_FLAGS = re.IGNORECASE | re.UNICODE | re.ASCII
+PLAN_CACHE_SIZE = 16
+LYRIC_CACHE_SIZE = 8192
+
+RuleKey = tuple[str, str, str, str, re.RegexFlag, LyricsReplaceMode]
+
 
 def replace_lyric(text: str, replacement: LyricsReplacement | MutableMapping[str, Any]) -> str:
     if isinstance(replacement, MutableMapping):
@@ -17,6 +26,111 @@ def replace_lyric(text: str, replacement: LyricsReplacement | MutableMapping[str
     return replacement.replace(text)
 
 
+class FullMatchRuleGroup:
+    """
+    Consecutive full-lyric rules merged into one trie alternation.
+
+    The trie rejects lyrics no rule matches in a single search; otherwise the
+    first matching rule is applied, exactly as applying the rules one by one.
+    """
+
+    def __init__(self, rules: Sequence[LyricsReplacement], flags: re.RegexFlag) -> None:
+        trie = Trie()
+        trie.add(*(rule.pattern_main for rule in rules))
+        self.rules = [(rule.compiled_pattern, rule.replacement) for rule in rules]
+        self.pattern = re.compile(f"^(?:{trie.pattern()})$", flags)
+
+    def __call__(self, lyric: str) -> str:
+        if self.pattern.search(lyric) is None:
+            return lyric
+        for pattern, replacement in self.rules:
+            if pattern.search(lyric) is not None:
+                return pattern.sub(replacement, lyric)
+        return lyric
+
+    @staticmethod
+    def accepts(rule: LyricsReplacement, group: Sequence[LyricsReplacement]) -> bool:
+        if (
+            rule.mode != LyricsReplaceMode.FULL
+            or not rule.pattern_main
+            or "\\" in rule.replacement
+            or rule.flags & ~MERGEABLE_FLAGS
+        ):
+            return False
+        if not group:
+            return True
+        if rule.flags != group[0].flags:
+            return False
+        # a later rule must not match what an earlier one produced, or merging
+        # would skip the chained replacement
+        pattern = rule.compiled_pattern
+        return all(pattern.search(prev.replacement) is None for prev in group)
+
+
+class LyricReplacementPlan:
+    def __init__(self, rules: Sequence[LyricsReplacement]) -> None:
+        self.steps: list[Callable[[str], str]] = []
+        group: list[LyricsReplacement] = []
+        for rule in rules:
+            if FullMatchRuleGroup.accepts(rule, group):
+                group.append(rule)
+                continue
+            self._flush_group(group)
+            if FullMatchRuleGroup.accepts(rule, group):
+                group.append(rule)
+            else:
+                self.steps.append(functools.partial(rule.compiled_pattern.sub, rule.replacement))
+        self._flush_group(group)
+        self.replace = functools.lru_cache(maxsize=LYRIC_CACHE_SIZE)(self._replace)
+
+    def _flush_group(self, group: list[LyricsReplacement]) -> None:
+        if len(group) == 1:
+            self.steps.append(
+                functools.partial(group[0].compiled_pattern.sub, group[0].replacement)
+            )
+        elif group:
+            self.steps.append(FullMatchRuleGroup(group, group[0].flags))
+        group.clear()
+
+    def _replace(self, lyric: str) -> str:
+        for step in self.steps:
+            lyric = step(lyric)
+        return lyric
+
+
+def _rule_key(rule: LyricsReplacement) -> RuleKey:
+    return (
+        rule.replacement,
+        rule.pattern_main,
+        rule.pattern_prefix,
+        rule.pattern_suffix,
+        rule.flags,
+        rule.mode,
+    )
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _compile_plan(rule_keys: tuple[RuleKey, ...]) -> LyricReplacementPlan:
+    return LyricReplacementPlan(
+        [
+            LyricsReplacement(
+                replacement=replacement,
+                pattern_main=pattern_main,
+                pattern_prefix=pattern_prefix,
+                pattern_suffix=pattern_suffix,
+                flags=flags,
+                mode=mode,
+            )
+            for replacement, pattern_main, pattern_prefix, pattern_suffix, flags, mode in rule_keys
+        ]
+    )
+
+
+def get_replacement_plan(rules: Sequence[LyricsReplacement]) -> LyricReplacementPlan:
+    """Plans are keyed by rule contents, so editing a preset compiles a new one."""
+    return _compile_plan(tuple(_rule_key(rule) for rule in rules))
+
+
 class ReplaceLyricsMiddleware(plugin_base.Middleware):
     process_option_cls = ProcessOptions
     info = plugin_base.MiddlewarePluginInfo.load_from_string(
@@ -31,12 +145,11 @@ class ReplaceLyricsMiddleware(plugin_base.Middleware):
         if (settings := get_settings()) and (
             options_obj.lyric_replacement_preset_name in settings.lyric_replace_rules
         ):
+            plan = get_replacement_plan(
+                settings.lyric_replace_rules[options_obj.lyric_replacement_preset_name]
+            )
             for track in project.track_list:
                 if isinstance(track, SingingTrack):
                     for note in track.note_list:
-                        note.lyric = functools.reduce(
-                            lambda lyric, replacement: replace_lyric(replacement, lyric),
-                            settings.lyric_replace_rules[options_obj.lyric_replacement_preset_name],
-                            note.lyric,
-                        )
+                        note.lyric = plan.replace(note.lyric)
         return project
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import abc
 import itertools
+from array import array
 from types import SimpleNamespace
 from typing import (
     Annotated,
+    Any,
     Literal,
     Protocol,
     runtime_checkable,
@@ -22,12 +24,14 @@ from pydantic import (
 )
 
 from libresvip.core.constants import DEFAULT_BPM, TICKS_IN_BEAT
-from libresvip.model.point import Point, PointList
+from libresvip.model.point import Point, PointColumns, PointList
 
 
 class BaseModel(PydanticBaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
+        # validators and serializers are built on first use, see warm_up_models
+        defer_build=True,
         # # Uncomment the following lines to enable strict mode
         # extra="forbid",
         # strict=True,
@@ -48,8 +52,13 @@ class BaseComplexModel(Protocol):
         pass
 
 
-class Points(PointList[Point], RootModel[list[Point]]):
-    root: list[Point] = Field(default_factory=list)
+class Points(PointList[Point], RootModel[PointColumns]):
+    root: PointColumns = Field(default_factory=PointColumns)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "root" and not isinstance(value, PointColumns):
+            value = PointColumns(value)
+        super().__setattr__(name, value)
 
 
 class SongTempo(BaseModel):
@@ -77,7 +86,9 @@ class ParamCurve(BaseModel):
         _info: ValidationInfo,
     ) -> Points:
         return (
-            points if isinstance(points, Points) else Points(root=[Point(*each) for each in points])
+            points
+            if isinstance(points, Points)
+            else Points(root=PointColumns(Point(*each) for each in points))
         )
 
     @computed_field(alias="TotalPointsCount")
@@ -87,86 +98,86 @@ class ParamCurve(BaseModel):
     def reduce_sample_rate(self, interval: int, interrupt_value: int = 0) -> ParamCurve:
         if interval <= 0:
             return self
-        points = self.points.root
-        if len(points) <= 1:
+        xs, ys = self.points.root.xs, self.points.root.ys
+        point_count = len(xs)
+        if point_count <= 1:
             return self
-        result: list[Point] = []
+        result_xs: list[int] = []
+        result_ys: list[int] = []
         i = 0
-        while i < len(points):
-            point = points[i]
-            if point.y == interrupt_value:
-                result.append(point)
+        while i < point_count:
+            if ys[i] == interrupt_value:
+                result_xs.append(xs[i])
+                result_ys.append(ys[i])
                 i += 1
                 continue
             run_start = i
-            while i < len(points) and points[i].y != interrupt_value:
+            while i < point_count and ys[i] != interrupt_value:
                 i += 1
-            run = points[run_start:i]
-            if run_start > 0 and points[run_start - 1].y == interrupt_value:
-                result.append(run[0])
-                run = run[1:]
-            if not run:
-                continue
-            if len(run) == 1:
-                result.append(run[0])
+            if run_start > 0 and ys[run_start - 1] == interrupt_value:
+                result_xs.append(xs[run_start])
+                result_ys.append(ys[run_start])
+                run_start += 1
+            if run_start == i:
                 continue
-            tail_point = run[-1]
-            window_points = run[:-1]
-            j = 0
-            while j < len(window_points):
-                bucket_start = window_points[j].x
-                bucket = [window_points[j]]
+            # bucket every point of the run but the last one, which is always kept
+            j = run_start
+            tail = i - 1
+            while j < tail:
+                bucket_start = j
+                bucket_end_x = xs[j] + interval
                 j += 1
-                while j < len(window_points) and window_points[j].x < bucket_start + interval:
-                    bucket.append(window_points[j])
+                while j < tail and xs[j] < bucket_end_x:
                     j += 1
-                result.append(
-                    Point(
-                        round(sum(point.x for point in bucket) / len(bucket)),
-                        round(sum(point.y for point in bucket) / len(bucket)),
-                    )
-                )
-            result.append(tail_point)
-        return ParamCurve(points=Points(root=result))
-
-    def split_into_segments(self, interrupt_value: int = 0) -> list[list[Point]]:
+                bucket_size = j - bucket_start
+                result_xs.append(round(sum(xs[bucket_start:j]) / bucket_size))
+                result_ys.append(round(sum(ys[bucket_start:j]) / bucket_size))
+            result_xs.append(xs[tail])
+            result_ys.append(ys[tail])
+        return ParamCurve(points=Points(root=PointColumns.from_columns(result_xs, result_ys)))
+
+    def split_into_segments(self, interrupt_value: int = 0) -> list[PointColumns]:
         end_point_x = Point.end_point().x
-        segments: list[list[Point]] = []
-        points = self.points.root
-        if len(points) == 0:
+        segments: list[PointColumns] = []
+        xs, ys = self.points.root.xs, self.points.root.ys
+        point_count = len(xs)
+        if point_count == 0:
             return segments
-        elif len(points) == 1:
-            point = points[0]
-            if 0 <= point.x < end_point_x and point.y != interrupt_value:
-                segments.append([point])
+        elif point_count == 1:
+            if 0 <= xs[0] < end_point_x and ys[0] != interrupt_value:
+                segments.append(self.points.root.copy())
             return segments
-        buffer: list[Point] = []
+        buffer: list[int] = []
+
+        def flush() -> None:
+            segments.append(
+                PointColumns.from_columns(
+                    array(xs.typecode, [xs[k] for k in buffer]),
+                    array(ys.typecode, [ys[k] for k in buffer]),
+                )
+            )
+            buffer.clear()
+
         if interrupt_value != 0:
-            for point in points:
-                if point.x >= 0 and point.y < end_point_x:
-                    if point.y != interrupt_value:
-                        buffer.append(point)
+            for k in range(point_count):
+                if xs[k] >= 0 and ys[k] < end_point_x:
+                    if ys[k] != interrupt_value:
+                        buffer.append(k)
                     elif buffer:
-                        segments.append(buffer.copy())
-                        buffer.clear()
+                        flush()
         else:
-            for i, current_point in enumerate(points[:-1]):
-                next_point = points[i + 1]
-                if current_point.y != interrupt_value:
-                    buffer.append(current_point)
-                elif next_point.y != interrupt_value:
-                    if current_point.x >= 0 and (i <= 0 or points[i - 1].y != interrupt_value):
-                        buffer.append(current_point)
+            for k in range(point_count - 1):
+                if ys[k] != interrupt_value:
+                    buffer.append(k)
+                elif ys[k + 1] != interrupt_value:
+                    if xs[k] >= 0 and (k <= 0 or ys[k - 1] != interrupt_value):
+                        buffer.append(k)
                 elif buffer:
-                    segments.append(buffer.copy())
-                    buffer.clear()
-            last_point = points[-1]
-            if last_point.x < end_point_x and (
-                last_point.y != interrupt_value or points[-2].y != interrupt_value
-            ):
-                buffer.append(last_point)
+                    flush()
+            if xs[-1] < end_point_x and (ys[-1] != interrupt_value or ys[-2] != interrupt_value):
+                buffer.append(point_count - 1)
         if buffer:
-            segments.append(buffer.copy())
+            flush()
         return segments
 
 
@@ -249,6 +260,19 @@ class Project(BaseModel):
     )
     track_list: list[Track] = Field(default_factory=list, alias="TrackList")
 
+    def to_bytes(self) -> bytes:
+        """Encode the project in the compact binary format of :mod:`libresvip.model.project_codec`."""
+        from libresvip.model.project_codec import encode_project
+
+        return encode_project(self)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> Project:
+        """Decode :meth:`to_bytes` output, skipping validation, so only pass trusted data."""
+        from libresvip.model.project_codec import decode_project
+
+        return decode_project(data, cls)
+
     @classmethod
     def merge_projects(cls, projects: list[Project]) -> Project:
         if len(projects) <= 1:
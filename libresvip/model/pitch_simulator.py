@@ -1,40 +1,27 @@
 import dataclasses
-import functools
 import itertools
-from typing import NamedTuple
+import math
 
 import more_itertools
-import portion
 
 from libresvip.core.constants import MIN_BREAK_LENGTH_BETWEEN_PITCH_SECTIONS
 from libresvip.core.exceptions import NotesOverlappedError
 from libresvip.core.tick_counter import find_bar_index
-from libresvip.core.time_interval import PiecewiseIntervalDict
+from libresvip.core.time_interval import PiecewiseFunction
 from libresvip.core.time_sync import TimeSynchronizer
 from libresvip.model.base import Note, ParamCurve, TimeSignature
 from libresvip.model.portamento import PortamentoPitch
-from libresvip.utils.music_math import linear_interpolation
 from libresvip.utils.translation import gettext_lazy as _
 
 
-class PitchIntervalSegment(NamedTuple):
-    start: float
-    end: float
-    start_value: int
-    end_value: int
-
-
 @dataclasses.dataclass
 class PitchSimulator:
     synchronizer: TimeSynchronizer
     portamento: PortamentoPitch
     note_list: dataclasses.InitVar[list[Note]]
     time_signature_list: dataclasses.InitVar[list[TimeSignature]]
-    interval_dict: PiecewiseIntervalDict = dataclasses.field(default_factory=PiecewiseIntervalDict)
-    pitch_interval_dict: PiecewiseIntervalDict | None = dataclasses.field(default=None)
-    pitch_interval_segments: list[PitchIntervalSegment] = dataclasses.field(default_factory=list)
-    pitch_interval_starts: list[float] = dataclasses.field(default_factory=list)
-    pitch_interval_ends: list[float] = dataclasses.field(default_factory=list)
+    interval_dict: PiecewiseFunction = dataclasses.field(default_factory=PiecewiseFunction)
+    pitch_interval_dict: PiecewiseFunction | None = dataclasses.field(default=None)
 
     def __post_init__(
         self, note_list: list[Note], time_signature_list: list[TimeSignature]
@@ -68,7 +55,7 @@ class PitchSimulator:
         )
         current_portamento = min(current_dur * max_portamento_percent, max_portamento_time)
 
-        self.interval_dict[portion.closedopen(0.0, current_head)] = current_note.key_number
+        self.interval_dict.set_constant(0.0, current_head, current_note.key_number)
         prev_portamento_end = current_head
         for next_note in note_list[1:]:
             if current_note.end_pos > next_note.start_pos:
@@ -89,8 +76,8 @@ class PitchSimulator:
             if self.portamento.vocaloid_mode and next_note.start_pos > current_note.end_pos:
                 current_tail = self.synchronizer.get_actual_secs_from_ticks(current_note.end_pos)
                 if prev_portamento_end < current_tail:
-                    self.interval_dict[portion.closedopen(prev_portamento_end, current_tail)] = (
-                        current_note.key_number
+                    self.interval_dict.set_constant(
+                        prev_portamento_end, current_tail, current_note.key_number
                     )
                 current_note = next_note
                 current_head = next_head
@@ -120,20 +107,18 @@ class PitchSimulator:
             else:
                 current_portamento_start = middle_time - max_portamento_time
                 current_portamento_end = middle_time + max_portamento_time
-            self.interval_dict[
-                portion.closedopen(prev_portamento_end, current_portamento_start)
-            ] = current_note.key_number
+            self.interval_dict.set_constant(
+                prev_portamento_end, current_portamento_start, current_note.key_number
+            )
             if current_note.key_number == next_note.key_number:
-                self.interval_dict[
-                    portion.closedopen(current_portamento_start, current_portamento_end)
-                ] = current_note.key_number
+                self.interval_dict.set_constant(
+                    current_portamento_start, current_portamento_end, current_note.key_number
+                )
             elif current_portamento_start < current_portamento_end:
-                self.interval_dict[
-                    portion.closedopen(current_portamento_start, current_portamento_end)
-                ] = functools.partial(  # type: ignore[call-arg]
+                self.interval_dict.set_portamento(
+                    (current_portamento_start, current_note.key_number),
+                    (current_portamento_end, next_note.key_number),
                     self.portamento.inter_func,
-                    start=(current_portamento_start, current_note.key_number),
-                    end=(current_portamento_end, next_note.key_number),
                 )
             current_note = next_note
             current_head = next_head
@@ -142,13 +127,10 @@ class PitchSimulator:
             prev_portamento_end = current_portamento_end
             if self.portamento.vocaloid_mode:
                 max_portamento_ticks, max_portamento_time = vocaloid_max_portamento(current_note)
-        self.interval_dict[portion.closedopen(prev_portamento_end, portion.inf)] = (
-            current_note.key_number
-        )
+        self.interval_dict.set_constant(prev_portamento_end, math.inf, current_note.key_number)
 
     def merge_pitch_curve(self, pitch_curve: ParamCurve, first_bar_length: int) -> None:
-        self.pitch_interval_dict = PiecewiseIntervalDict()
-        self.pitch_interval_segments = []
+        self.pitch_interval_dict = PiecewiseFunction()
         for point_part in more_itertools.split_at(
             pitch_curve.points.root, lambda point: point.y == -100
         ):
@@ -162,22 +144,9 @@ class PitchSimulator:
                     )
                     if start_time >= end_time:
                         continue
-                    interval = portion.closedopen(start_time, end_time)
-                    self.pitch_interval_dict[interval] = functools.partial(
-                        linear_interpolation,  # type: ignore[call-arg]
-                        start=(start_time, prev_point.y),
-                        end=(end_time, point.y),
-                    )
-                    self.pitch_interval_segments.append(
-                        PitchIntervalSegment(
-                            start=start_time,
-                            end=end_time,
-                            start_value=prev_point.y,
-                            end_value=point.y,
-                        )
+                    self.pitch_interval_dict.set_linear(
+                        (start_time, prev_point.y), (end_time, point.y)
                     )
-        self.pitch_interval_starts = [segment.start for segment in self.pitch_interval_segments]
-        self.pitch_interval_ends = [segment.end for segment in self.pitch_interval_segments]
 
     def pitch_at_ticks(self, ticks: int) -> float | None:
         return self.pitch_at_secs(self.synchronizer.get_actual_secs_from_ticks(ticks))
@@ -191,47 +160,27 @@ class PitchSimulator:
     def pitch_at_secs_batch(self, secs_list: list[float]) -> list[float | None]:
         if not secs_list:
             return []
-        if len(secs_list) == 1:
-            return [self.pitch_at_secs(secs_list[0])]
-        if any(current < previous for previous, current in itertools.pairwise(secs_list)):
-            return [self.pitch_at_secs(secs) for secs in secs_list]
-        return [self._pitch_at_secs_with_ordered_lookup(secs) for secs in secs_list]
+        base_values = self.interval_dict.get_many(secs_list)
+        override_values = (
+            self.pitch_interval_dict.get_many(secs_list)
+            if self.pitch_interval_dict is not None
+            else itertools.repeat(None)
+        )
+        return [
+            self._combine(override_value, base_value)
+            for override_value, base_value in zip(override_values, base_values)
+        ]
 
     def pitch_at_secs(self, secs: float) -> float | None:
-        return self._pitch_at_secs_with_ordered_lookup(secs)
-
-    def _pitch_at_secs_with_ordered_lookup(self, secs: float) -> float | None:
-        if (value := self._pitch_override_at_secs(secs)) is not None:
-            return value
-        if value := self.interval_dict.get(secs):
-            return value * 100
-        return None
-
-    def _pitch_override_at_secs(self, secs: float) -> float | None:
-        if self.pitch_interval_segments:
-            index = self._find_pitch_interval_index(secs)
-            if index is not None:
-                segment = self.pitch_interval_segments[index]
-                return linear_interpolation(
-                    secs,
-                    start=(segment.start, segment.start_value),
-                    end=(segment.end, segment.end_value),
-                )
-        if self.pitch_interval_dict is not None and (value := self.pitch_interval_dict.get(secs)):
-            return value
-        return None
+        return self._combine(
+            self.pitch_interval_dict.get(secs) if self.pitch_interval_dict is not None else None,
+            self.interval_dict.get(secs),
+        )
 
-    def _find_pitch_interval_index(self, secs: float) -> int | None:
-        if not self.pitch_interval_segments:
-            return None
-        left = 0
-        right = len(self.pitch_interval_segments) - 1
-        while left <= right:
-            middle = (left + right) // 2
-            if secs < self.pitch_interval_starts[middle]:
-                right = middle - 1
-            elif secs >= self.pitch_interval_ends[middle]:
-                left = middle + 1
-            else:
-                return middle
+    @staticmethod
+    def _combine(override_value: float | None, base_value: float | None) -> float | None:
+        if override_value is not None:
+            return override_value
+        if base_value:
+            return base_value * 100
         return None
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import abc
-from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
+import contextlib
+from array import array
+from collections.abc import MutableSequence
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, SupportsIndex, TypeVar, overload
+
+from pydantic_core import core_schema
+from typing_extensions import Self
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+
+    from pydantic import GetCoreSchemaHandler
 
 
 PointType = TypeVar("PointType")
@@ -23,6 +31,195 @@ class Point(NamedTuple):
         return cls(1073741823, value)
 
 
+def _int_column(values: Iterable[int]) -> array[int]:
+    values = values if isinstance(values, (list, tuple, array)) else list(values)
+    try:
+        return array("i", values)
+    except OverflowError:
+        with contextlib.suppress(TypeError):
+            return array("q", values)
+    except TypeError:
+        pass
+    return _int_column([round(value) for value in values])
+
+
+class PointColumns(MutableSequence[Point]):
+    """
+    A mutable sequence of points stored as two integer columns.
+
+    Behaves like ``list[Point]`` (items are materialized as ``Point`` on access)
+    while keeping the coordinates in ``array('i')`` buffers.
+    """
+
+    __slots__ = ("xs", "ys")
+
+    xs: array[int]
+    ys: array[int]
+
+    def __init__(self, points: Iterable[tuple[int, int]] = ()) -> None:
+        if isinstance(points, PointColumns):
+            self.xs = array(points.xs.typecode, points.xs)
+            self.ys = array(points.ys.typecode, points.ys)
+            return
+        pairs = points if isinstance(points, (list, tuple)) else list(points)
+        self.xs = _int_column([point[0] for point in pairs])
+        self.ys = _int_column([point[1] for point in pairs])
+
+    @classmethod
+    def from_columns(cls, xs: Iterable[int], ys: Iterable[int]) -> PointColumns:
+        columns = cls.__new__(cls)
+        columns.xs = xs if isinstance(xs, array) else _int_column(xs)
+        columns.ys = ys if isinstance(ys, array) else _int_column(ys)
+        if len(columns.xs) != len(columns.ys):
+            msg = "x and y columns must have the same length"
+            raise ValueError(msg)
+        return columns
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: type[Any], handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        list_schema = handler.generate_schema(list[Point])
+        from_list_schema = core_schema.no_info_after_validator_function(cls, list_schema)
+        return core_schema.json_or_python_schema(
+            json_schema=from_list_schema,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_list_schema]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.to_tuples,
+                return_schema=core_schema.list_schema(
+                    core_schema.tuple_schema([core_schema.int_schema(), core_schema.int_schema()])
+                ),
+            ),
+        )
+
+    def to_tuples(self) -> list[tuple[int, int]]:
+        return list(zip(self.xs, self.ys))
+
+    def _widen(self) -> None:
+        self.xs = array("q", self.xs)
+        self.ys = array("q", self.ys)
+
+    def _coerce(self, value: tuple[int, int]) -> tuple[int, int]:
+        # both coordinates are converted like the constructor does before either column
+        # changes, so a point that cannot be stored leaves the columns untouched
+        pair = _int_column(value)
+        x, y = pair
+        if pair.typecode != self.xs.typecode and self.xs.typecode == "i":
+            self._widen()
+        return x, y
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __iter__(self) -> Iterator[Point]:
+        return map(Point, self.xs, self.ys)
+
+    def __reversed__(self) -> Iterator[Point]:
+        return map(Point, reversed(self.xs), reversed(self.ys))
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Point: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> PointColumns: ...
+
+    def __getitem__(self, index: SupportsIndex | slice) -> Point | PointColumns:
+        if isinstance(index, slice):
+            return PointColumns.from_columns(self.xs[index], self.ys[index])
+        return Point(self.xs[index], self.ys[index])
+
+    @overload
+    def __setitem__(self, index: SupportsIndex, value: tuple[int, int]) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[tuple[int, int]]) -> None: ...
+
+    def __setitem__(self, index: SupportsIndex | slice, value: Any) -> None:
+        if isinstance(index, slice):
+            other = PointColumns(value)
+            if other.xs.typecode != self.xs.typecode:
+                if self.xs.typecode == "i":
+                    self._widen()
+                else:
+                    other._widen()
+            self.xs[index] = other.xs
+            self.ys[index] = other.ys
+            return
+        x, y = self._coerce(value)
+        self.xs[index], self.ys[index] = x, y
+
+    def __delitem__(self, index: SupportsIndex | slice) -> None:
+        del self.xs[index]
+        del self.ys[index]
+
+    def insert(self, index: SupportsIndex, value: tuple[int, int]) -> None:
+        x, y = self._coerce(value)
+        self.xs.insert(index, x)
+        self.ys.insert(index, y)
+
+    def append(self, value: tuple[int, int]) -> None:
+        self.insert(len(self.xs), value)
+
+    def extend(self, values: Iterable[tuple[int, int]]) -> None:
+        other = values if isinstance(values, PointColumns) else PointColumns(values)
+        if other.xs.typecode != self.xs.typecode:
+            if self.xs.typecode == "i":
+                self._widen()
+            else:
+                other = PointColumns.from_columns(array("q", other.xs), array("q", other.ys))
+        self.xs.extend(other.xs)
+        self.ys.extend(other.ys)
+
+    def clear(self) -> None:
+        del self.xs[:]
+        del self.ys[:]
+
+    def reverse(self) -> None:
+        self.xs.reverse()
+        self.ys.reverse()
+
+    def sort(self, /, *args: Any, **kwds: Any) -> None:
+        self[:] = sorted(self, *args, **kwds)
+
+    def copy(self) -> PointColumns:
+        return PointColumns(self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> PointColumns:
+        return self.copy()
+
+    def __add__(self, other: Iterable[tuple[int, int]]) -> PointColumns:
+        result = self.copy()
+        result.extend(other)
+        return result
+
+    def __radd__(self, other: Iterable[tuple[int, int]]) -> PointColumns:
+        result = PointColumns(other)
+        result.extend(self)
+        return result
+
+    def __iadd__(self, other: Iterable[tuple[int, int]]) -> Self:
+        self.extend(other)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PointColumns):
+            return self.xs == other.xs and self.ys == other.ys
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                point == other_point for point, other_point in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
 class PointList(abc.ABC, Generic[PointType]):
     root: list[PointType]
 
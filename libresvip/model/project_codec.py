@@ -0,0 +1,200 @@
+"""Versioned binary encoding of :class:`~libresvip.model.base.Project`.
+
+The payload is CBOR with string references, so repeated lyrics, singer names and
+other strings are stored once. Models are encoded as positional arrays and every
+curve as two delta-encoded little-endian integer columns. Decoding rebuilds the
+models with ``model_construct``, so it must only be fed data produced by
+:func:`encode_project`.
+"""
+
+from __future__ import annotations
+
+import itertools
+import operator
+import sys
+from array import array
+from typing import Any
+
+import cbor2
+
+from libresvip.model.base import (
+    InstrumentalTrack,
+    Note,
+    ParamCurve,
+    Params,
+    Phones,
+    Points,
+    Project,
+    SingingTrack,
+    SongTempo,
+    TimeSignature,
+    VibratoParam,
+)
+from libresvip.model.point import PointColumns
+
+MAGIC = b"LSVP"
+FORMAT_VERSION = 1
+
+_SINGING_TRACK = 0
+_INSTRUMENTAL_TRACK = 1
+_PARAM_NAMES = ("pitch", "volume", "breath", "gender", "strength")
+
+
+def _encode_column(values: array[int]) -> tuple[str, bytes]:
+    deltas = array("q", map(operator.sub, values, itertools.chain((0,), values)))
+    try:
+        column = array("i", deltas)
+    except OverflowError:
+        column = deltas
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.typecode, column.tobytes()
+
+
+def _decode_column(typecode: str, data: bytes) -> array[int]:
+    deltas = array(typecode)
+    deltas.frombytes(data)
+    if sys.byteorder == "big":
+        deltas.byteswap()
+    values = itertools.accumulate(deltas)
+    try:
+        return array("i", values)
+    except OverflowError:
+        return array("q", itertools.accumulate(deltas))
+
+
+def _encode_curve(curve: ParamCurve) -> list[Any]:
+    columns = curve.points.root
+    return [*_encode_column(columns.xs), *_encode_column(columns.ys)]
+
+
+def _decode_curve(data: list[Any]) -> ParamCurve:
+    x_typecode, xs, y_typecode, ys = data
+    return ParamCurve.model_construct(
+        points=Points.model_construct(
+            root=PointColumns.from_columns(
+                _decode_column(x_typecode, xs), _decode_column(y_typecode, ys)
+            )
+        )
+    )
+
+
+def _encode_note(note: Note) -> list[Any]:
+    phones = note.edited_phones
+    vibrato = note.vibrato
+    return [
+        note.start_pos,
+        note.length,
+        note.key_number,
+        note.head_tag,
+        note.lyric,
+        note.pronunciation,
+        None if phones is None else [phones.head_length_in_secs, phones.mid_ratio_over_tail],
+        None
+        if vibrato is None
+        else [
+            vibrato.start_percent,
+            vibrato.end_percent,
+            vibrato.is_anti_phase,
+            _encode_curve(vibrato.amplitude),
+            _encode_curve(vibrato.frequency),
+        ],
+    ]
+
+
+def _decode_note(data: list[Any]) -> Note:
+    start_pos, length, key_number, head_tag, lyric, pronunciation, phones, vibrato = data
+    return Note.model_construct(
+        start_pos=start_pos,
+        length=length,
+        key_number=key_number,
+        head_tag=head_tag,
+        lyric=lyric,
+        pronunciation=pronunciation,
+        edited_phones=None
+        if phones is None
+        else Phones.model_construct(head_length_in_secs=phones[0], mid_ratio_over_tail=phones[1]),
+        vibrato=None
+        if vibrato is None
+        else VibratoParam.model_construct(
+            start_percent=vibrato[0],
+            end_percent=vibrato[1],
+            is_anti_phase=vibrato[2],
+            amplitude=_decode_curve(vibrato[3]),
+            frequency=_decode_curve(vibrato[4]),
+        ),
+    )
+
+
+def _encode_track(track: SingingTrack | InstrumentalTrack) -> list[Any]:
+    common = [track.title, track.mute, track.solo, track.volume, track.pan]
+    if isinstance(track, SingingTrack):
+        return [
+            _SINGING_TRACK,
+            *common,
+            track.ai_singer_name,
+            track.reverb_preset,
+            [_encode_note(note) for note in track.note_list],
+            [_encode_curve(getattr(track.edited_params, name)) for name in _PARAM_NAMES],
+        ]
+    return [_INSTRUMENTAL_TRACK, *common, track.audio_file_path, track.offset]
+
+
+def _decode_track(data: list[Any]) -> SingingTrack | InstrumentalTrack:
+    kind, title, mute, solo, volume, pan, *rest = data
+    common = {"title": title, "mute": mute, "solo": solo, "volume": volume, "pan": pan}
+    if kind == _SINGING_TRACK:
+        ai_singer_name, reverb_preset, notes, curves = rest
+        return SingingTrack.model_construct(
+            **common,
+            ai_singer_name=ai_singer_name,
+            reverb_preset=reverb_preset,
+            note_list=[_decode_note(note) for note in notes],
+            edited_params=Params.model_construct(
+                **{name: _decode_curve(curve) for name, curve in zip(_PARAM_NAMES, curves)}
+            ),
+        )
+    elif kind == _INSTRUMENTAL_TRACK:
+        audio_file_path, offset = rest
+        return InstrumentalTrack.model_construct(
+            **common, audio_file_path=audio_file_path, offset=offset
+        )
+    msg = f"Unknown track kind {kind}"
+    raise ValueError(msg)
+
+
+def encode_project(project: Project) -> bytes:
+    payload = [
+        project.version,
+        [[tempo.position, tempo.bpm] for tempo in project.song_tempo_list],
+        [
+            [time_signature.bar_index, time_signature.numerator, time_signature.denominator]
+            for time_signature in project.time_signature_list
+        ],
+        [_encode_track(track) for track in project.track_list],
+    ]
+    return MAGIC + bytes((FORMAT_VERSION,)) + cbor2.dumps(payload, string_referencing=True)
+
+
+def decode_project(data: bytes | memoryview, cls: type[Project] = Project) -> Project:
+    header_size = len(MAGIC) + 1
+    if len(data) < header_size or bytes(data[: len(MAGIC)]) != MAGIC:
+        msg = "Not a binary LibreSVIP project"
+        raise ValueError(msg)
+    if data[len(MAGIC)] != FORMAT_VERSION:
+        msg = f"Unsupported binary project format version {data[len(MAGIC)]}"
+        raise ValueError(msg)
+    version, tempos, time_signatures, tracks = cbor2.loads(data[header_size:])
+    return cls.model_construct(
+        version=version,
+        song_tempo_list=[
+            SongTempo.model_construct(position=position, bpm=bpm) for position, bpm in tempos
+        ],
+        time_signature_list=[
+            TimeSignature.model_construct(
+                bar_index=bar_index, numerator=numerator, denominator=denominator
+            )
+            for bar_index, numerator, denominator in time_signatures
+        ],
+        track_list=[_decode_track(track) for track in tracks],
+    )
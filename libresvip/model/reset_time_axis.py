@@ -1,4 +1,5 @@
 import functools
+from array import array
 from collections.abc import Callable
 
 import more_itertools
@@ -15,6 +16,7 @@ from libresvip.model.base import (
     SongTempo,
     TimeSignature,
 )
+from libresvip.model.point import PointColumns
 
 
 def _update_curve_points_position(
@@ -23,14 +25,21 @@ def _update_curve_points_position(
     ori_first_bar_ticks: int,
     new_first_bar_ticks: int,
     limit_func: Callable[[int], bool] | None = None,
+    batch_func: Callable[[list[int]], list[float]] | None = None,
 ) -> ParamCurve:
+    xs, ys = curve.points.root.xs, curve.points.root.ys
+    offsets = [x - ori_first_bar_ticks for x in xs]
+    if limit_func is not None:
+        kept_indexes = [i for i, offset in enumerate(offsets) if limit_func(offset)]
+        offsets = [offsets[i] for i in kept_indexes]
+        ys = array(ys.typecode, [ys[i] for i in kept_indexes])
+    new_xs = batch_func(offsets) if batch_func is not None else map(func, offsets)
     return ParamCurve(
         points=Points(
-            root=[
-                point._replace(x=round(func(point.x - ori_first_bar_ticks)) + new_first_bar_ticks)
-                for point in curve.points.root
-                if limit_func is None or limit_func(point.x - ori_first_bar_ticks)
-            ]
+            root=PointColumns.from_columns(
+                [round(new_x) + new_first_bar_ticks for new_x in new_xs],
+                array(ys.typecode, ys),
+            )
         )
     )
 
@@ -45,6 +54,7 @@ def reset_time_axis(project: Project, tempo: float = DEFAULT_BPM) -> Project:
     update_curve_points_position = functools.partial(
         _update_curve_points_position,
         func=synchronizer.get_actual_ticks_from_ticks,
+        batch_func=synchronizer.get_actual_ticks_from_ticks_batch,
         new_first_bar_ticks=round(new_time_signature.bar_length()),
         ori_first_bar_ticks=round(project.time_signature_list[0].bar_length()),
     )
@@ -58,9 +68,15 @@ def reset_time_axis(project: Project, tempo: float = DEFAULT_BPM) -> Project:
             )
         elif isinstance(track, SingingTrack):
             new_note_list = []
-            for note in track.note_list:
-                note_end = round(synchronizer.get_actual_ticks_from_ticks(note.end_pos))
-                note_start = round(synchronizer.get_actual_ticks_from_ticks(note.start_pos))
+            note_starts = synchronizer.get_actual_ticks_from_ticks_batch(
+                [note.start_pos for note in track.note_list]
+            )
+            note_ends = synchronizer.get_actual_ticks_from_ticks_batch(
+                [note.end_pos for note in track.note_list]
+            )
+            for note, actual_start, actual_end in zip(track.note_list, note_starts, note_ends):
+                note_end = round(actual_end)
+                note_start = round(actual_start)
                 new_note_list.append(
                     note.model_copy(
                         update={"start_pos": note_start, "length": note_end - note_start}
@@ -10,11 +10,11 @@ import more_itertools
 import portion
 
 from libresvip.core.tick_counter import shift_tempo_list
-from libresvip.core.time_interval import PiecewiseIntervalDict
+from libresvip.core.time_interval import PiecewiseFunction
 from libresvip.core.time_sync import TimeSynchronizer
 from libresvip.core.warning_types import show_warning
 from libresvip.model.base import ParamCurve, Points, SongTempo
-from libresvip.model.point import Point
+from libresvip.model.point import Point, PointColumns
 from libresvip.utils.music_math import hz2midi, midi2hz
 from libresvip.utils.search import find_last_index
 from libresvip.utils.translation import gettext_lazy as _
@@ -92,10 +92,12 @@ def pitch_from_techno_speech_track(data: TechnoSpeechTrackPitchData) -> ParamCur
         )
     )
 
+    positions = [int(cast("float", event.idx)) - data.tick_prefix for event in events_normalized]
+    secs_list = synchronizer.get_actual_secs_from_ticks_batch(positions)
+    # the vibrato rarely covers an event, so only the first sample of each is looked up in bulk
+    value_diffs = vibrato_value_interval_dict.get_many(secs_list)
     next_pos = None
-    for event in events_normalized:
-        pos = int(cast("float", event.idx)) - data.tick_prefix
-        secs = synchronizer.get_actual_secs_from_ticks(pos)
+    for event, pos, secs, value_diff in zip(events_normalized, positions, secs_list, value_diffs):
         length = event.repeat
         try:
             value = round(hz2midi(math.e**event.value) * 100) if event.value is not None else -100
@@ -104,20 +106,25 @@ def pitch_from_techno_speech_track(data: TechnoSpeechTrackPitchData) -> ParamCur
                 if value == -100:
                     converted_points.append(Point(x=round(pos), y=value))
                 current_value = value
-            secs_step = synchronizer.get_duration_secs_from_ticks(pos, pos + 5)
-            for pos_x in range(pos, int(cast("float", pos + length)), 5):
-                if value_diff := vibrato_value_interval_dict.get(secs):
-                    value_diff *= vibrato_amplitude_interval_dict.get(secs, 1)
+            if value_diff and pos < int(cast("float", pos + length)):
+                secs_step = synchronizer.get_duration_secs_from_ticks(pos, pos + 5)
+                for pos_x in range(pos, int(cast("float", pos + length)), 5):
+                    if pos_x != pos and not (value_diff := vibrato_value_interval_dict.get(secs)):
+                        break
+                    # segments closing a continuous part hold None, which reads as unset
+                    if (amplitude := vibrato_amplitude_interval_dict.get(secs)) is None:
+                        amplitude = 1
+                    value_diff *= amplitude
                     converted_points.append(Point(x=pos_x, y=round(value + value_diff)))
-                else:
-                    break
-                secs += secs_step
+                    secs += secs_step
         except OverflowError:
             show_warning(_("Pitch value is out of bounds"))
         next_pos = pos + length
     converted_points.append(Point.end_point())
 
-    return ParamCurve(points=Points(root=converted_points)) if len(converted_points) > 2 else None
+    if len(converted_points) <= 2:
+        return None
+    return ParamCurve(points=Points(root=PointColumns(converted_points)))
 
 
 def append_ending_points(
@@ -150,23 +157,22 @@ def normalize_to_tick(
     current_tempo_index = 0
     next_pos = 0.0
     next_tick_pos = 0.0
-    for _event in events:
-        event = TechnoSpeechParamEventFloat.from_event(_event)
-        pos = event.idx if event.idx is not None else next_pos
-        if event.idx is None:
+    for event in events:
+        idx = float(event.idx) if event.idx is not None else None
+        pos = idx if idx is not None else next_pos
+        if idx is None:
             tick_pos = next_tick_pos
         else:
             while (
-                current_tempo_index + 1 < len(tempos)
-                and tempos[current_tempo_index + 1][0] <= event.idx
+                current_tempo_index + 1 < len(tempos) and tempos[current_tempo_index + 1][0] <= idx
             ):
                 current_tempo_index += 1
             ticks_in_time_unit = TIME_UNIT_AS_TICKS_PER_BPM * tempos[current_tempo_index][2]
             tick_pos = (
                 tempos[current_tempo_index][1]
-                + (event.idx - tempos[current_tempo_index][0]) * ticks_in_time_unit
+                + (idx - tempos[current_tempo_index][0]) * ticks_in_time_unit
             )
-        repeat = event.repeat if event.repeat is not None else 1.0
+        repeat = float(event.repeat) if event.repeat is not None else 1.0
         remaining_repeat = repeat
         repeat_in_ticks = 0.0
         while (
@@ -186,16 +192,13 @@ def normalize_to_tick(
         next_pos = pos + repeat
         next_tick_pos = tick_pos + repeat_in_ticks
         events_normalized.append(
-            TechnoSpeechParamEventFloat(tick_pos, repeat_in_ticks, event.value)
-        )
-    return [
-        TechnoSpeechParamEventFloat(
-            tick.idx + tick_prefix,
-            tick.repeat,
-            tick.value if tick.value != TEMP_VALUE_AS_NULL else None,
+            TechnoSpeechParamEventFloat(
+                tick_pos + tick_prefix,
+                repeat_in_ticks,
+                event.value if event.value != TEMP_VALUE_AS_NULL else None,
+            )
         )
-        for tick in events_normalized
-    ]
+    return events_normalized
 
 
 def shape_events(
@@ -237,8 +240,8 @@ def build_param_interval_dict(
     synchronizer: TimeSynchronizer,
     tick_prefix: int,
     expanded_tempos: list[tuple[int, int, float]] | None = None,
-) -> PiecewiseIntervalDict:
-    param_interval_dict = PiecewiseIntervalDict()
+) -> PiecewiseFunction:
+    param_interval_dict = PiecewiseFunction()
     for continuous_part in _normalized_continuous_parts(
         events, synchronizer, tick_prefix, expanded_tempos
     ):
@@ -275,8 +278,8 @@ def build_wave_interval_dict(
     synchronizer: TimeSynchronizer,
     tick_prefix: int,
     expanded_tempos: list[tuple[int, int, float]] | None = None,
-) -> PiecewiseIntervalDict:
-    param_interval_dict = PiecewiseIntervalDict()
+) -> PiecewiseFunction:
+    param_interval_dict = PiecewiseFunction()
     omega = math.tau * 6
     for continuous_part in _normalized_continuous_parts(
         events, synchronizer, tick_prefix, expanded_tempos
@@ -317,17 +320,21 @@ def generate_for_techno_speech(
     pitch: ParamCurve, tempos: list[SongTempo], tick_prefix: int
 ) -> TechnoSpeechTrackPitchData | None:
     events_with_full_params = []
-    for i, this_point in enumerate(pitch.points.root):
-        next_point = pitch.points[i + 1] if i + 1 < len(pitch.points) else None
+    # dense curves repeat the same few hundred cent values, so each is converted once
+    log_f0_values: dict[int, float] = {}
+    points = pitch.points.root
+    for this_point, next_point in itertools.zip_longest(points, itertools.islice(points, 1, None)):
+        if this_point.y == -100 or (next_point is not None and next_point.y == -100):
+            continue
         end_tick = next_point.x - tick_prefix if next_point else None
         index = this_point.x - tick_prefix
         repeat = end_tick - index if end_tick else 1
         repeat = max(repeat, 1)
-        value = math.log(midi2hz(this_point.y / 100)) if this_point.y != -100 else None
-        if value is not None and (next_point is None or next_point.y != -100):
-            events_with_full_params.append(
-                TechnoSpeechParamEventFloat(float(index), float(repeat), value)
-            )
+        if (value := log_f0_values.get(this_point.y)) is None:
+            value = log_f0_values[this_point.y] = math.log(midi2hz(this_point.y / 100))
+        events_with_full_params.append(
+            TechnoSpeechParamEventFloat(float(index), float(repeat), value)
+        )
     are_events_connected_to_next = [
         this_event.idx + this_event.repeat >= next_event.idx if next_event else False
         for this_event, next_event in zip(
@@ -355,28 +362,19 @@ def denormalize_from_tick(
         if expanded_tempos is not None
         else expand(shift_tempo_list(tempos_in_ticks, tick_prefix), tick_prefix)
     )
-    events_with_full_params = [
-        event if event.idx is None else event._replace(idx=event.idx + tick_prefix)
-        for event in events_with_full_params
-    ]
     events = []
     current_tempo_index = 0
-    tick_pos = None
     for event_double in events_with_full_params:
-        if event_double.idx is not None:
-            tick_pos = event_double.idx
-        if tick_pos is None or event_double.idx is None:
+        if event_double.idx is None:
             msg = "Invalid event"
             raise ValueError(msg)
+        tick_pos = event_double.idx + tick_prefix
         while (
             current_tempo_index + 1 < len(tempos) and tempos[current_tempo_index + 1][1] < tick_pos
         ):
             current_tempo_index += 1
-        ticks_per_time_unit = tempos[current_tempo_index][2] * TIME_UNIT_AS_TICKS_PER_BPM
-        pos = (
-            tempos[current_tempo_index][0]
-            + (event_double.idx - tempos[current_tempo_index][1]) / ticks_per_time_unit
-        )
+        tempo_pos, tempo_tick_pos, bpm = tempos[current_tempo_index]
+        pos = tempo_pos + (tick_pos - tempo_tick_pos) / (bpm * TIME_UNIT_AS_TICKS_PER_BPM)
         repeat_in_ticks = event_double.repeat
         repeat = 0.0
         while (current_tempo_index + 1 < len(tempos)) and (
@@ -398,14 +396,19 @@ def restore_connection(
     events: list[TechnoSpeechParamEvent], are_events_connected_to_next: list[bool]
 ) -> list[TechnoSpeechParamEvent]:
     new_events = []
-    for (prev_event, next_event), is_connected_to_next in zip(
-        more_itertools.windowed(itertools.chain(events, [None]), 2),
+    for prev_event, next_event, is_connected_to_next in zip(
+        events,
+        itertools.chain(itertools.islice(events, 1, None), [None]),
         are_events_connected_to_next,
     ):
         if next_event is None or not is_connected_to_next:
             new_events.append(prev_event)
         else:
-            new_events.append(prev_event._replace(repeat=next_event.idx - prev_event.idx))
+            new_events.append(
+                TechnoSpeechParamEvent(
+                    prev_event.idx, next_event.idx - prev_event.idx, prev_event.value
+                )
+            )
     return new_events
 
 
@@ -450,7 +453,7 @@ def remove_redundant_index(
                 and prev_event.repeat is not None
                 and prev_event.idx + prev_event.repeat == event.idx
             ):
-                new_events.append(event._replace(idx=None))
+                new_events.append(TechnoSpeechParamEvent(None, event.repeat, event.value))
             else:
                 new_events.append(event)
     return new_events
@@ -459,7 +462,10 @@ def remove_redundant_index(
 def remove_redundant_repeat(
     events: list[TechnoSpeechParamEvent],
 ) -> list[TechnoSpeechParamEvent]:
-    return [event if event.repeat > 1 else event._replace(repeat=None) for event in events]
+    return [
+        event if event.repeat > 1 else TechnoSpeechParamEvent(event.idx, None, event.value)
+        for event in events
+    ]
 
 
 def _normalized_continuous_parts(
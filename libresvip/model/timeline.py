@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from libresvip.model.base import Note, SongTempo
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+T = TypeVar("T")
+
+
+class TimelineIndex(Generic[T]):
+    """Bisection lookups over ``items``, which must be sorted by ``keys``.
+
+    ``keys`` is any sequence supporting ``bisect``, such as the ``xs`` column of a
+    :class:`~libresvip.model.point.PointColumns`, so it is used as is without a copy.
+    Indices follow the ``find_index`` convention of ``-1`` when nothing matches.
+    """
+
+    def __init__(self, items: Sequence[T], keys: Sequence[float]) -> None:
+        self.items = items
+        self.keys = keys
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def last_index_at(self, position: float) -> int:
+        """Index of the last item whose key is at or before ``position``."""
+        return bisect.bisect_right(self.keys, position) - 1
+
+    def first_index_at(self, position: float) -> int:
+        """Index of the first item whose key is at or after ``position``."""
+        index = bisect.bisect_left(self.keys, position)
+        return index if index < len(self.keys) else -1
+
+    def first_index_after(self, position: float) -> int:
+        """Index of the first item whose key is after ``position``."""
+        index = bisect.bisect_right(self.keys, position)
+        return index if index < len(self.keys) else -1
+
+    def items_between(self, start: float, end: float) -> Sequence[T]:
+        """Items whose key lies within ``[start, end)``."""
+        return self.items[bisect.bisect_left(self.keys, start) : bisect.bisect_left(self.keys, end)]
+
+    def item_at(self, position: float) -> T | None:
+        """The last item whose key is at or before ``position``."""
+        index = self.last_index_at(position)
+        return self.items[index] if index >= 0 else None
+
+    def cursor(self) -> TimelineCursor[T]:
+        return TimelineCursor(self)
+
+
+class TimelineCursor(Generic[T]):
+    """Answers the lookups of a :class:`TimelineIndex` for non-decreasing positions.
+
+    Each lookup resumes where the previous one stopped, so a sorted sweep over the
+    timeline costs amortized constant time per lookup. Going back falls back to bisection.
+    """
+
+    def __init__(self, timeline: TimelineIndex[T]) -> None:
+        self.timeline = timeline
+        self._last_at = 0
+        self._first_at = 0
+
+    def last_index_at(self, position: float) -> int:
+        keys = self.timeline.keys
+        index = self._last_at
+        if index and keys[index - 1] > position:
+            index = bisect.bisect_right(keys, position)
+        while index < len(keys) and keys[index] <= position:
+            index += 1
+        self._last_at = index
+        return index - 1
+
+    def first_index_at(self, position: float) -> int:
+        keys = self.timeline.keys
+        index = self._first_at
+        if index and keys[index - 1] >= position:
+            index = bisect.bisect_left(keys, position)
+        while index < len(keys) and keys[index] < position:
+            index += 1
+        self._first_at = index
+        return index if index < len(keys) else -1
+
+
+class NoteTimeline(TimelineIndex[Note]):
+    """Notes sorted by ``start_pos``, which may overlap each other."""
+
+    def __init__(self, notes: Sequence[Note]) -> None:
+        super().__init__(notes, [note.start_pos for note in notes])
+        # running maximum of the end positions, the only monotone bound overlapping notes have
+        self._max_ends = list(itertools.accumulate((note.end_pos for note in notes), max))
+
+    def note_at(self, tick: float) -> Note | None:
+        """The last note started by ``tick``, unless it has already ended."""
+        if (note := self.item_at(tick)) is not None and tick < note.end_pos:
+            return note
+        return None
+
+    def overlapping(self, start: float, end: float) -> list[Note]:
+        """Notes sounding somewhere within ``[start, end)``, in timeline order."""
+        lo = bisect.bisect_right(self._max_ends, start)
+        hi = bisect.bisect_left(self.keys, end)
+        return [note for note in self.items[lo:hi] if note.end_pos > start]
+
+
+class TempoTimeline(TimelineIndex[SongTempo]):
+    """Tempo changes sorted by ``position``."""
+
+    def __init__(self, tempos: Sequence[SongTempo]) -> None:
+        super().__init__(tempos, [tempo.position for tempo in tempos])
+
+    def tempo_at(self, tick: float) -> SongTempo:
+        """The tempo in effect at ``tick``, the first one if ``tick`` precedes every change."""
+        index = self.last_index_at(tick)
+        return self.items[max(index, 0)]
@@ -1,4 +1,6 @@
+import bisect
 import operator
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
 from libresvip.model.point import Point
@@ -18,42 +20,58 @@ class ControllerCurve:
     min_value: int = -127
     max_value: int = 127
 
+    _positions: list[int] = field(init=False, repr=False, compare=False, default_factory=list)
+    _values: list[int] = field(init=False, repr=False, compare=False, default_factory=list)
+
     def __post_init__(self) -> None:
         if self.events:
             object.__setattr__(self, "events", sorted(self.events, key=operator.attrgetter("pos")))
+        self._positions = [event.pos for event in self.events]
+        self._values = [event.value for event in self.events]
 
     def get_value_at(self, pos: int) -> int:
-        current_value = self.default_value
-        for event in self.events:
-            if event.pos <= pos:
-                current_value = event.value
+        index = bisect.bisect_right(self._positions, pos)
+        return self._values[index - 1] if index else self.default_value
+
+    def combine(self, other: "ControllerCurve") -> Iterator[tuple[int, int, int]]:
+        """Yield ``(pos, value, other_value)`` at every event position of either curve."""
+        positions, values = self._positions, self._values
+        other_positions, other_values = other._positions, other._values
+        i = j = 0
+        value, other_value = self.default_value, other.default_value
+        while i < len(positions) or j < len(other_positions):
+            if j == len(other_positions) or (
+                i < len(positions) and positions[i] <= other_positions[j]
+            ):
+                pos = positions[i]
             else:
-                break
-        return current_value
+                pos = other_positions[j]
+            while i < len(positions) and positions[i] == pos:
+                value = values[i]
+                i += 1
+            while j < len(other_positions) and other_positions[j] == pos:
+                other_value = other_values[j]
+                j += 1
+            yield pos, value, other_value
+
+    def _slice(self, start_pos: int | None, end_pos: int | None) -> slice:
+        return slice(
+            0 if start_pos is None else bisect.bisect_left(self._positions, start_pos),
+            len(self._positions)
+            if end_pos is None
+            else bisect.bisect_right(self._positions, end_pos),
+        )
 
     def get_value_range(self, start_pos: int, end_pos: int) -> list[tuple[int, int]]:
-        result = []
-
-        for event in self.events:
-            if event.pos > end_pos:
-                break
-            if event.pos >= start_pos:
-                result.append((event.pos, event.value))
-
-        return result
+        index_range = self._slice(start_pos, end_pos)
+        return list(zip(self._positions[index_range], self._values[index_range]))
 
     def to_points(self, start_pos: int | None = None, end_pos: int | None = None) -> list[Point]:
-        points = []
-
-        for i, event in enumerate(self.events):
-            if start_pos is not None and event.pos < start_pos:
-                continue
-            if end_pos is not None and event.pos > end_pos:
-                break
-
-            points.append(Point(x=event.pos, y=event.value))
-
-        return points
+        index_range = self._slice(start_pos, end_pos)
+        return [
+            Point(x=pos, y=value)
+            for pos, value in zip(self._positions[index_range], self._values[index_range])
+        ]
 
     def to_interpolated_points(self, step: int = 5) -> list[Point]:
         if not self.events:
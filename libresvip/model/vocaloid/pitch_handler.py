@@ -3,7 +3,7 @@ import operator
 from dataclasses import dataclass
 
 from libresvip.core.constants import MIN_BREAK_LENGTH_BETWEEN_PITCH_SECTIONS
-from libresvip.core.time_interval import PiecewiseIntervalDict
+from libresvip.core.time_interval import PiecewiseFunction
 from libresvip.core.time_sync import TimeSynchronizer
 from libresvip.model.base import Note, ParamCurve, TimeSignature
 from libresvip.model.pitch_simulator import PitchSimulator
@@ -45,21 +45,9 @@ class VocaloidPitchHandler:
     def combine_pit_pbs(
         self, pit: ControllerCurve, pbs: ControllerCurve
     ) -> list[tuple[int, float]]:
-        all_positions = sorted({e.pos for e in pit.events} | {e.pos for e in pbs.events})
-
-        if not all_positions:
-            return []
-
         result = []
-        current_pbs = DEFAULT_PITCH_BEND_SENSITIVITY
-
-        for pos in all_positions:
-            pbs_value = pbs.get_value_at(pos)
-            if pbs_value is not None:
-                current_pbs = max(1, min(pbs_value, MAX_PITCH_BEND_SENSITIVITY))
-
-            pit_value = pit.get_value_at(pos)
-
+        for pos, pit_value, pbs_value in pit.combine(pbs):
+            current_pbs = max(1, min(pbs_value, MAX_PITCH_BEND_SENSITIVITY))
             denominator = PITCH_MAX_VALUE if pit_value > 0 else (PITCH_MAX_VALUE + 1)
             pitch_cents = (pit_value / denominator) * current_pbs * 100
 
@@ -71,8 +59,8 @@ class VocaloidPitchHandler:
         self,
         pitch_data_list: list[PitchBendData],
         part_offsets: list[int] | None = None,
-        vibrato_rate_interval_dict: PiecewiseIntervalDict | None = None,
-        vibrato_depth_interval_dict: PiecewiseIntervalDict | None = None,
+        vibrato_rate_interval_dict: PiecewiseFunction | None = None,
+        vibrato_depth_interval_dict: PiecewiseFunction | None = None,
         part_start_ticks: list[int] | None = None,
         part_end_ticks: list[int] | None = None,
     ) -> ParamCurve | None:
@@ -126,8 +114,8 @@ class VocaloidPitchHandler:
     def _apply_vibrato(
         self,
         pitch: ParamCurve,
-        vibrato_rate_interval_dict: PiecewiseIntervalDict | None,
-        vibrato_depth_interval_dict: PiecewiseIntervalDict | None,
+        vibrato_rate_interval_dict: PiecewiseFunction | None,
+        vibrato_depth_interval_dict: PiecewiseFunction | None,
         part_offsets: list[int],
         part_start_ticks: list[int] | None,
         part_end_ticks: list[int] | None,
@@ -3,9 +3,9 @@ from importlib.resources import files
 
 from pydantic_core import from_json
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
+from libresvip.utils.jsonutils import dump_model_json
 
 from .ace_generator import AceMobileGenerator
 from .ace_parser import AceMobileParser
@@ -39,12 +39,4 @@ class AceMobileConverter(plugin_base.SVSConverter):
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
         options_obj = cls.output_option_cls.model_validate(options)
         ace_project = AceMobileGenerator(options_obj).generate_project(project)
-        dump_kwargs = {"indent": 2} if options_obj.indented else {"separators": (",", ":")}
-        path.write_text(
-            json.dumps(
-                ace_project.model_dump(mode="json", by_alias=True, exclude_none=True),
-                ensure_ascii=False,
-                **dump_kwargs,
-            ),
-            encoding="utf-8",
-        )
+        path.write_bytes(dump_model_json(ace_project, indent=2 if options_obj.indented else None))
@@ -8,7 +8,12 @@ from libresvip.model.base import Project
 
 from .ace_studio_generator import AceGenerator
 from .ace_studio_parser import AceParser
-from .acep_io import ZSTD_AVAILABLE, compress_ace_studio_project, decompress_ace_studio_project
+from .acep_io import (
+    ACET_MAGIC,
+    ZSTD_AVAILABLE,
+    compress_ace_studio_project,
+    decompress_ace_studio_project,
+)
 from .model import AcepProject
 from .options import InputOptions, OutputOptions
 
@@ -25,22 +30,33 @@ class ACEStudioConverter(plugin_base.SVSConverter):
 
     @classmethod
     def load(cls, path: pathlib.Path, options: plugin_base.OptionsDict) -> Project:
-        if path.suffix == ".acet":
-            zip_path = zipfile.Path(io.BytesIO(path.read_bytes()))
+        return cls.loads(path.read_bytes(), options)
+
+    @classmethod
+    def loads(
+        cls, content: plugin_base.ProjectContent, options: plugin_base.OptionsDict
+    ) -> Project:
+        if content[:4] == ACET_MAGIC:
+            # .acet templates are zip archives wrapping a single .acep project
+            zip_path = zipfile.Path(io.BytesIO(content))
             for item in zip_path.iterdir():
                 if item.name.endswith(".acep"):
-                    path = item
+                    content = item.read_bytes()
                     break
-        obj = decompress_ace_studio_project(path)
-        acep_project = AcepProject.model_validate(obj, context={"path": path})
+        obj = decompress_ace_studio_project(content)
+        acep_project = AcepProject.model_validate(obj)
         return AceParser(options=cls.input_option_cls.model_validate(options)).parse_project(
             acep_project
         )
 
     @classmethod
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
+        path.write_bytes(cls.dumps(project, options))
+
+    @classmethod
+    def dumps(cls, project: Project, options: plugin_base.OptionsDict) -> bytes:
         options_obj = cls.output_option_cls.model_validate(options)
         ace_project = AceGenerator(options=options_obj).generate_project(project)
-        compress_ace_studio_project(
-            ace_project.model_dump(mode="json", by_alias=True), path, options_obj.serialization
+        return compress_ace_studio_project(
+            ace_project.model_dump(mode="json", by_alias=True), options_obj.serialization
         )
@@ -346,16 +346,20 @@ class AceGenerator:
                 tick += tick_step
             pos = ace_curve.offset
             curve_limit = min(right_bound - self.pattern_start, curve_end)
+            ticks = []
             while pos < curve_limit:
-                second = self.synchronizer.get_actual_secs_from_ticks(
-                    round(tick - self.first_bar_ticks)
-                )
-                ace_curve.values.append(
-                    self.get_value_from_segment(segment, tick) / 100
-                    - base_pitch.semitone_value_at(second)
-                )
+                ticks.append(tick)
                 pos += 1
                 tick += tick_step
+            base_values = base_pitch.semitone_values_at(
+                self.synchronizer.get_actual_secs_from_ticks_batch(
+                    [round(tick - self.first_bar_ticks) for tick in ticks]
+                )
+            )
+            ace_curve.values.extend(
+                self.get_value_from_segment(segment, tick) / 100 - base_value
+                for tick, base_value in zip(ticks, base_values)
+            )
             ace_curves.root.append(ace_curve)
         return ace_curves
 
@@ -409,23 +409,27 @@ class AceParser:
             for ace_curve in ace_curves.root:
                 pos = ace_curve.offset
                 curve.points.append(Point(pos + self.first_bar_ticks, -100))
-                for value in ace_curve.values:
-                    if ace_curve.curve_type == "anchor":
+                if ace_curve.curve_type == "anchor":
+                    for value in ace_curve.values:
                         curve.points.append(Point(pos + self.first_bar_ticks, round(value * 100)))
-                    elif value is not None and not math.isnan(value):
-                        abs_semitone = (
-                            base_pitch.semitone_value_at(
-                                self.synchronizer.get_actual_secs_from_ticks(pos)
-                            )
-                            + value
-                        )
-                        curve.points.append(
-                            Point(
-                                pos + self.first_bar_ticks,
-                                round(abs_semitone * 100),
-                            )
+                        pos += 1
+                else:
+                    positions = [
+                        pos + i
+                        for i, value in enumerate(ace_curve.values)
+                        if value is not None and not math.isnan(value)
+                    ]
+                    base_values = base_pitch.semitone_values_at(
+                        self.synchronizer.get_actual_secs_from_ticks_batch(positions)
+                    )
+                    curve.points.extend(
+                        Point(
+                            value_pos + self.first_bar_ticks,
+                            round((base_value + ace_curve.values[value_pos - pos]) * 100),
                         )
-                    pos += 1
+                        for value_pos, base_value in zip(positions, base_values)
+                    )
+                    pos += len(ace_curve.values)
                 curve.points.append(Point(pos - 1 + self.first_bar_ticks, -100))
         curve.points.append(Point.end_point())
         if self.options.curve_sample_interval > 0:
@@ -1,7 +1,6 @@
 import contextlib
 import hashlib
 import importlib
-import pathlib
 import sys
 from typing import Any
 
@@ -53,6 +52,7 @@ else:
     ZSTD_AVAILABLE = False
 
 ACEP2_MAGIC = b"ACEP2"
+ACET_MAGIC = b"PK\x03\x04"
 ACEP2_FLAG = 0x01
 
 
@@ -134,8 +134,7 @@ def decrypt_acep_content_v2(content: bytes, salt: str) -> bytes:
     return decrypted
 
 
-def decompress_ace_studio_project(src: pathlib.Path) -> dict[str, Any]:
-    content = src.read_bytes()
+def decompress_ace_studio_project(content: bytes | memoryview) -> dict[str, Any]:
     if content[:5] == ACEP2_MAGIC:
         result = Acep2File.parse(content)
         decompressed = zstd.decompress(result.compressed_content)
@@ -143,7 +142,7 @@ def decompress_ace_studio_project(src: pathlib.Path) -> dict[str, Any]:
             decompressed = bytes(decompressed)
         return cbor2.loads(decompressed)
     else:
-        acep_file = AcepFile.model_validate_json(content.decode("utf-8"))
+        acep_file = AcepFile.model_validate_json(str(content, "utf-8"))
         if acep_file.version == 1:
             content = decrypt_acep_content_v1(acep_file.content)
         elif acep_file.version == 2:
@@ -156,9 +155,7 @@ def decompress_ace_studio_project(src: pathlib.Path) -> dict[str, Any]:
         return json.loads(decompressed)
 
 
-def compress_ace_studio_project(
-    src: dict[str, Any], target: pathlib.Path, serialization: AcepSerialization
-) -> None:
+def compress_ace_studio_project(src: dict[str, Any], serialization: AcepSerialization) -> bytes:
     if serialization == AcepSerialization.JSON:
         raw_content = json.dumps(src).encode()
         compressed = zstd.compress(raw_content)
@@ -189,4 +186,4 @@ def compress_ace_studio_project(
                 "compressed_content": compressed,
             }
         )
-    target.write_bytes(content)
+    return content
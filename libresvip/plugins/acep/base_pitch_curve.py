@@ -1,16 +1,22 @@
 import dataclasses
 import functools
+import itertools
 import math
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
-import portion
 from more_itertools import convolve
 
-from libresvip.core.time_interval import PiecewiseIntervalDict
+from libresvip.core.time_interval import PiecewiseFunction
 from libresvip.core.time_sync import TimeSynchronizer
-from libresvip.utils.music_math import linear_interpolation
 
-from .model import AcepNote, AcepVibrato
+from .model import AcepNote
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+KERNEL_RADIUS = 59
 
 
 @dataclasses.dataclass
@@ -20,32 +26,38 @@ class NoteInSeconds:
     end: float = 0.0
 
 
-def _convolve(note_list: list[NoteInSeconds]) -> list[float]:
-    total_points = round(1000 * (note_list[-1].end + 0.12)) + 1
-    init_values = [0.0] * total_points
-    note_index = 0
-    for i in range(total_points):
-        init_values[i] = note_list[note_index].semitone
-        if note_index < len(note_list) - 1:
-            ts = 0.001 * i
-            if ts >= 0.5 * (note_list[note_index].end + note_list[note_index + 1].start):
-                note_index += 1
-    kernel = [0.0] * 119
-    for i in range(119):
-        ts = 0.001 * (i - 59)
-        kernel[i] = math.cos(math.pi * ts / 0.12)
+def _note_spans(note_list: list[NoteInSeconds], total_points: int) -> Iterable[tuple[int, int]]:
+    # each millisecond sample takes the current note, then moves on to the next
+    # one once the midpoint between them is reached, at most one note per sample
+    span_start = 0
+    for note, next_note in itertools.pairwise(note_list):
+        boundary = 0.5 * (note.end + next_note.start)
+        last_index = max(span_start, math.ceil(boundary * 1000) - 1)
+        while 0.001 * last_index < boundary:
+            last_index += 1
+        span_end = min(last_index + 1, total_points)
+        yield span_start, span_end
+        span_start = span_end
+    yield span_start, total_points
+
+
+@functools.cache
+def _kernel() -> list[float]:
+    kernel = [
+        math.cos(math.pi * 0.001 * (i - KERNEL_RADIUS) / 0.12) for i in range(2 * KERNEL_RADIUS + 1)
+    ]
     kernel_sum = sum(kernel)
-    for i in range(119):
-        kernel[i] /= kernel_sum
-    return list(convolve(init_values, kernel))[59:-59]
+    return [value / kernel_sum for value in kernel]
 
 
-def acep_vibrato_value_curve(seconds: float, vibrato_start: float, vibrato: AcepVibrato) -> float:
-    return (
-        math.sin(math.pi * (2 * (seconds - vibrato_start) * vibrato.frequency - vibrato.phase))
-        * vibrato.amplitude
-        * 0.5
-    )
+def _convolve(note_list: list[NoteInSeconds]) -> list[float]:
+    total_points = round(1000 * (note_list[-1].end + 0.12)) + 1
+    init_values = [0.0] * total_points
+    for note, (span_start, span_end) in zip(note_list, _note_spans(note_list, total_points)):
+        init_values[span_start:span_end] = [float(note.semitone)] * (span_end - span_start)
+    if np is not None:
+        return np.convolve(init_values, _kernel())[KERNEL_RADIUS:-KERNEL_RADIUS].tolist()
+    return list(convolve(init_values, _kernel()))[KERNEL_RADIUS:-KERNEL_RADIUS]
 
 
 @dataclasses.dataclass
@@ -53,11 +65,11 @@ class BasePitchCurve:
     notes: dataclasses.InitVar[Iterable[AcepNote]]
     synchronizer: dataclasses.InitVar[TimeSynchronizer]
     tick_offset: dataclasses.InitVar[int] = 0
-    vibrato_value_interval_dict: PiecewiseIntervalDict = dataclasses.field(
-        default_factory=PiecewiseIntervalDict
+    vibrato_value_interval_dict: PiecewiseFunction = dataclasses.field(
+        default_factory=PiecewiseFunction
     )
-    vibrato_coef_interval_dict: PiecewiseIntervalDict = dataclasses.field(
-        default_factory=PiecewiseIntervalDict
+    vibrato_coef_interval_dict: PiecewiseFunction = dataclasses.field(
+        default_factory=PiecewiseFunction
     )
     values_in_semitone: list[float] = dataclasses.field(default_factory=list)
 
@@ -82,40 +94,57 @@ class BasePitchCurve:
                     int(note.pos + note.vibrato.start_pos + tick_offset)
                 )
                 vibrato_duration = note_end - vibrato_start
-                self.vibrato_value_interval_dict[portion.closed(vibrato_start, note_end)] = (
-                    functools.partial(
-                        acep_vibrato_value_curve,
-                        vibrato_start=vibrato_start,
-                        vibrato=note.vibrato,
-                    )
+                self.vibrato_value_interval_dict.set_vibrato(
+                    vibrato_start,
+                    note_end,
+                    origin=vibrato_start,
+                    frequency=note.vibrato.frequency,
+                    phase=note.vibrato.phase,
+                    amplitude=note.vibrato.amplitude * 0.5,
                 )
                 attack_time = vibrato_start + note.vibrato.attack_ratio * vibrato_duration
                 release_time = note_end - note.vibrato.release_ratio * vibrato_duration
                 if note.vibrato.release_ratio:
-                    self.vibrato_coef_interval_dict[portion.openclosed(release_time, note_end)] = (
-                        functools.partial(
-                            linear_interpolation,  # type: ignore[call-arg]
-                            start=(release_time, note.vibrato.release_level),
-                            end=(note_end, 0),
-                        )
-                    )
-                self.vibrato_coef_interval_dict[portion.closed(attack_time, release_time)] = (
-                    functools.partial(
-                        linear_interpolation,  # type: ignore[call-arg]
-                        start=(attack_time, note.vibrato.attack_level),
-                        end=(release_time, note.vibrato.release_level),
+                    self.vibrato_coef_interval_dict.set_linear(
+                        (release_time, note.vibrato.release_level),
+                        (note_end, 0),
+                        lower_closed=False,
+                        upper_closed=True,
                     )
+                self.vibrato_coef_interval_dict.set_linear(
+                    (attack_time, note.vibrato.attack_level),
+                    (release_time, note.vibrato.release_level),
+                    upper_closed=True,
                 )
                 if note.vibrato.attack_ratio:
-                    self.vibrato_coef_interval_dict[
-                        portion.closedopen(vibrato_start, attack_time)
-                    ] = functools.partial(
-                        linear_interpolation,  # type: ignore[call-arg]
-                        start=(vibrato_start, 0),
-                        end=(attack_time, note.vibrato.attack_level),
+                    self.vibrato_coef_interval_dict.set_linear(
+                        (vibrato_start, 0), (attack_time, note.vibrato.attack_level)
                     )
         self.values_in_semitone = _convolve(note_list)
 
+    @functools.cached_property
+    def _values_array(self) -> "np.ndarray":
+        return np.asarray(self.values_in_semitone)
+
+    def semitone_values_at(self, seconds_list: Sequence[float]) -> list[float]:
+        if np is None or not seconds_list:
+            return [self.semitone_value_at(seconds) for seconds in seconds_list]
+        seconds_array = np.asarray(seconds_list, dtype=np.float64)
+        positions = 1000 * np.maximum(seconds_array, 0.0)
+        left_indices = np.floor(positions)
+        lambdas = positions - left_indices
+        last_index = len(self.values_in_semitone) - 1
+        clipped_left = np.minimum(left_indices.astype(np.int64), last_index)
+        clipped_right = np.minimum(clipped_left + 1, last_index)
+        values = self._values_array
+        pitch_values = (1 - lambdas) * values[clipped_left] + lambdas * values[clipped_right]
+        if self.vibrato_value_interval_dict:
+            vibrato_values = np.asarray(self.vibrato_value_interval_dict.evaluate(seconds_list))
+            coefs = np.asarray(self.vibrato_coef_interval_dict.evaluate(seconds_list, 0.0))
+            in_vibrato = ~np.isnan(vibrato_values)
+            pitch_values[in_vibrato] += vibrato_values[in_vibrato] * coefs[in_vibrato]
+        return pitch_values.tolist()
+
     def semitone_value_at(self, seconds: float) -> float:
         position = 1000 * max(0.0, seconds)
         left_index = math.floor(position)
@@ -47,11 +47,11 @@ Workspace = dict[str, dict[str, Any]]
 
 
 class DspxBaseModel(BaseModel):
-    model_config = ConfigDict(extra="forbid", strict=True, populate_by_name=True)
+    model_config = ConfigDict(extra="forbid", strict=True, populate_by_name=True, defer_build=True)
 
 
 class DspxRootModel(RootModel[Any]):
-    model_config = ConfigDict(strict=True)
+    model_config = ConfigDict(strict=True, defer_build=True)
 
 
 class BusControl(DspxBaseModel):
@@ -267,7 +267,7 @@ class Content(DspxBaseModel):
     tracks: list[Track]
     workspace: Workspace
 
-    model_config = ConfigDict(extra="forbid", strict=True, populate_by_name=True)
+    model_config = ConfigDict(extra="forbid", strict=True, populate_by_name=True, defer_build=True)
 
 
 class Model(DspxBaseModel):
@@ -1,11 +1,10 @@
 import pathlib
 from importlib.resources import files
-from typing import Any
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
 from libresvip.model.base import Project as OpenSvipProject
+from libresvip.utils.jsonutils import dump_model_json
 
 from .options import InputOptions, OutputOptions
 
@@ -26,13 +25,8 @@ class JsonSvipConverter(plugin_base.SVSConverter):
     @classmethod
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
         options_obj = cls.output_option_cls(**options)
-        dump_kwargs: dict[str, Any] = (
-            {"indent": 2} if options_obj.indented else {"separators": (",", ":")}
-        )
         path.write_bytes(
-            json.dumps(
-                project.model_dump(mode="json", by_alias=True),
-                ensure_ascii=False,
-                **dump_kwargs,
-            ).encode("utf-8"),
+            dump_model_json(
+                project, indent=2 if options_obj.indented else None, exclude_none=False
+            ),
         )
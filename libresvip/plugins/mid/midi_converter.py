@@ -3,7 +3,7 @@ from importlib.resources import files
 
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
-from libresvip.utils.binary.midi import MIDIFile
+from libresvip.utils.binary.midi import RawMidiFile
 
 from .midi_generator import MidiGenerator
 from .midi_parser import MidiParser
@@ -21,16 +21,26 @@ class MidiConverter(plugin_base.SVSConverter):
 
     @classmethod
     def load(cls, path: pathlib.Path, options: plugin_base.OptionsDict) -> Project:
+        return cls.loads(path.read_bytes(), options)
+
+    @classmethod
+    def loads(
+        cls, content: plugin_base.ProjectContent, options: plugin_base.OptionsDict
+    ) -> Project:
         options_obj = cls.input_option_cls(**options)
-        midi_file = MIDIFile.parse(path.read_bytes())
+        midi_file = RawMidiFile.parse(content)
         return MidiParser(
             options=options_obj,
         ).parse_project(midi_file)
 
     @classmethod
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
+        path.write_bytes(cls.dumps(project, options))
+
+    @classmethod
+    def dumps(cls, project: Project, options: plugin_base.OptionsDict) -> bytes:
         options_obj = cls.output_option_cls(**options)
         midi_file = MidiGenerator(
             options=options_obj,
         ).generate_project(project)
-        path.write_bytes(MIDIFile.build(midi_file))
+        return midi_file.build()
@@ -1,6 +1,5 @@
 import dataclasses
 import operator
-from typing import Any, TypeAlias
 
 from libresvip.core.constants import TICKS_IN_BEAT
 from libresvip.core.lyric_phoneme.chinese import get_pinyin_series
@@ -12,15 +11,21 @@ from libresvip.model.base import (
     TimeSignature,
     Track,
 )
-from libresvip.utils.binary.midi import bpm2tempo
+from libresvip.utils.binary.midi import (
+    META_EVENT,
+    ChannelMessageType,
+    MetaEventType,
+    MidiEvent,
+    RawMidiFile,
+    bpm2tempo,
+    encode_pitch_bend,
+)
 from libresvip.utils.text import SYMBOL_PATTERN
 
 from .constants import ControlChange
 from .midi_pitch import generate_for_midi
 from .options import OutputOptions
 
-MidiMessage: TypeAlias = dict[str, Any]
-
 
 @dataclasses.dataclass
 class MidiGenerator:
@@ -32,69 +37,47 @@ class MidiGenerator:
     def tick_rate(self) -> float:
         return TICKS_IN_BEAT / self.options.ticks_per_beat
 
-    def generate_project(self, project: Project) -> dict[str, Any]:
+    def generate_project(self, project: Project) -> RawMidiFile:
         self.first_bar_length = round(
             project.time_signature_list[0].bar_length(self.options.ticks_per_beat)
         )
         self.synchronizer = TimeSynchronizer(project.song_tempo_list)
-        mido_obj: dict[str, Any] = {
-            "type": 1,
-            "ticks_per_beat": self.options.ticks_per_beat,
-        }
-        tracks: list[list[MidiMessage]] = []
-        master_track: list[MidiMessage] = []
+        mido_obj = RawMidiFile(type=1, ticks_per_beat=self.options.ticks_per_beat)
+        master_track: list[MidiEvent] = []
         self.generate_tempos(master_track, project.song_tempo_list)
         self.generate_time_signatures(master_track, project.time_signature_list)
         master_track.append(
-            {
-                "time": master_track[-1]["time"] if master_track else 0,
-                "_next": 0xFF,
-                "status": 0xFF,
-                "detail": {
-                    "type": "meta",
-                    "event_type": 0x2F,
-                    "data": {"type": "end_of_track"},
-                },
-            }
+            (
+                master_track[-1][0] if master_track else 0,
+                META_EVENT,
+                MetaEventType.END_OF_TRACK,
+                b"",
+            )
+        )
+        master_track.sort(key=operator.itemgetter(0))
+        mido_obj.tracks.append(master_track)
+        mido_obj.tracks.extend(
+            self.generate_tracks(project.track_list, project.time_signature_list)
         )
-        master_track.sort(key=operator.itemgetter("time"))
-        tracks.append(master_track)
-        tracks.extend(self.generate_tracks(project.track_list, project.time_signature_list))
-        self._convert_cumulative_to_delta(tracks)
-        mido_obj["tracks"] = tracks
         return mido_obj
 
-    @staticmethod
-    def _convert_cumulative_to_delta(tracks: list[list[MidiMessage]]) -> None:
-        for track in tracks:
-            tick = 0
-            for event in track:
-                tick, event["time"] = event["time"], event["time"] - tick
-
     def generate_tempos(
-        self, master_track: list[MidiMessage], song_tempo_list: list[SongTempo]
+        self, master_track: list[MidiEvent], song_tempo_list: list[SongTempo]
     ) -> None:
         master_track.extend(
-            {
-                "time": round(tempo.position / self.tick_rate),
-                "_next": 0xFF,
-                "status": 0xFF,
-                "detail": {
-                    "type": "meta",
-                    "event_type": 0x51,
-                    "data": {
-                        "type": "set_tempo",
-                        "tempo": bpm2tempo(tempo.bpm),
-                    },
-                },
-            }
+            (
+                round(tempo.position / self.tick_rate),
+                META_EVENT,
+                MetaEventType.SET_TEMPO,
+                bpm2tempo(tempo.bpm).to_bytes(3, "big"),
+            )
             for tempo in song_tempo_list
             if tempo.position >= 0
         )
 
     def generate_time_signatures(
         self,
-        master_track: list[MidiMessage],
+        master_track: list[MidiEvent],
         time_signature_list: list[TimeSignature],
     ) -> None:
         prev_ticks = 0
@@ -107,28 +90,25 @@ class MidiGenerator:
                         * prev_time_signature.bar_length(self.options.ticks_per_beat)
                     )
                 master_track.append(
-                    {
-                        "time": prev_ticks,
-                        "_next": 0xFF,
-                        "status": 0xFF,
-                        "detail": {
-                            "type": "meta",
-                            "event_type": 0x58,
-                            "data": {
-                                "type": "time_signature",
-                                "numerator": time_signature.numerator,
-                                "denominator": time_signature.denominator,
-                                "clocks_per_click": 24,
-                                "notated_32nd_notes_per_quarter": 8,
-                            },
-                        },
-                    }
+                    (
+                        prev_ticks,
+                        META_EVENT,
+                        MetaEventType.TIME_SIGNATURE,
+                        bytes(
+                            (
+                                time_signature.numerator,
+                                time_signature.denominator.bit_length() - 1,
+                                24,
+                                8,
+                            )
+                        ),
+                    )
                 )
                 prev_time_signature = time_signature
 
     def generate_tracks(
         self, tracks: list[Track], time_signature_list: list[TimeSignature]
-    ) -> list[list[MidiMessage]]:
+    ) -> list[list[MidiEvent]]:
         return [
             mido_track
             for track in tracks
@@ -138,7 +118,7 @@ class MidiGenerator:
 
     def generate_track(
         self, track: SingingTrack, time_signature_list: list[TimeSignature]
-    ) -> list[MidiMessage] | None:
+    ) -> list[MidiEvent] | None:
         lyrics = [
             note.pronunciation if note.pronunciation is not None else note.lyric
             for note in track.note_list
@@ -146,68 +126,40 @@ class MidiGenerator:
         if self.options.remove_symbols:
             lyrics = [SYMBOL_PATTERN.sub("", lyric) for lyric in lyrics]
         pinyins = get_pinyin_series(lyrics)
-        mido_track: list[MidiMessage] = [
-            {
-                "time": 0,
-                "_next": 0xFF,
-                "status": 0xFF,
-                "detail": {
-                    "type": "meta",
-                    "event_type": 0x03,
-                    "data": {
-                        "type": "track_name",
-                        "name": track.title.encode(self.options.lyric_encoding, "replace"),
-                    },
-                },
-            }
+        mido_track: list[MidiEvent] = [
+            (
+                0,
+                META_EVENT,
+                MetaEventType.TRACK_NAME,
+                track.title.encode(self.options.lyric_encoding, "replace"),
+            )
         ]
         for i, note in enumerate(track.note_list):
             if self.options.export_lyrics:
                 mido_track.append(
-                    {
-                        "time": round(note.start_pos / self.tick_rate),
-                        "_next": 0xFF,
-                        "status": 0xFF,
-                        "detail": {
-                            "type": "meta",
-                            "event_type": 0x05,
-                            "data": {
-                                "type": "lyrics",
-                                "text": (
-                                    pinyins[i] if self.options.compatible_lyric else lyrics[i]
-                                ).encode(self.options.lyric_encoding, "replace"),
-                            },
-                        },
-                    }
+                    (
+                        round(note.start_pos / self.tick_rate),
+                        META_EVENT,
+                        MetaEventType.LYRICS,
+                        (pinyins[i] if self.options.compatible_lyric else lyrics[i]).encode(
+                            self.options.lyric_encoding, "replace"
+                        ),
+                    )
                 )
             mido_track.extend(
                 (
-                    {
-                        "time": round(note.start_pos / self.tick_rate),
-                        "_next": 0x90,
-                        "status": 0x90,
-                        "detail": {
-                            "type": "channel",
-                            "data": {
-                                "type": "note_on",
-                                "note": note.key_number,
-                                "velocity": 127,
-                            },
-                        },
-                    },
-                    {
-                        "time": round(note.end_pos / self.tick_rate),
-                        "_next": 0x80,
-                        "status": 0x80,
-                        "detail": {
-                            "type": "channel",
-                            "data": {
-                                "type": "note_off",
-                                "note": note.key_number,
-                                "velocity": 0,
-                            },
-                        },
-                    },
+                    (
+                        round(note.start_pos / self.tick_rate),
+                        ChannelMessageType.NOTE_ON,
+                        note.key_number,
+                        127,
+                    ),
+                    (
+                        round(note.end_pos / self.tick_rate),
+                        ChannelMessageType.NOTE_OFF,
+                        note.key_number,
+                        0,
+                    ),
                 )
             )
         if pitch_data := generate_for_midi(
@@ -220,75 +172,22 @@ class MidiGenerator:
             for pbs_event in pitch_data.pbs:
                 msg_time = round(pbs_event.tick / self.tick_rate)
                 mido_track.extend(
-                    [
-                        {
-                            "time": msg_time,
-                            "_next": 0xB0,
-                            "status": 0xB0,
-                            "detail": {
-                                "type": "channel",
-                                "data": {
-                                    "type": "control_change",
-                                    "control": ControlChange.RPN_MSB.value,
-                                    "value": 0,
-                                },
-                            },
-                        },
-                        {
-                            "time": msg_time,
-                            "_next": 0xB0,
-                            "status": 0xB0,
-                            "detail": {
-                                "type": "channel",
-                                "data": {
-                                    "type": "control_change",
-                                    "control": ControlChange.RPN_LSB.value,
-                                    "value": 0,
-                                },
-                            },
-                        },
-                        {
-                            "time": msg_time,
-                            "_next": 0xB0,
-                            "status": 0xB0,
-                            "detail": {
-                                "type": "channel",
-                                "data": {
-                                    "type": "control_change",
-                                    "control": ControlChange.DATA_ENTRY.value,
-                                    "value": pbs_event.value,
-                                },
-                            },
-                        },
-                    ]
+                    (msg_time, ChannelMessageType.CONTROL_CHANGE, control, value)
+                    for control, value in (
+                        (ControlChange.RPN_MSB.value, 0),
+                        (ControlChange.RPN_LSB.value, 0),
+                        (ControlChange.DATA_ENTRY.value, pbs_event.value),
+                    )
                 )
             mido_track.extend(
-                {
-                    "time": round(pitch_event.tick / self.tick_rate),
-                    "_next": 0xE0,
-                    "status": 0xE0,
-                    "detail": {
-                        "type": "channel",
-                        "data": {
-                            "type": "pitchwheel",
-                            "pitch": pitch_event.value,
-                        },
-                    },
-                }
+                (
+                    round(pitch_event.tick / self.tick_rate),
+                    ChannelMessageType.PITCHWHEEL,
+                    *encode_pitch_bend(pitch_event.value),
+                )
                 for pitch_event in pitch_data.pit
             )
-        mido_track.sort(key=operator.itemgetter("time"))
+        mido_track.sort(key=operator.itemgetter(0))
         if mido_track:
-            mido_track.append(
-                {
-                    "time": mido_track[-1]["time"],
-                    "_next": 0xFF,
-                    "status": 0xFF,
-                    "detail": {
-                        "type": "meta",
-                        "event_type": 0x2F,
-                        "data": {"type": "end_of_track"},
-                    },
-                }
-            )
+            mido_track.append((mido_track[-1][0], META_EVENT, MetaEventType.END_OF_TRACK, b""))
             return mido_track
@@ -3,10 +3,6 @@ import dataclasses
 import itertools
 import math
 import operator
-from typing import Annotated
-
-import more_itertools
-from construct import Container
 
 from libresvip.core.constants import (
     DEFAULT_PHONEME,
@@ -31,10 +27,15 @@ from libresvip.model.portamento import PortamentoPitch
 from libresvip.model.relative_pitch_curve import RelativePitchCurve
 from libresvip.utils.binary.midi import (
     DEFAULT_PITCH_BEND_SENSITIVITY,
+    META_EVENT,
     PITCH_MAX_VALUE,
-    MIDIFile,
-    MIDITrack,
+    SYSEX_EVENT,
+    ChannelMessageType,
+    MetaEventType,
+    MidiEvent,
+    RawMidiFile,
     cc11_to_db_change,
+    decode_pitch_bend,
     tempo2bpm,
 )
 from libresvip.utils.music_math import ratio_to_db
@@ -79,12 +80,11 @@ class MidiParser:
     def tick_rate(self) -> float:
         return TICKS_IN_BEAT / self.ticks_per_beat
 
-    def parse_project(self, mido_obj: Annotated[Container, MIDIFile]) -> Project:
+    def parse_project(self, mido_obj: RawMidiFile) -> Project:
         if mido_obj.ticks_per_beat < 0:
             msg = _("MIDI file with SMPTE time division is not supported.")
             raise NotImplementedError(msg)
         self.ticks_per_beat = mido_obj.ticks_per_beat
-        self._convert_delta_to_cumulative(mido_obj.tracks)
         if len(mido_obj.tracks):
             master_track = mido_obj.tracks[0]
             self.time_signatures.extend(self.parse_time_signatures(master_track))
@@ -96,17 +96,7 @@ class MidiParser:
             track_list=self.parse_tracks(mido_obj.tracks),
         )
 
-    @staticmethod
-    def _convert_delta_to_cumulative(tracks: list[Annotated[Container, MIDITrack]]) -> None:
-        for track in tracks:
-            tick = 0
-            for event in track:
-                event.time += tick
-                tick = event.time
-
-    def parse_time_signatures(
-        self, master_track: Annotated[Container, MIDITrack]
-    ) -> list[TimeSignature]:
+    def parse_time_signatures(self, master_track: list[MidiEvent]) -> list[TimeSignature]:
         # no default
         time_signature_changes: list[TimeSignature] = []
 
@@ -114,9 +104,11 @@ class MidiParser:
         if self.options.import_time_signatures:
             prev_ticks = 0
             measure = 0
-            for event in master_track:
-                if event.detail.type == "meta" and event.detail.data.type == "time_signature":
-                    tick = event.time
+            for tick, status, event_type, payload in master_track:
+                if status == META_EVENT and event_type == MetaEventType.TIME_SIGNATURE:
+                    if len(payload) < 2 or not payload[0]:
+                        show_warning(_("Ignored a malformed time signature event."))
+                        continue
                     if not time_signature_changes:
                         tick_in_full_note = 4 * self.ticks_per_beat
                     else:
@@ -126,8 +118,8 @@ class MidiParser:
                     measure += (tick - prev_ticks) / tick_in_full_note
                     ts_obj = TimeSignature(
                         bar_index=math.floor(measure),
-                        numerator=event.detail.data.numerator,
-                        denominator=event.detail.data.denominator,
+                        numerator=payload[0],
+                        denominator=1 << payload[1],
                     )
                     time_signature_changes.append(ts_obj)
                     prev_ticks = tick
@@ -136,16 +128,19 @@ class MidiParser:
         self.first_bar_length = round(time_signature_changes[0].bar_length())
         return time_signature_changes
 
-    def parse_tempo(self, tracks: list[Annotated[Container, MIDITrack]]) -> list[SongTempo]:
+    def parse_tempo(self, tracks: list[list[MidiEvent]]) -> list[SongTempo]:
         tempos: list[SongTempo] = []
 
         # traversing
         for track in tracks:
-            for event in track:
-                if event.detail.type == "meta" and event.detail.data.type == "set_tempo":
+            for time, status, event_type, payload in track:
+                if status == META_EVENT and event_type == MetaEventType.SET_TEMPO:
+                    if len(payload) != 3 or not any(payload):
+                        show_warning(_("Ignored a malformed tempo event."))
+                        continue
                     # convert tempo to BPM
-                    tempo = round(tempo2bpm(event.detail.data.tempo), 3)
-                    tick = round(event.time * self.tick_rate)
+                    tempo = round(tempo2bpm(int.from_bytes(payload, "big")), 3)
+                    tick = round(time * self.tick_rate)
                     last_tempo = tempos[-1].bpm if tempos else None
                     if tempo != last_tempo:
                         tempos.append(SongTempo(position=tick, bpm=tempo))
@@ -157,46 +152,38 @@ class MidiParser:
             tempos.sort(key=operator.attrgetter("position"))
         return tempos
 
-    def parse_track(
-        self, track_idx: int, track: Annotated[Container, MIDITrack]
-    ) -> list[SingingTrack]:
+    def parse_track(self, track_idx: int, track: list[MidiEvent]) -> list[SingingTrack]:
         tracks = []
-        event_buckets = more_itertools.bucket(
-            (event for event in track if event.detail.type == "channel"),
-            key=lambda event: event.detail.channel,
-        )
+        event_buckets: dict[int, list[MidiEvent]] = {}
+        for event in track:
+            if event[1] < SYSEX_EVENT:
+                event_buckets.setdefault(event[1] & 0x0F, []).append(event)
         lyrics: dict[int, str] = collections.defaultdict(lambda: DEFAULT_PHONEME)
         if self.options.import_lyrics:
-            for event in track:
-                if event.detail.type == "meta" and event.detail.data.type == "lyrics":
-                    lyrics[event.time] = event.detail.data.text.decode(
-                        self.options.lyric_encoding, "ignore"
-                    )
-        for channel in event_buckets:
+            for time, status, event_type, payload in track:
+                if status == META_EVENT and event_type == MetaEventType.LYRICS:
+                    lyrics[time] = payload.decode(self.options.lyric_encoding, "ignore")
+        for channel, channel_events in event_buckets.items():
             if self.selected_channels and channel not in self.selected_channels:
                 continue
             last_note_on = collections.defaultdict(list)
             pitchbend_range_changed: dict[int, list[int]] = collections.defaultdict(list)
-            track_name = None
             notes = []
             rel_pitch_points = []
             expression = ParamCurve()
             pitch_bend_sensitivity = DEFAULT_PITCH_BEND_SENSITIVITY
             volume_base = 0.0
-            for event in event_buckets[channel]:
-                # Look for track name events
-                if event.detail.data.type == "track_name":
-                    # Set the track name for the current track
-                    track_name = event.name.decode(self.options.track_name_encoding, "ignore")
-                elif event.detail.data.type == "note_on" and event.detail.data.velocity > 0:
+            for time, status, data1, data2 in channel_events:
+                message_type = status & 0xF0
+                if message_type == ChannelMessageType.NOTE_ON and data2 > 0:
                     # Store this as the last note-on location
-                    rel_pitch_points.append(Point(round(event.time * self.tick_rate), 0))
-                    last_note_on[event.detail.data.note].append(event.time)
-                elif event.detail.data.type == "note_off" or (
-                    event.detail.data.type == "note_on" and event.detail.data.velocity == 0
+                    rel_pitch_points.append(Point(round(time * self.tick_rate), 0))
+                    last_note_on[data1].append(time)
+                elif message_type == ChannelMessageType.NOTE_OFF or (
+                    message_type == ChannelMessageType.NOTE_ON and data2 == 0
                 ):
                     # Check that a note-on exists (ignore spurious note-offs)
-                    key = event.detail.data.note
+                    key = data1
                     if key in last_note_on:
                         # Get the start/stop times and velocity of every note
                         # which was turned on with this instrument/drum/pitch.
@@ -204,7 +191,7 @@ class MidiParser:
                         # previous ticks. In case there's a note-off and then
                         # note-on at the same tick we keep the open note from
                         # this tick.
-                        end_tick = event.time
+                        end_tick = time
                         open_notes = last_note_on[key]
 
                         notes_to_close = [
@@ -233,40 +220,37 @@ class MidiParser:
                         else:
                             # Remove the last note on for this instrument
                             del last_note_on[key]
-                elif event.detail.data.type == "pitchwheel" and self.options.import_pitch:
+                elif message_type == ChannelMessageType.PITCHWHEEL and self.options.import_pitch:
                     # Create pitch bend class instance
+                    pitch = decode_pitch_bend(data1, data2)
                     rel_pitch_points.append(
                         Point(
-                            round(event.time * self.tick_rate),
+                            round(time * self.tick_rate),
                             round(
                                 pitch_bend_sensitivity
-                                * event.detail.data.pitch
-                                / (
-                                    PITCH_MAX_VALUE
-                                    if event.detail.data.pitch > 0
-                                    else (PITCH_MAX_VALUE + 1)
-                                )
+                                * pitch
+                                / (PITCH_MAX_VALUE if pitch > 0 else (PITCH_MAX_VALUE + 1))
                             ),
                         )
                     )
-                elif event.detail.data.type == "control_change":
-                    control = event.detail.data.control
-                    value = event.detail.data.value
+                elif message_type == ChannelMessageType.CONTROL_CHANGE:
+                    control = data1
+                    value = data2
                     if self.options.import_pitch:
                         if (
                             control == ControlChange.DATA_ENTRY.value
-                            and len(pitchbend_range_changed[event.time]) >= 2
+                            and len(pitchbend_range_changed[time]) >= 2
                         ):
                             pitch_bend_sensitivity = value
                         elif (control == ControlChange.RPN_MSB.value and value == 0) or (
                             control == ControlChange.RPN_LSB.value and value == 0
                         ):
-                            pitchbend_range_changed[event.time].append(value)
+                            pitchbend_range_changed[time].append(value)
                     if self.options.import_volume:
                         if control == ControlChange.EXPRESSION.value and value:
                             expression.points.append(
                                 Point(
-                                    round(event.time * self.tick_rate),
+                                    round(time * self.tick_rate),
                                     round(volume_base + cc11_to_db_change(value)),
                                 )
                             )
@@ -292,16 +276,14 @@ class MidiParser:
             if notes:
                 tracks.append(
                     SingingTrack(
-                        title=track_name or f"Track {track_idx + 1} ({channel})",
+                        title=f"Track {track_idx + 1} ({channel})",
                         note_list=notes,
                         edited_params=edited_params,
                     )
                 )
         return tracks
 
-    def parse_tracks(
-        self, midi_tracks: list[Annotated[Container, MIDITrack]]
-    ) -> list[SingingTrack]:
+    def parse_tracks(self, midi_tracks: list[list[MidiEvent]]) -> list[SingingTrack]:
         return [
             *itertools.chain.from_iterable(
                 (self.parse_track(track_idx, track) for track_idx, track in enumerate(midi_tracks)),
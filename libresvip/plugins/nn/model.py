@@ -1,3 +1,5 @@
+import functools
+
 import tatsu
 from pydantic import Field
 from tatsu.grammars import Grammar
@@ -7,6 +9,7 @@ from tatsu.walkers import NodeWalker
 from libresvip.model.base import BaseModel
 
 
+@functools.cache
 def get_nn_grammar() -> Grammar:
     return tatsu.compile(
         """
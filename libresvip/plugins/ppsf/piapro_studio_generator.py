@@ -5,7 +5,7 @@ from libresvip.core.lyric_phoneme.japanese.vocaloid_xsampa import (
     legato_chars,
     romaji2xsampa,
 )
-from libresvip.core.time_interval import PiecewiseIntervalDict
+from libresvip.core.time_interval import PiecewiseFunction
 from libresvip.core.time_sync import TimeSynchronizer
 from libresvip.model.base import (
     InstrumentalTrack,
@@ -151,7 +151,7 @@ class PiaproStudioGenerator:
         return dvl_tracks
 
     def generate_pitch(
-        self, pitch: ParamCurve, key_interval_dict: PiecewiseIntervalDict, notes: list[Note]
+        self, pitch: ParamCurve, key_interval_dict: PiecewiseFunction, notes: list[Note]
     ) -> tuple[PpsfSeqParam, PpsfCurvePoint]:
         pitch_param = PpsfSeqParam()
         curve_point = PpsfCurvePoint(
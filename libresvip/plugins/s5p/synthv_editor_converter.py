@@ -1,9 +1,9 @@
 import pathlib
 from importlib.resources import files
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
+from libresvip.utils.jsonutils import dump_model_json
 
 from .model import S5pProject
 from .options import InputOptions, OutputOptions
@@ -32,9 +32,4 @@ class SynthVEditorConverter(plugin_base.SVSConverter):
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
         options_obj = cls.output_option_cls(**options)
         s5p_project = SynthVEditorGenerator(options_obj).generate_project(project)
-        path.write_bytes(
-            json.dumps(
-                s5p_project.model_dump(mode="json", by_alias=True, exclude_none=True),
-                separators=(",", ":"),
-            ).encode("utf-8"),
-        )
+        path.write_bytes(dump_model_json(s5p_project))
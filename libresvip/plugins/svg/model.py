@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from libresvip.model.base import BaseModel
 
 
 class NotePositionParameters(BaseModel):
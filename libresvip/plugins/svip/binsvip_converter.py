@@ -23,13 +23,23 @@ class SvipConverter(plugin_base.SVSConverter):
 
     @classmethod
     def load(cls, path: pathlib.Path, options: plugin_base.OptionsDict) -> Project:
+        return cls.loads(path.read_bytes(), options)
+
+    @classmethod
+    def loads(
+        cls, content: plugin_base.ProjectContent, options: plugin_base.OptionsDict
+    ) -> Project:
         options_obj = cls.input_option_cls(**options)
         with SvipReader() as reader:
-            version, xs_project = reader.read(path)
+            version, xs_project = reader.parse(content)
             return BinarySvipParser(options_obj).parse_project(version, xs_project)
 
     @classmethod
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
+        path.write_bytes(cls.dumps(project, options))
+
+    @classmethod
+    def dumps(cls, project: Project, options: plugin_base.OptionsDict) -> bytes:
         options_obj = cls.output_option_cls(**options)
         ver_enum = options_obj.version
         if ver_enum == BinarySvipVersion.SVIP7_0_0:
@@ -45,4 +55,4 @@ class SvipConverter(plugin_base.SVSConverter):
             raise ValueError(_("Unexpected enum value"))
         with SvipWriter() as registry:
             version, xs_project = BinarySvipGenerator(options_obj).generate_project(project)
-            registry.write(path, version, xs_project)
+            return registry.build(version, xs_project)
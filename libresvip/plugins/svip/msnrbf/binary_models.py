@@ -1,8 +1,8 @@
 # Yet another MS-NRBF parser and serializer for Python
 # Special thanks: netfleece, pypdn, https://github.com/gurnec/Undo_FFG
 import abc
+import dataclasses
 import decimal
-import threading
 from datetime import datetime, timedelta, timezone
 from functools import partial
 from typing import Any, BinaryIO
@@ -175,7 +175,25 @@ Decimal = ExprAdapter(
     lambda obj, ctx: str(obj),
 )
 
-local_store = threading.local()
+
+@dataclasses.dataclass
+class NrbfContext:
+    """Registries of one NRBF stream, passed to construct as the ``nrbf`` parameter."""
+
+    classes: dict[int, Any] = dataclasses.field(default_factory=dict)
+    libraries: dict[int, str] = dataclasses.field(default_factory=dict)
+    objects: dict[int, Any] = dataclasses.field(default_factory=dict)
+    references: dict[int, dict[str, Any]] = dataclasses.field(default_factory=dict)
+
+    def clear(self) -> None:
+        self.classes.clear()
+        self.libraries.clear()
+        self.objects.clear()
+        self.references.clear()
+
+
+def nrbf_context(context: Context) -> NrbfContext:
+    return context._params.nrbf
 
 
 class RegistryAdapter(Adapter, abc.ABC):
@@ -185,28 +203,28 @@ class RegistryAdapter(Adapter, abc.ABC):
 
 class ClassRegistryAdapter(RegistryAdapter):
     def _decode(self, obj: Container, context: Context, path: CSPath) -> Any:
-        local_store.classes[obj.class_info.object_id] = obj
+        nrbf_context(context).classes[obj.class_info.object_id] = obj
         return obj
 
 
 class ObjectRegistryAdapter(RegistryAdapter):
     def _decode(self, obj: Container, context: Context, path: CSPath) -> Any:
         if obj.get("array_info", None):
-            local_store.objects[obj.array_info.object_id] = obj
+            nrbf_context(context).objects[obj.array_info.object_id] = obj
         else:
-            local_store.objects[obj.object_id] = obj
+            nrbf_context(context).objects[obj.object_id] = obj
         return obj
 
 
 class LibraryRegistryAdapter(RegistryAdapter):
     def _decode(self, obj: Container, context: Context, path: CSPath) -> Any:
-        local_store.libraries[obj.library_id] = obj.library_name
+        nrbf_context(context).libraries[obj.library_id] = obj.library_name
         return obj
 
 
 class MemberReferenceAdapter(RegistryAdapter):
     def _decode(self, obj: Container, context: Context, path: CSPath) -> Any:
-        ref_cache = local_store.references
+        ref_cache = nrbf_context(context).references
         if obj.id_ref not in ref_cache:
             result = {"id_ref": obj.id_ref, "real_obj": None}
             ref_cache[obj.id_ref] = result
@@ -434,9 +452,11 @@ ClassWithId = ObjectRegistryAdapter(
         record_type_enum=Computed(RecordTypeEnum.ClassWithId),
         object_id=Int32sl,
         metadata_id=Int32sl,
-        class_info=Computed(lambda this: local_store.classes[this.metadata_id]["class_info"]),
+        class_info=Computed(
+            lambda this: nrbf_context(this).classes[this.metadata_id]["class_info"]
+        ),
         member_type_info=Computed(
-            lambda this: local_store.classes[this.metadata_id].get("member_type_info", None)
+            lambda this: nrbf_context(this).classes[this.metadata_id].get("member_type_info", None)
         ),
         member_values=IfThenElse(
             lambda this: this.member_type_info,
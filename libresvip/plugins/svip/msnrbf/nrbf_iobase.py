@@ -7,22 +7,23 @@ from types import TracebackType
 from construct import Container
 from typing_extensions import Self
 
-from .binary_models import local_store
+from .binary_models import NrbfContext
 
 
 class NrbfIOBase:
     @cached_property
+    def context(self) -> NrbfContext:
+        return NrbfContext()
+
+    @property
     def ref_map(self) -> MutableMapping[int, MutableMapping[int, Container]]:
         return ChainMap(
-            local_store.classes,
-            local_store.objects,
+            self.context.classes,
+            self.context.objects,
         )
 
     def __enter__(self) -> Self:
-        local_store.classes = {}
-        local_store.libraries = {}
-        local_store.objects = {}
-        local_store.references = {}
+        self.context = NrbfContext()
         return self
 
     def __exit__(
@@ -31,7 +32,4 @@ class NrbfIOBase:
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
-        local_store.classes.clear()
-        local_store.libraries.clear()
-        local_store.objects.clear()
-        local_store.references.clear()
+        self.context.clear()
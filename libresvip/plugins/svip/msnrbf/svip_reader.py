@@ -13,7 +13,6 @@ from .binary_models import (
     RecordTypeEnum,
     SerializedStreamHeader,
     SVIPFile,
-    local_store,
 )
 from .nrbf_iobase import NrbfIOBase
 from .xstudio_models import XSAppModel, fullname2classes
@@ -104,12 +103,15 @@ class SvipReader(NrbfIOBase):
         return False
 
     def resolve_references(self) -> None:
-        for ref_id in local_store.references:
-            ref = local_store.references[ref_id]
+        for ref_id in self.context.references:
+            ref = self.context.references[ref_id]
             ref["real_obj"] = self.ref_map[ref["id_ref"]]
 
     def read(self, path: pathlib.Path) -> tuple[str, XSAppModel]:
-        self.svip_file = SVIPFile.parse(path.read_bytes())
+        return self.parse(path.read_bytes())
+
+    def parse(self, content: bytes | memoryview) -> tuple[str, XSAppModel]:
+        self.svip_file = SVIPFile.parse(content, nrbf=self.context)
         self.resolve_references()
 
         for record in self.svip_file.record_stream:
@@ -17,7 +17,6 @@ from .binary_models import (
     PrimitiveTypeEnum,
     RecordTypeEnum,
     SVIPFile,
-    local_store,
 )
 from .constants import (
     LIBRARY_NAME_SINGING_TOOL_LIBRARY,
@@ -54,6 +53,9 @@ class SvipWriter(NrbfIOBase):
         return self.ids.get()
 
     def write(self, path: pathlib.Path, version: str, model: XSAppModel) -> None:
+        path.write_bytes(self.build(version, model))
+
+    def build(self, version: str, model: XSAppModel) -> bytes:
         self.svip_file = {
             "magic": version[:4],
             "version": version[4:],
@@ -78,7 +80,7 @@ class SvipWriter(NrbfIOBase):
         self.svip_file["record_stream"].append(self.write_dataclass(model, app_model_id))
         while not self.ids.empty():
             not_written = self.deq()
-            ref = local_store.references[not_written]
+            ref = self.context.references[not_written]
             if dataclasses.is_dataclass(ref["real_obj"]):
                 self.svip_file["record_stream"].append(
                     self.write_dataclass(ref["real_obj"], not_written, ref["subcon_class_name"])
@@ -92,13 +94,13 @@ class SvipWriter(NrbfIOBase):
                 "obj": {},
             }
         )
-        path.write_bytes(SVIPFile.build(self.svip_file))
+        return SVIPFile.build(self.svip_file, nrbf=self.context)
 
     def write_library(self, library_name: str) -> int:
         self.id_max += 1
         result = self.id_max
         model_library = {"library_id": result, "library_name": library_name}
-        local_store.libraries[
+        self.context.libraries[
             model_library["library_id"]  # type: ignore[index]
         ] = model_library["library_name"]  # type: ignore[assignment]
         self.svip_file["record_stream"].append(
@@ -133,8 +135,8 @@ class SvipWriter(NrbfIOBase):
         }
         if subcon_class_name is not None and "`1" in subcon_class_name:
             subcon_class_name = subcon_class_name.split("[[", 1)[-1].split(", ", 1)[0]
-        if object_id not in local_store.references:
-            local_store.references[object_id] = {
+        if object_id not in self.context.references:
+            self.context.references[object_id] = {
                 "id_ref": object_id,
                 "subcon_class_name": subcon_class_name,
                 "real_obj": value,
@@ -198,7 +200,7 @@ class SvipWriter(NrbfIOBase):
                     "real_obj": self.write_null_array(padded_length - len(values)),
                 }
             )
-        local_store.references[object_id] = {
+        self.context.references[object_id] = {
             "id_ref": object_id,
             "real_obj": result,
         }
@@ -217,7 +219,7 @@ class SvipWriter(NrbfIOBase):
                 "member_values": values,
             },
         }
-        local_store.references[object_id] = {
+        self.context.references[object_id] = {
             "id_ref": object_id,
             "real_obj": result,
         }
@@ -425,7 +427,7 @@ class SvipWriter(NrbfIOBase):
                     )
                     result["obj"]["class_info"]["member_count"] += 1  # type: ignore[index]
             self.class_defs[class_name] = result
-            local_store.classes[object_id] = result["obj"]
+            self.context.classes[object_id] = result["obj"]
         else:
             result = {
                 "record_type_enum": RecordTypeEnum.ClassWithId,
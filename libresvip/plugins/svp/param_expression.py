@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import abc
+import bisect
 import dataclasses
 import enum
 import operator
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from libresvip.model.point import Point
 from libresvip.model.synthv_pitch import (
@@ -15,12 +16,22 @@ from libresvip.model.synthv_pitch import (
     PitchControlPoint,
     SynthVPitchSimulator,
 )
+from libresvip.utils.music_math import (
+    cosine_easing_in_out_interpolation,
+    cubic_interpolation,
+    linear_interpolation,
+)
 from libresvip.utils.search import binary_find_last
 
 from .interval_utils import position_to_ticks
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable, Iterable, Sequence
 
     import portion
 
@@ -36,11 +47,31 @@ class ParamOperators(enum.Enum):
     DIV = operator.truediv
 
 
+if np is not None:
+    _NUMPY_INTERPOLATIONS: dict[Callable[..., float], Callable[[Any], Any]] = {
+        linear_interpolation: lambda r: r,
+        cosine_easing_in_out_interpolation: lambda r: (1 - np.cos(r * np.pi)) / 2,
+        cubic_interpolation: lambda r: (3 - 2 * r) * r**2,
+    }
+
+
 class ParamExpression(abc.ABC):
     @abc.abstractmethod
     def value_at_ticks(self, ticks: int) -> float:
         pass
 
+    def values_at_ticks(self, ticks: Sequence[int]) -> list[float]:
+        """Evaluate the expression at many positions, preferably in ascending order."""
+        if np is not None:
+            return self._values_at_ticks_array(np.asarray(ticks, dtype=np.int64)).tolist()
+        return self._values_at_ticks_list(ticks)
+
+    def _values_at_ticks_list(self, ticks: Sequence[int]) -> list[float]:
+        return [self.value_at_ticks(tick) for tick in ticks]
+
+    def _values_at_ticks_array(self, ticks: Any) -> Any:
+        return np.asarray(self._values_at_ticks_list(ticks.tolist()), dtype=np.float64)
+
     def __add__(self, other: int | ParamExpression) -> ParamExpression:
         if isinstance(other, int):
             return TranslationalParam(
@@ -96,6 +127,12 @@ class ScaledParam(ParamExpression):
     def value_at_ticks(self, ticks: int) -> float:
         return self.ratio * self.expression.value_at_ticks(ticks)
 
+    def _values_at_ticks_list(self, ticks: Sequence[int]) -> list[float]:
+        return [self.ratio * value for value in self.expression._values_at_ticks_list(ticks)]
+
+    def _values_at_ticks_array(self, ticks: Any) -> Any:
+        return self.ratio * self.expression._values_at_ticks_array(ticks)
+
 
 @dataclasses.dataclass
 class TranslationalParam(ParamExpression):
@@ -105,6 +142,12 @@ class TranslationalParam(ParamExpression):
     def value_at_ticks(self, ticks: int) -> float:
         return self.expression.value_at_ticks(ticks) + self.offset
 
+    def _values_at_ticks_list(self, ticks: Sequence[int]) -> list[float]:
+        return [value + self.offset for value in self.expression._values_at_ticks_list(ticks)]
+
+    def _values_at_ticks_array(self, ticks: Any) -> Any:
+        return self.expression._values_at_ticks_array(ticks) + self.offset
+
 
 @dataclasses.dataclass
 class CurveGenerator(ParamExpression):
@@ -114,6 +157,7 @@ class CurveGenerator(ParamExpression):
     )
     point_list: list[Point] = dataclasses.field(init=False)
     pos_indexes: list[tuple[int, int]] = dataclasses.field(init=False)
+    _positions: list[int] = dataclasses.field(init=False, repr=False)
     _point_list: dataclasses.InitVar[Iterable[Point]]
     _interpolation: dataclasses.InitVar[
         Callable[[float, tuple[float, float], tuple[float, float]], float]
@@ -144,6 +188,7 @@ class CurveGenerator(ParamExpression):
         self.interpolation = _interpolation
         self.base_value = _base_value
         self.pos_indexes = [(p.x, i) for i, p in enumerate(self.point_list)]
+        self._positions = [p.x for p in self.point_list]
 
     def value_at_ticks(self, ticks: int) -> float:
         if len(self.point_list) == 0 or (self.interval is not None and ticks not in self.interval):
@@ -156,6 +201,57 @@ class CurveGenerator(ParamExpression):
             return self.point_list[-1].y
         return self.interpolation(ticks, self.point_list[index], self.point_list[index + 1])
 
+    def _values_at_ticks_list(self, ticks: Sequence[int]) -> list[float]:
+        if not self.point_list:
+            return [self.base_value] * len(ticks)
+        point_list = self.point_list
+        positions = self._positions
+        last_index = len(point_list) - 1
+        results: list[float] = []
+        index = 0
+        prev_tick = None
+        for tick in ticks:
+            if self.interval is not None and tick not in self.interval:
+                results.append(self.base_value)
+                continue
+            # walk forward from the previous position, searching again only when going back
+            if prev_tick is None or tick < prev_tick:
+                index = bisect.bisect_right(positions, tick)
+            else:
+                while index <= last_index and positions[index] <= tick:
+                    index += 1
+            prev_tick = tick
+            if index == 0:
+                results.append(point_list[0].y)
+            elif index > last_index:
+                results.append(point_list[-1].y)
+            else:
+                results.append(self.interpolation(tick, point_list[index - 1], point_list[index]))
+        return results
+
+    def _values_at_ticks_array(self, ticks: Any) -> Any:
+        if (numpy_interpolation := _NUMPY_INTERPOLATIONS.get(self.interpolation)) is None:
+            return np.asarray(self._values_at_ticks_list(ticks.tolist()), dtype=np.float64)
+        if not self.point_list:
+            return np.full(len(ticks), self.base_value, dtype=np.float64)
+        xs = np.asarray(self._positions, dtype=np.int64)
+        ys = np.asarray([p.y for p in self.point_list], dtype=np.float64)
+        indexes = np.searchsorted(xs, ticks, side="right")
+        inner = (indexes > 0) & (indexes < len(xs))
+        results = np.where(indexes == 0, ys[0], ys[-1])
+        right = indexes[inner]
+        x0, x1 = xs[right - 1], xs[right]
+        y0, y1 = ys[right - 1], ys[right]
+        results[inner] = y0 + (y1 - y0) * numpy_interpolation((ticks[inner] - x0) / (x1 - x0))
+        if self.interval is not None:
+            outside = np.fromiter(
+                (tick not in self.interval for tick in ticks.tolist()),
+                dtype=np.bool_,
+                count=len(ticks),
+            )
+            results[outside] = self.base_value
+        return results
+
     def get_converted_curve(self, step: int) -> list[Point]:
         result: list[Point] = []
         if len(self.point_list) == 0:
@@ -209,6 +305,21 @@ class CompoundParam(ParamExpression):
             return ticks1 / ticks2
         raise NotImplementedError
 
+    def _values_at_ticks_list(self, ticks: Sequence[int]) -> list[float]:
+        return list(
+            map(
+                self.op.value,
+                self.expr1._values_at_ticks_list(ticks),
+                self.expr2._values_at_ticks_list(ticks),
+            )
+        )
+
+    def _values_at_ticks_array(self, ticks: Any) -> Any:
+        return self.op.value(
+            self.expr1._values_at_ticks_array(ticks),
+            self.expr2._values_at_ticks_array(ticks),
+        )
+
 
 @dataclasses.dataclass
 class PitchGenerator(ParamExpression):
@@ -290,3 +401,37 @@ class PitchGenerator(ParamExpression):
             self.pitch_simulator.pitch_at_secs(secs, ticks)
             + self.pitch_diff.value_at_ticks(ticks) * self.vibrato_env.value_at_ticks(ticks) / 1000
         )
+
+    def _aligned_secs_and_ticks(self, ticks: Sequence[int]) -> tuple[list[float], list[int]]:
+        secs_list = [self.synchronizer.get_actual_secs_from_ticks(tick) for tick in ticks]
+        aligned_ticks = [
+            round(self.synchronizer.get_actual_ticks_from_secs(secs)) for secs in secs_list
+        ]
+        return secs_list, aligned_ticks
+
+    def _values_at_ticks_list(self, ticks: Sequence[int]) -> list[float]:
+        secs_list, aligned_ticks = self._aligned_secs_and_ticks(ticks)
+        return [
+            self.pitch_simulator.pitch_at_secs(secs, tick) + pitch_diff * vibrato_env / 1000
+            for secs, tick, pitch_diff, vibrato_env in zip(
+                secs_list,
+                aligned_ticks,
+                self.pitch_diff._values_at_ticks_list(aligned_ticks),
+                self.vibrato_env._values_at_ticks_list(aligned_ticks),
+            )
+        ]
+
+    def _values_at_ticks_array(self, ticks: Any) -> Any:
+        secs_list, aligned_ticks = self._aligned_secs_and_ticks(ticks.tolist())
+        aligned_array = np.asarray(aligned_ticks, dtype=np.int64)
+        base_pitch = np.fromiter(
+            map(self.pitch_simulator.pitch_at_secs, secs_list, aligned_ticks),
+            dtype=np.float64,
+            count=len(secs_list),
+        )
+        return (
+            base_pitch
+            + self.pitch_diff._values_at_ticks_array(aligned_array)
+            * self.vibrato_env._values_at_ticks_array(aligned_array)
+            / 1000
+        )
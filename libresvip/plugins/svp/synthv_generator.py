@@ -17,12 +17,13 @@ from libresvip.model.base import (
 )
 from libresvip.model.pitch_simulator import PitchSimulator
 from libresvip.model.portamento import PortamentoPitch
+from libresvip.model.timeline import NoteTimeline, TimelineCursor
 from libresvip.utils.audio import audio_track_info
 from libresvip.utils.music_math import (
     clamp,
     ratio_to_db,
 )
-from libresvip.utils.search import find_index, find_last_index
+from libresvip.utils.search import find_index
 
 from .constants import TICK_RATE
 from .interval_utils import ticks_to_position
@@ -58,6 +59,7 @@ class SynthVGenerator:
     first_bar_tick: int = dataclasses.field(init=False)
     first_bar_tempo: list[SongTempo] = dataclasses.field(init=False)
     note_buffer: list[Note] = dataclasses.field(init=False)
+    note_cursor: TimelineCursor[Note] = dataclasses.field(init=False)
     synchronizer: TimeSynchronizer = dataclasses.field(init=False)
     pitch_simulator: PitchSimulator = dataclasses.field(init=False)
     no_vibrato_indexes: set[int] = dataclasses.field(init=False)
@@ -290,6 +292,7 @@ class SynthVGenerator:
             self.no_vibrato_indexes = set()
         if not len(self.note_buffer):
             return sv_curve
+        self.note_cursor = NoteTimeline(self.note_buffer).cursor()
         point_list = sv_curve.points
         buffer: list[Point] = []
         min_interval = 1
@@ -348,7 +351,7 @@ class SynthVGenerator:
         )
 
     def generate_pitch_diff(self, pos: int, pitch: int) -> float:
-        target_note_index = find_last_index(self.note_buffer, lambda x: x.start_pos <= pos)
+        target_note_index = self.note_cursor.last_index_at(pos)
         target_note = self.note_buffer[target_note_index] if target_note_index >= 0 else None
         if (
             simulated_pitch := self.pitch_simulator.pitch_at_secs(
@@ -72,13 +72,13 @@ class SynthVParser:
     tracks_from_groups: list[Track] = dataclasses.field(default_factory=list)
     time_signatures: list[TimeSignature] = dataclasses.field(default_factory=list)
 
-    def actual_value_at(
+    def actual_values_at(
         self,
         compound_expr: ParamExpression,
         mapping_func: Callable[[float], int],
-        ticks: int,
-    ) -> int:
-        return clip(mapping_func(compound_expr.value_at_ticks(ticks) / 1000))
+        ticks: list[int],
+    ) -> list[int]:
+        return [clip(mapping_func(value / 1000)) for value in compound_expr.values_at_ticks(ticks)]
 
     @staticmethod
     def parse_interpolation(
@@ -195,14 +195,7 @@ class SynthVParser:
             prev_point = master_points[j]
             j += 1
             prev_point_is_base = prev_point.y == 0
-        curve.points.append(Point.start_point(self.actual_value_at(compound_expr, mapping_func, 0)))
-        curve.points.append(
-            Point(
-                prev_point.x,
-                self.actual_value_at(compound_expr, mapping_func, prev_point.x),
-            )
-        )
-
+        sample_ticks = [0, prev_point.x]
         while i < len(group_points) or j < len(master_points):
             if i < len(group_points) and (
                 j >= len(master_points) or group_points[i].x <= master_points[j].x
@@ -215,39 +208,18 @@ class SynthVParser:
                 j += 1
                 current_point_is_base = current_point.y == 0
             if prev_point_is_base and current_point_is_base and prev_point.x <= current_point.x:
-                curve.points.append(
-                    Point(
-                        prev_point.x,
-                        self.actual_value_at(compound_expr, mapping_func, prev_point.x),
-                    )
-                )
-                curve.points.append(
-                    Point(
-                        current_point.x,
-                        self.actual_value_at(compound_expr, mapping_func, current_point.x),
-                    )
-                )
+                sample_ticks.extend((prev_point.x, current_point.x))
             else:
-                for p in range(prev_point.x, current_point.x, 5):
-                    curve.points.append(
-                        Point(
-                            p,
-                            self.actual_value_at(compound_expr, mapping_func, p),
-                        )
-                    )
+                sample_ticks.extend(range(prev_point.x, current_point.x, 5))
             prev_point = current_point
             prev_point_is_base = current_point_is_base
-        curve.points.append(
-            Point(
-                prev_point.x,
-                self.actual_value_at(compound_expr, mapping_func, prev_point.x),
-            )
-        )
-        curve.points.append(
-            Point.end_point(
-                self.actual_value_at(compound_expr, mapping_func, prev_point.x),
-            )
+        sample_ticks.append(prev_point.x)
+        sample_values = self.actual_values_at(compound_expr, mapping_func, sample_ticks)
+        curve.points.append(Point.start_point(sample_values[0]))
+        curve.points.extend(
+            Point(tick, value) for tick, value in zip(sample_ticks[1:], sample_values[1:])
         )
+        curve.points.append(Point.end_point(sample_values[-1]))
         return curve
 
     def parse_pitch_curve(
@@ -400,16 +372,13 @@ class SynthVParser:
             interval &= note_edited_range | param_edited_range
         curve.points.append(Point.start_point())
         for start, end in interval.shift(self.first_bar_tick).sub_ranges():
+            sample_ticks = [*range(start, end, step), end]
+            sample_values = generator.values_at_ticks(
+                [tick - self.first_bar_tick for tick in sample_ticks]
+            )
             curve.points.append(Point(start, -100))
             curve.points.extend(
-                Point(i, round(generator.value_at_ticks(i - self.first_bar_tick)))
-                for i in range(start, end, step)
-            )
-            curve.points.append(
-                Point(
-                    end,
-                    round(generator.value_at_ticks(end - self.first_bar_tick)),
-                )
+                Point(tick, round(value)) for tick, value in zip(sample_ticks, sample_values)
             )
             curve.points.append(Point(end, -100))
         curve.points.append(Point.end_point())
@@ -1,9 +1,9 @@
 import pathlib
 from importlib.resources import files
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
+from libresvip.utils.jsonutils import dump_model_json
 
 from .model import SVProject
 from .options import InputOptions, OutputOptions, SVProjectVersionCompatibility
@@ -22,29 +22,36 @@ class SynthVStudioConverter(plugin_base.SVSConverter):
 
     @classmethod
     def load(cls, path: pathlib.Path, options: plugin_base.OptionsDict) -> Project:
+        return cls.loads(path.read_bytes(), options)
+
+    @classmethod
+    def loads(
+        cls, content: plugin_base.ProjectContent, options: plugin_base.OptionsDict
+    ) -> Project:
         options_obj = cls.input_option_cls(**options)
-        sv_content = (
-            path.read_bytes().removesuffix(b"\x00").removeprefix("\ufeff".encode()).decode("utf-8")
-        )
-        sv_proj = SVProject.model_validate_json(sv_content, context={"path": path})
+        sv_view = memoryview(content)
+        if sv_view[-1:] == b"\x00":
+            sv_view = sv_view[:-1]
+        if sv_view[:3] == "\ufeff".encode():
+            sv_view = sv_view[3:]
+        sv_proj = SVProject.model_validate_json(str(sv_view, "utf-8"))
         if options_obj.instant and sv_proj.instant_mode_enabled is not None:
             options_obj.instant = sv_proj.instant_mode_enabled
         return SynthVParser(options_obj).parse_project(sv_proj)
 
     @classmethod
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
+        path.write_bytes(cls.dumps(project, options))
+
+    @classmethod
+    def dumps(cls, project: Project, options: plugin_base.OptionsDict) -> bytes:
         options_obj = cls.output_option_cls(**options)
         sv_project = SynthVGenerator(
             options=options_obj,
         ).generate_project(project)
-        path.write_bytes(
-            json.dumps(
-                sv_project.model_dump(mode="json", by_alias=True, exclude_none=True),
-                separators=(",", ":"),
-            ).encode("utf-8")
-            + (
-                b""
-                if options_obj.version_compatibility == SVProjectVersionCompatibility.ABOVE_2_0_0
-                else b"\x00"
-            )
+        return dump_model_json(
+            sv_project,
+            ensure_ascii=True,
+            trailing_nul=options_obj.version_compatibility
+            != SVProjectVersionCompatibility.ABOVE_2_0_0,
         )
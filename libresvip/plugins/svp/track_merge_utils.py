@@ -1,6 +1,7 @@
 from libresvip.core.time_interval import RangeInterval
 from libresvip.model.base import Note, ParamCurve, Params, SingingTrack
 from libresvip.model.point import Point
+from libresvip.model.timeline import TimelineIndex
 from libresvip.utils.search import find_index, find_last_index
 
 
@@ -12,12 +13,12 @@ def param_curve_override_with(
     termination: int = 0,
 ) -> None:
     inserted_points: list[Point] = []
-    main_left_index = find_last_index(main_curve.points.root, lambda point: point.x <= start)
-    main_right_index = find_index(main_curve.points.root, lambda point: point.x > end)
-    override_left_index = find_last_index(
-        override_curve.points.root, lambda point: point.x <= start
-    )
-    override_right_index = find_index(override_curve.points.root, lambda point: point.x > end)
+    main_timeline = TimelineIndex(main_curve.points.root, main_curve.points.root.xs)
+    main_left_index = main_timeline.last_index_at(start)
+    main_right_index = main_timeline.first_index_after(end)
+    override_timeline = TimelineIndex(override_curve.points.root, override_curve.points.root.xs)
+    override_left_index = override_timeline.last_index_at(start)
+    override_right_index = override_timeline.first_index_after(end)
     main_cure_points_count = len(main_curve.points)
     main_left_defined = 0 <= main_left_index < main_cure_points_count - 1 and (
         main_curve.points[main_left_index].x != termination
@@ -1,9 +1,9 @@
 import pathlib
 from importlib.resources import files
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
+from libresvip.utils.jsonutils import dump_model_json
 from libresvip.utils.text import to_unicode
 
 from .model import TuneLabProject
@@ -31,9 +31,4 @@ class TuneLabConverter(plugin_base.SVSConverter):
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
         options_obj = cls.output_option_cls(**options)
         tlp_project = TuneLabGenerator(options_obj).generate_project(project)
-        path.write_bytes(
-            json.dumps(
-                tlp_project.model_dump(mode="json", by_alias=True),
-                ensure_ascii=False,
-            ).encode("utf-8")
-        )
+        path.write_bytes(dump_model_json(tlp_project, exclude_none=False))
@@ -1,4 +1,4 @@
-from libresvip.core.time_interval import PiecewiseIntervalDict
+from libresvip.core.time_interval import PiecewiseFunction
 from libresvip.core.time_sync import TimeSynchronizer
 from libresvip.model.base import ParamCurve, SongTempo
 from libresvip.model.techno_speech_pitch import (
@@ -23,7 +23,7 @@ def build_voisona_param_interval_dict(
     events: list[VoiSonaMobileParamEvent],
     synchronizer: TimeSynchronizer,
     tick_prefix: int,
-) -> PiecewiseIntervalDict:
+) -> PiecewiseFunction:
     return build_param_interval_dict(events, synchronizer, tick_prefix)
 
 
@@ -31,7 +31,7 @@ def build_voisona_wave_interval_dict(
     events: list[VoiSonaMobileParamEvent],
     synchronizer: TimeSynchronizer,
     tick_prefix: int,
-) -> PiecewiseIntervalDict:
+) -> PiecewiseFunction:
     return build_wave_interval_dict(events, synchronizer, tick_prefix)
 
 
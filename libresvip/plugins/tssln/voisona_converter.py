@@ -22,15 +22,25 @@ class VoiSonaConverter(plugin_base.SVSConverter):
 
     @classmethod
     def load(cls, path: pathlib.Path, options: plugin_base.OptionsDict) -> Project:
+        return cls.loads(path.read_bytes(), options)
+
+    @classmethod
+    def loads(
+        cls, content: plugin_base.ProjectContent, options: plugin_base.OptionsDict
+    ) -> Project:
         options_obj = cls.input_option_cls(**options)
-        value_tree = JUCENode.parse(path.read_bytes())
+        value_tree = JUCENode.parse(content)
         tree_dict = build_tree_dict(value_tree)
         tssln_project = VoiSonaProject.model_validate(tree_dict["TSSolution"])
         return VoiSonaParser(options_obj).parse_project(tssln_project)
 
     @classmethod
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
+        path.write_bytes(cls.dumps(project, options))
+
+    @classmethod
+    def dumps(cls, project: Project, options: plugin_base.OptionsDict) -> bytes:
         options_obj = cls.output_option_cls(**options)
         tssln_project = VoiSonaGenerator(options_obj).generate_project(project)
         value_tree = model_to_value_tree(tssln_project)
-        path.write_bytes(JUCENode.build(value_tree))
+        return JUCENode.build(value_tree)
@@ -1,14 +1,18 @@
+import functools
 from typing import Any, Literal
 
 import tatsu
-from pydantic import BaseModel, Field
+from pydantic import Field
 from tatsu.grammars import Grammar
 from tatsu.objectmodel import Node
 from tatsu.walkers import NodeWalker
 
+from libresvip.model.base import BaseModel
+
 from .constants import MAX_ACCEPTED_BPM
 
 
+@functools.cache
 def get_ust_grammar() -> Grammar:
     return tatsu.compile(
         """
@@ -15,6 +15,13 @@ class InputOptions(EnablePitchImportationMixin, BaseModel):
         title=_("Text encoding"),
         json_schema_extra={"enum": supported_charset_names()},
     )
+    fast_parse: bool = Field(
+        default=True,
+        title=_("Use fast parser"),
+        description=_(
+            "Read the file line by line instead of running the full grammar. Files the fast parser cannot handle are still parsed by the grammar."
+        ),
+    )
 
 
 class OutputOptions(SelectSingleTrackMixin, BaseModel):
@@ -1,5 +1,6 @@
 import dataclasses
 import itertools
+import math
 import operator
 
 from libresvip.core.constants import TICKS_IN_BEAT
@@ -9,7 +10,7 @@ from libresvip.model.pitch_simulator import PitchSimulator
 from libresvip.model.point import Point
 from libresvip.model.portamento import PortamentoPitch
 from libresvip.model.relative_pitch_curve import RelativePitchCurve
-from libresvip.utils.search import find_last_index
+from libresvip.model.timeline import TempoTimeline, TimelineIndex
 
 from .constants import (
     MODE2_PITCH_MAX_POINT_COUNT,
@@ -54,6 +55,8 @@ def pitch_to_utau_mode2_track(
     absolute_pitch = [
         point._replace(x=point.x - 1920) for point in pitch.points.root if point.y != -100
     ]
+    pitch_timeline = TimelineIndex(absolute_pitch, [point.x for point in absolute_pitch])
+    tempo_timeline = TempoTimeline(tempos)
 
     def to_relative(from_: list[Point], key: int) -> list[Point]:
         return [Point(x=p.x, y=(p.y or key * 100) - key * 100) for p in from_]
@@ -62,30 +65,29 @@ def pitch_to_utau_mode2_track(
         [
             NotePitchData(
                 to_relative(
-                    [point for point in absolute_pitch if point.x < notes[0].end_pos],
+                    pitch_timeline.items_between(-math.inf, notes[0].end_pos),
                     notes[0].key_number,
                 ),
                 -min(
                     (point.x for point in absolute_pitch if point.x < 0),
                     default=0,
                 ),
-                bpm_for_note(tempos, notes[0]),
+                bpm_for_note(tempo_timeline, notes[0]),
             ),  # first note
         ]
         + [
             NotePitchData(
                 to_relative(
-                    [point for point in absolute_pitch if note.start_pos <= point.x < note.end_pos],
+                    pitch_timeline.items_between(note.start_pos, note.end_pos),
                     note.key_number,
                 ),
                 (
-                    next(
-                        (point.x for point in absolute_pitch if point.x >= note.start_pos),
-                        note.start_pos,
-                    )
-                    - note.start_pos
-                ),
-                bpm_for_note(tempos, note),
+                    absolute_pitch[first_index].x
+                    if (first_index := pitch_timeline.first_index_at(note.start_pos)) != -1
+                    else note.start_pos
+                )
+                - note.start_pos,
+                bpm_for_note(tempo_timeline, note),
             )
             for note in notes[1:]
         ]
@@ -267,6 +269,5 @@ def shape(pitch_data: list[Point]) -> list[Point]:
     return shaped_data
 
 
-def bpm_for_note(tempos: list[SongTempo], note: Note) -> float:
-    tempo_index = find_last_index(tempos, lambda x: x.position <= note.start_pos)
-    return tempos[tempo_index].bpm
+def bpm_for_note(tempos: TempoTimeline, note: Note) -> float:
+    return tempos.tempo_at(note.start_pos).bpm
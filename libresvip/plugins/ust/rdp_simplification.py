@@ -1,7 +1,19 @@
+import heapq
+import itertools
 import math
+from collections.abc import Iterable, Iterator
 
 from libresvip.model.point import Point
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MIN_EPSILON = 0.05
+# below this many points per segment, the per call overhead of NumPy outweighs its speedup
+NUMPY_MIN_SEGMENT_SIZE = 64
+
 
 def perpendicular_distance(pt: Point, line_start: Point, line_end: Point) -> float:
     dx: float = line_end.x - line_start.x
@@ -25,37 +37,112 @@ def perpendicular_distance(pt: Point, line_start: Point, line_end: Point) -> flo
     return math.hypot(ax, ay)
 
 
-def simplify_shape(point_list: list[Point], epsilon: float) -> list[Point]:
-    if len(point_list) < 2:
-        return point_list
-
-    # Find the point with the maximum distance from line between start and end
+def _farthest_point(point_list: list[Point], start: int, end: int) -> tuple[int, float]:
     dmax = 0.0
-    index = 0
-    end = len(point_list) - 1
-    for i in range(1, end):
-        d = perpendicular_distance(point_list[i], point_list[0], point_list[end])
+    index = start
+    for i in range(start + 1, end):
+        d = perpendicular_distance(point_list[i], point_list[start], point_list[end])
         if d > dmax:
             index = i
             dmax = d
+    return index, dmax
+
+
+def _farthest_point_numpy(
+    xs: "np.ndarray", ys: "np.ndarray", start: int, end: int
+) -> tuple[int, float]:
+    dx = xs[end] - xs[start]
+    dy = ys[end] - ys[start]
+    mag = math.hypot(dx, dy)
+    if mag > 0.0:
+        dx /= mag
+        dy /= mag
+    pvx = xs[start + 1 : end] - xs[start]
+    pvy = ys[start + 1 : end] - ys[start]
+    pvdot = dx * pvx + dy * pvy
+    distances = np.hypot(pvx - pvdot * dx, pvy - pvdot * dy)
+    offset = int(distances.argmax())
+    return start + 1 + offset, float(distances[offset])
+
+
+class _SegmentSplitter:
+    def __init__(self, point_list: list[Point]) -> None:
+        self.point_list = point_list
+        if np is not None and len(point_list) > NUMPY_MIN_SEGMENT_SIZE:
+            count = len(point_list)
+            self.xs = np.fromiter((point.x for point in point_list), dtype=np.float64, count=count)
+            self.ys = np.fromiter((point.y for point in point_list), dtype=np.float64, count=count)
+        else:
+            self.xs = self.ys = None
 
-    if dmax <= epsilon:
-        # Just return start and end points
-        return [point_list[0], point_list[-1]]
-    first_line = point_list[: index + 1]
-    last_line = point_list[index:]
-    rec_results1 = simplify_shape(first_line, epsilon)
-    rec_results2 = simplify_shape(last_line, epsilon)
+    def farthest_point(self, start: int, end: int) -> tuple[int, float]:
+        if self.xs is not None and end - start >= NUMPY_MIN_SEGMENT_SIZE:
+            return _farthest_point_numpy(self.xs, self.ys, start, end)
+        return _farthest_point(self.point_list, start, end)
 
-    # build the result list
-    return rec_results1[:-1] + rec_results2
+
+def iter_ranked_points(point_list: list[Point]) -> Iterator[tuple[float, int]]:
+    """Yield ``(significance, index)`` of the inner points, most significant first.
+
+    The significance of a point is the largest epsilon for which :func:`simplify_shape` keeps
+    it: its distance to the segment it splits, capped by the significance of the point that
+    split the enclosing segment. Segments are split lazily, best first, so taking the top
+    few points only splits the segments around them. Points lying on their segment are not
+    yielded.
+    """
+    if len(point_list) < 3:
+        return
+    splitter = _SegmentSplitter(point_list)
+    heap: list[tuple[float, int, int, int]] = []
+
+    def push(start: int, end: int, cap: float) -> None:
+        if end - start >= 2:
+            index, dmax = splitter.farthest_point(start, end)
+            if dmax > 0.0:
+                heapq.heappush(heap, (-min(dmax, cap), index, start, end))
+
+    push(0, len(point_list) - 1, math.inf)
+    while heap:
+        negative_significance, index, start, end = heapq.heappop(heap)
+        yield -negative_significance, index
+        push(start, index, -negative_significance)
+        push(index, end, -negative_significance)
+
+
+def _select_points(point_list: list[Point], indices: Iterable[int]) -> list[Point]:
+    return [point_list[0], *(point_list[i] for i in sorted(indices)), point_list[-1]]
+
+
+def simplify_shape(point_list: list[Point], epsilon: float) -> list[Point]:
+    if len(point_list) < 2:
+        return point_list
+    return _select_points(
+        point_list,
+        (
+            index
+            for significance, index in itertools.takewhile(
+                lambda ranked: ranked[0] > epsilon, iter_ranked_points(point_list)
+            )
+        ),
+    )
 
 
 def simplify_shape_to(point_list: list[Point], max_point_count: int) -> list[Point]:
-    step = 0.05
-    epsilon = step
-    while True:
-        result = simplify_shape(point_list, epsilon)
-        if len(result) < max_point_count:
-            return result
-        epsilon += step
+    """Simplify to fewer than ``max_point_count`` points, dropping the least significant first.
+
+    Points tied at the cut are dropped together, points no more significant than
+    :data:`MIN_EPSILON` are dropped as well, and the end points are always kept.
+    """
+    if len(point_list) < 2:
+        return point_list
+    inner_count = max(max_point_count - 3, 0)
+    ranked_points = list(
+        itertools.takewhile(
+            lambda ranked: ranked[0] > MIN_EPSILON,
+            itertools.islice(iter_ranked_points(point_list), inner_count + 1),
+        )
+    )
+    if len(ranked_points) > inner_count:
+        cut = ranked_points.pop()[0]
+        ranked_points = [ranked for ranked in ranked_points if ranked[0] > cut]
+    return _select_points(point_list, (index for _, index in ranked_points))
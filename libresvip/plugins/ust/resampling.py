@@ -4,7 +4,7 @@ from operator import attrgetter
 from more_itertools import minmax
 
 from libresvip.model.point import Point
-from libresvip.utils.search import find_index, find_last_index
+from libresvip.model.timeline import TimelineIndex
 
 
 def resampled(
@@ -13,14 +13,15 @@ def resampled(
     interpolate_method: Callable[[Point, Point, int], float],
 ) -> list[Point]:
     left_point, right_point = minmax(data, key=attrgetter("x"), default=(Point(0, 0), Point(0, 0)))
+    cursor = TimelineIndex(data, [point.x for point in data]).cursor()
     return [
         Point(
             x=current,
             y=int(interpolate_method(data[prev_index], data[next_index], current)),
         )
         for current in range(left_point.x, right_point.x + 1, interval)
-        if (prev_index := find_last_index(data, lambda p: p.x <= current)) != -1
-        and (next_index := find_index(data, lambda p: p.x >= current)) != -1
+        if (prev_index := cursor.last_index_at(current)) != -1
+        and (next_index := cursor.first_index_at(current)) != -1
     ]
 
 
@@ -1,3 +1,5 @@
+import contextlib
+import io
 import pathlib
 from importlib.resources import files
 
@@ -9,6 +11,7 @@ from .options import InputOptions, OutputOptions
 from .template import render_ust
 from .ust_generator import USTGenerator
 from .ust_parser import USTParser
+from .ust_reader import read_ust
 
 
 class USTConverter(plugin_base.SVSConverter):
@@ -25,8 +28,14 @@ class USTConverter(plugin_base.SVSConverter):
         options_obj = cls.input_option_cls(**options)
         ust_content = path.read_bytes()
         ust_text = ust_content.decode(options_obj.encoding, errors="replace")
-        tree = get_ust_grammar().parse(ust_text)
-        ust_project = UstWalker().walk(tree)
+        ust_project = None
+        if options_obj.fast_parse:
+            # anything the line reader rejects is left to the grammar
+            with contextlib.suppress(ValueError):
+                ust_project = read_ust(io.StringIO(ust_text, newline=""))
+        if ust_project is None:
+            tree = get_ust_grammar().parse(ust_text)
+            ust_project = UstWalker().walk(tree)
         return USTParser(options_obj).parse_project(ust_project)
 
     @classmethod
@@ -3,6 +3,7 @@ import dataclasses
 from libresvip.core.constants import DEFAULT_BPM
 from libresvip.core.exceptions import NoTrackError
 from libresvip.model.base import Project, SingingTrack, SongTempo
+from libresvip.model.timeline import TempoTimeline
 from libresvip.utils.translation import gettext_lazy as _
 
 from .model import UTAUNote, UTAUProject, UTAUTrack
@@ -61,6 +62,7 @@ class USTGenerator:
             track.edited_params.pitch, track.note_list, tempo_list
         )
         utau_notes = []
+        tempo_timeline = TempoTimeline(tempo_list)
         prev_bpm = tempo_list[0].bpm
         prev_end_pos = None
         note_index = 0
@@ -78,7 +80,7 @@ class USTGenerator:
                 )
                 utau_notes.append(rest_note)
                 note_index += 1
-            cur_bpm = bpm_for_note(tempo_list, note)
+            cur_bpm = bpm_for_note(tempo_timeline, note)
             utau_note = UTAUNote(
                 note_type=str(note_index).zfill(4),
                 lyric=note.lyric,
@@ -0,0 +1,303 @@
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from .constants import MAX_ACCEPTED_BPM
+from .model import (
+    OptionalFloat,
+    UstWalker,
+    UTAUEnvelope,
+    UTAUNote,
+    UtauNoteVibrato,
+    UTAUPitchBendMode,
+    UTAUProject,
+    UTAUTimeSignature,
+    UTAUTrack,
+)
+
+FLOAT_PATTERN = re.compile(r"[-]?(?:(?:\d+(?:\.\d*)?)|(?:\.\d+))(?:[eE][-+]?\d+)?")
+INT_PATTERN = re.compile(r"[-]?[0-9]+")
+NOTE_HEAD_PATTERN = re.compile(r"\[#(\d+|PREV|NEXT|INSERT|DELETE)\]")
+TIME_SIGNATURE_PATTERN = re.compile(r"\(([-]?[0-9]+)/([-]?[0-9]+)/([-]?[0-9]+)\)")
+PBS_SEPARATOR_PATTERN = re.compile(r"[;,]")
+TRACK_END = "[#TRACKEND]"
+
+
+class MalformedUstError(ValueError):
+    pass
+
+
+def _parse_float(text: str) -> float:
+    if FLOAT_PATTERN.fullmatch(text) is None:
+        msg = f"Invalid float value: {text!r}"
+        raise MalformedUstError(msg)
+    return float(text)
+
+
+def _parse_int(text: str) -> int:
+    if INT_PATTERN.fullmatch(text) is None:
+        msg = f"Invalid int value: {text!r}"
+        raise MalformedUstError(msg)
+    return int(text)
+
+
+def _parse_bool(text: str) -> bool:
+    if text not in ("1", "0", "True", "False"):
+        msg = f"Invalid bool value: {text!r}"
+        raise MalformedUstError(msg)
+    # bool nodes of the grammar are built from the matched text
+    return bool(text)
+
+
+def _parse_optional_float(text: str) -> OptionalFloat:
+    if text in ("", "null"):
+        return ""
+    return _parse_float(text)
+
+
+def _parse_pitch_bend_mode(text: str) -> UTAUPitchBendMode:
+    if text in ("s", "r", "j"):
+        return text  # type: ignore[return-value]
+    if text in ("", "null"):
+        return ""
+    msg = f"Invalid pitch bend mode: {text!r}"
+    raise MalformedUstError(msg)
+
+
+def _parse_pitch_bend_type(text: str) -> str:
+    if text not in ("5", "OldData"):
+        msg = f"Invalid pitch bend type: {text!r}"
+        raise MalformedUstError(msg)
+    return text
+
+
+def _parse_time_signatures(text: str) -> list[UTAUTimeSignature]:
+    time_signatures = []
+    for part in text.removesuffix(",").split(","):
+        if (match := TIME_SIGNATURE_PATTERN.fullmatch(part)) is None:
+            msg = f"Invalid time signature: {part!r}"
+            raise MalformedUstError(msg)
+        numerator, denominator, bar_index = map(int, match.groups())
+        time_signatures.append(
+            UTAUTimeSignature(numerator=numerator, denominator=denominator, bar_index=bar_index)
+        )
+    return time_signatures
+
+
+def _parse_envelope(text: str) -> UTAUEnvelope:
+    parts = text.split(",")
+    if len(parts) < 7:
+        msg = f"Invalid envelope: {text!r}"
+        raise MalformedUstError(msg)
+    p1, p2, p3, v1, v2, v3, v4 = (_parse_float(part) for part in parts[:7])
+    tail = parts[7:]
+    extra_kwargs: dict[str, Any] = {}
+    if not tail:
+        extra_kwargs["other_points"] = []
+    elif tail[0] == "%":
+        if len(tail) > 4:
+            msg = f"Invalid envelope: {text!r}"
+            raise MalformedUstError(msg)
+        for key, part in zip(("p4", "p5", "v5"), tail[1:]):
+            extra_kwargs[key] = _parse_float(part) if part else None
+    elif tail[0] == "":
+        if len(tail) != 2:
+            msg = f"Invalid envelope: {text!r}"
+            raise MalformedUstError(msg)
+        extra_kwargs["p4"] = _parse_float(tail[1])
+    else:
+        extra_kwargs["other_points"] = [_parse_float(part) for part in tail]
+    return UTAUEnvelope(p1=p1, p2=p2, p3=p3, v1=v1, v2=v2, v3=v3, v4=v4, **extra_kwargs)
+
+
+def _parse_vibrato(text: str) -> UtauNoteVibrato:
+    values = [_parse_optional_float(part) for part in text.split(",")]
+    vibrato_kwargs: dict[str, Any] = {
+        key: value
+        for key, value in zip(
+            ("period", "depth", "fade_in", "fade_out", "phase_shift", "shift"), values[1:]
+        )
+        if isinstance(value, float)
+    }
+    vibrato_kwargs["length"] = values[0]
+    return UtauNoteVibrato(**vibrato_kwargs)
+
+
+SETTING_PARSERS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "UstVersion": ("ust_version", _parse_float),
+    "TimeSignatures": ("time_signatures", _parse_time_signatures),
+    "Tracks": ("track_count", _parse_int),
+    # the grammar captures only the "(Name)?" group as the key, so the walker skips it
+    "Project": ("", str),
+    "ProjectName": ("", str),
+    "VoiceDir": ("voice_dir", str),
+    "OutFile": ("out_file", str),
+    "CacheDir": ("cache_dir", str),
+    "Tool1": ("tool1", str),
+    "Tool2": ("tool2", str),
+    "Mode2": ("pitch_mode2", _parse_bool),
+    "Autoren": ("autoren", _parse_bool),
+    "MapFirst": ("map_first", _parse_bool),
+    "Flags": ("flags", str),
+    "Charset": ("", str),
+}
+
+NOTE_ATTR_PARSERS: dict[str, tuple[str, Callable[[str], Any], bool]] = {
+    # key: (field name, value parser, whether trailing spaces are stripped)
+    "Length": ("length", _parse_float, True),
+    "Duration": ("duration", _parse_float, True),
+    "Lyric": ("lyric", str, False),
+    "NoteNum": ("note_num", _parse_int, True),
+    "Delta": ("delta", _parse_int, True),
+    "PreUtterance": ("pre_utterance", str, False),
+    "VoiceOverlap": ("voice_overlap", _parse_float, True),
+    "Intensity": ("intensity", _parse_float, True),
+    "Modulation": ("modulation", _parse_float, True),
+    "Moduration": ("modulation", _parse_float, True),
+    "StartPoint": ("start_point", _parse_float, True),
+    "Envelope": ("envelope", _parse_envelope, True),
+    "Tempo": ("tempo", UstWalker.tempo2bpm, False),
+    "Velocity": ("velocity", _parse_float, True),
+    "Label": ("label", str, False),
+    "Flags": ("flags", str, False),
+    "PBType": ("pitchbend_type", _parse_pitch_bend_type, True),
+    "PBStart": ("pitchbend_start", _parse_float, True),
+    "Piches": ("pitch_bend_points", lambda text: [_parse_int(x) for x in text.split(",")], True),
+    "Pitches": ("pitch_bend_points", lambda text: [_parse_int(x) for x in text.split(",")], True),
+    "PitchBend": (
+        "pitch_bend_points",
+        lambda text: [_parse_int(x) for x in text.split(",")],
+        True,
+    ),
+    "PBS": (
+        "pbs",
+        lambda text: [_parse_optional_float(x) for x in PBS_SEPARATOR_PATTERN.split(text)],
+        True,
+    ),
+    "PBW": ("pbw", lambda text: [_parse_optional_float(x) for x in text.split(",")], True),
+    "PBY": ("pby", lambda text: [_parse_optional_float(x) for x in text.split(",")], True),
+    "PBM": ("pbm", lambda text: [_parse_pitch_bend_mode(x) for x in text.split(",")], True),
+    "VBR": ("vibrato", _parse_vibrato, True),
+    "stptrim": ("stp_trim", _parse_float, True),
+    "layer": ("layer", _parse_int, True),
+    "@preuttr": ("at_preutterance", _parse_float, True),
+    "@overlap": ("at_overlap", _parse_float, True),
+    "@stpoint": ("at_start_point", _parse_float, True),
+    "@filename": ("sample_filename", str, False),
+    "@alias": ("alias", str, False),
+    "@cache": ("cache_location", str, False),
+}
+
+
+def _iter_stripped_lines(lines: Iterable[str]) -> Iterator[str]:
+    for line in lines:
+        if line.endswith("\r\n"):
+            line = line[:-2]
+        elif line.endswith("\n"):
+            line = line[:-1]
+        if "\r" in line or "\n" in line:
+            msg = "Unexpected line break"
+            raise MalformedUstError(msg)
+        yield line
+
+
+def read_ust(lines: Iterable[str]) -> UTAUProject:
+    """
+    Build a UTAUProject from the lines of a UST file (line endings included).
+
+    Accepts the same inputs as the UST grammar and produces the same result;
+    raises MalformedUstError for anything else so callers can fall back to it.
+    """
+    line_iter = _iter_stripped_lines(lines)
+    pending_metadata: dict[str, Any] = {"track": []}
+    line = next(line_iter, None)
+    if line == "[#VERSION]":
+        if (version_line := next(line_iter, None)) is None or not version_line.startswith(
+            "UST Version"
+        ):
+            msg = "Invalid version section"
+            raise MalformedUstError(msg)
+        pending_metadata["ust_version"] = _parse_float(
+            version_line.removeprefix("UST Version").removeprefix("=")
+        )
+        pending_metadata["charset"] = None
+        line = next(line_iter, None)
+        if line is not None and line.startswith("Charset="):
+            pending_metadata["charset"] = line.removeprefix("Charset=")
+            line = next(line_iter, None)
+    elif line == "":
+        line = next(line_iter, None)
+    if line != "[#SETTING]":
+        msg = "Missing setting section"
+        raise MalformedUstError(msg)
+    line = next(line_iter, None)
+    while line is not None:
+        key, sep, value = line.partition("=")
+        if not sep:
+            break
+        if key == "Tempo":
+            if (tempo_value := UstWalker.tempo2bpm(value)) < MAX_ACCEPTED_BPM:
+                pending_metadata["tempo"] = tempo_value
+        elif key in SETTING_PARSERS:
+            field_name, parser = SETTING_PARSERS[key]
+            parsed = parser(value)
+            if field_name:
+                pending_metadata[field_name] = parsed
+        else:
+            break
+        line = next(line_iter, None)
+
+    tracks: list[UTAUTrack] = []
+    notes: list[UTAUNote] | None = None
+    pending_note_attrs: dict[str, Any] | None = None
+    while line is not None:
+        if "=" not in line and (head_match := NOTE_HEAD_PATTERN.match(line)) is not None:
+            if head_match.end() != len(line):
+                msg = f"Invalid note head: {line!r}"
+                raise MalformedUstError(msg)
+            if pending_note_attrs is not None:
+                notes.append(UTAUNote(**pending_note_attrs))  # type: ignore[union-attr]
+            if notes is None:
+                notes = []
+            pending_note_attrs = {"note_type": head_match.group(1)}
+        elif "=" not in line and line.startswith(TRACK_END):
+            if line != TRACK_END:
+                msg = f"Invalid track end: {line!r}"
+                raise MalformedUstError(msg)
+            if pending_note_attrs is not None:
+                notes.append(UTAUNote(**pending_note_attrs))  # type: ignore[union-attr]
+                pending_note_attrs = None
+            tracks.append(UTAUTrack(notes=notes or []))
+            notes = None
+            line = next(line_iter, None)
+            if line == "":
+                if any(rest != "" for rest in line_iter):
+                    msg = "Unexpected content after track end"
+                    raise MalformedUstError(msg)
+                break
+            if line is not None and (
+                "=" in line
+                or (NOTE_HEAD_PATTERN.match(line) is None and not line.startswith(TRACK_END))
+            ):
+                msg = f"Unexpected content after track end: {line!r}"
+                raise MalformedUstError(msg)
+            continue
+        elif pending_note_attrs is None:
+            if line == "" and all(rest == "" for rest in line_iter):
+                break
+            msg = f"Unexpected line outside of notes: {line!r}"
+            raise MalformedUstError(msg)
+        else:
+            key, sep, value = line.partition("=")
+            if sep and key in NOTE_ATTR_PARSERS:
+                field_name, parser, strip_spaces = NOTE_ATTR_PARSERS[key]
+                pending_note_attrs[field_name] = parser(
+                    value.rstrip(" ") if strip_spaces else value
+                )
+        line = next(line_iter, None)
+    if pending_note_attrs is not None:
+        notes.append(UTAUNote(**pending_note_attrs))  # type: ignore[union-attr]
+    if notes is not None:
+        tracks.append(UTAUTrack(notes=notes))
+    pending_metadata["track"] = tracks or [UTAUTrack()]
+    return UTAUProject(**pending_metadata)
@@ -4,10 +4,10 @@ import sys
 import zipfile
 from importlib.resources import files
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
 from libresvip.model.reset_time_axis import reset_time_axis
+from libresvip.utils.jsonutils import dump_model_json
 
 from .model import VOXFactoryProject
 from .options import InputOptions, OutputOptions
@@ -48,11 +48,7 @@ class VOXFactoryConverter(plugin_base.SVSConverter):
         vox_factory_project = generator.generate_project(project)
         with zipfile.ZipFile(buffer, "w") as archive_file:
             archive_file.writestr(
-                "project.json",
-                json.dumps(
-                    vox_factory_project.model_dump(mode="json", by_alias=True),
-                    ensure_ascii=False,
-                ),
+                "project.json", dump_model_json(vox_factory_project, exclude_none=False)
             )
             if sys.version_info >= (3, 11):
                 archive_file.mkdir("resources")
@@ -3,9 +3,9 @@ import pathlib
 import zipfile
 from importlib.resources import files
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
+from libresvip.utils.jsonutils import dump_model_json
 
 from .model import VocaloidProject
 from .options import InputOptions, OutputOptions
@@ -43,13 +43,7 @@ class VocaloidConverter(plugin_base.SVSConverter):
         generator = VocaloidGenerator(options_obj)
         vocaloid_project = generator.generate_project(project)
         with zipfile.ZipFile(buffer, "w") as archive_file:
-            archive_file.writestr(
-                "Project/sequence.json",
-                json.dumps(
-                    vocaloid_project.model_dump(mode="json", exclude_none=True, by_alias=True),
-                    ensure_ascii=False,
-                ),
-            )
+            archive_file.writestr("Project/sequence.json", dump_model_json(vocaloid_project))
             for wav_name, wav_path in generator.wav_paths.items():
                 archive_file.writestr(f"Project/Audio/{wav_name}", wav_path.read_bytes())
         path.write_bytes(buffer.getvalue())
@@ -4,11 +4,10 @@ import math
 import pathlib
 
 import more_itertools
-import portion
 
 from libresvip.core.constants import DEFAULT_ENGLISH_LYRIC
 from libresvip.core.tick_counter import skip_beat_list, skip_tempo_list
-from libresvip.core.time_interval import PiecewiseIntervalDict
+from libresvip.core.time_interval import PiecewiseFunction
 from libresvip.core.time_sync import TimeSynchronizer
 from libresvip.model.base import (
     InstrumentalTrack,
@@ -173,11 +172,11 @@ class VsqxParser:
 
     def parse_notes(
         self, vsqx_notes: list[VsqxNote], tick_offset: int
-    ) -> tuple[list[Note], PiecewiseIntervalDict, PiecewiseIntervalDict]:
+    ) -> tuple[list[Note], PiecewiseFunction, PiecewiseFunction]:
         prev_vsqx_note = None
         note_list: list[Note] = []
-        vibrato_depth_interval_dict = PiecewiseIntervalDict()
-        vibrato_rate_interval_dict = PiecewiseIntervalDict()
+        vibrato_depth_interval_dict = PiecewiseFunction()
+        vibrato_rate_interval_dict = PiecewiseFunction()
         for vsqx_note in vsqx_notes:
             if prev_vsqx_note and vsqx_note.lyric.startswith("EVEC("):
                 note_list[-1].length += vsqx_note.dur_tick
@@ -211,24 +210,19 @@ class VsqxParser:
                                 omega = prev_elem.elv / 2
                                 if elem is None:
                                     prev_end = start_secs + duration_secs
-                                    vibrato_rate_interval_dict[
-                                        portion.closed(prev_start, prev_end)
-                                    ] = functools.partial(
-                                        self.vibrato_curve,
-                                        shift=prev_start,
-                                        omega=omega,
-                                        phase=phase,
-                                    )
                                 else:
                                     prev_end = start_secs + duration_secs * elem.pos_nrm / 65536
-                                    vibrato_rate_interval_dict[
-                                        portion.closedopen(prev_start, prev_end)
-                                    ] = functools.partial(
+                                vibrato_rate_interval_dict.set_function(
+                                    prev_start,
+                                    prev_end,
+                                    functools.partial(
                                         self.vibrato_curve,
                                         shift=prev_start,
                                         omega=omega,
                                         phase=phase,
-                                    )
+                                    ),
+                                    upper_closed=elem is None,
+                                )
                                 phase += (prev_end - prev_start) * omega
                         elif seq_attr.seq_id == "vibDep":
                             for prev_elem, elem in more_itertools.windowed(
@@ -237,14 +231,11 @@ class VsqxParser:
                                 prev_start = start_secs + duration_secs * prev_elem.pos_nrm / 65536
                                 if elem is None:
                                     prev_end = start_secs + duration_secs
-                                    vibrato_depth_interval_dict[
-                                        portion.closed(prev_start, prev_end)
-                                    ] = prev_elem.elv
                                 else:
                                     prev_end = start_secs + duration_secs * elem.pos_nrm / 65536
-                                    vibrato_depth_interval_dict[
-                                        portion.closedopen(prev_start, prev_end)
-                                    ] = prev_elem.elv
+                                vibrato_depth_interval_dict.set_constant(
+                                    prev_start, prev_end, prev_elem.elv, upper_closed=elem is None
+                                )
                 if (
                     prev_vsqx_note is not None
                     and prev_vsqx_note.phnms is not None
@@ -276,8 +267,8 @@ class VsqxParser:
         self,
         musical_part: VsqxMusicalPart,
         note_list: list[Note],
-        vibrato_rate_interval_dict: PiecewiseIntervalDict,
-        vibrato_depth_interval_dict: PiecewiseIntervalDict,
+        vibrato_rate_interval_dict: PiecewiseFunction,
+        vibrato_depth_interval_dict: PiecewiseFunction,
         tick_offset: int,
     ) -> ParamCurve | None:
         adapter = VsqxControllerAdapter(param_names=self.param_names)
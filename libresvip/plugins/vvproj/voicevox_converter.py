@@ -1,9 +1,9 @@
 import pathlib
 from importlib.resources import files
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
+from libresvip.utils.jsonutils import dump_model_json
 
 from .model import VoiceVoxProject
 from .options import InputOptions, OutputOptions
@@ -30,6 +30,4 @@ class VOICEVOXConverter(plugin_base.SVSConverter):
     def dump(cls, path: pathlib.Path, project: Project, options: plugin_base.OptionsDict) -> None:
         options_obj = cls.output_option_cls(**options)
         voicevox_project = VOICEVOXGenerator(options_obj).generate_project(project)
-        path.write_bytes(
-            json.dumps(voicevox_project.model_dump(mode="json", by_alias=True)).encode("utf-8")
-        )
+        path.write_bytes(dump_model_json(voicevox_project, ensure_ascii=True, exclude_none=False))
@@ -3,9 +3,9 @@ import enum
 from functools import partial
 from typing import NamedTuple
 
-from pydantic import BaseModel
 from xsdata_pydantic.fields import field
 
+from libresvip.model.base import BaseModel
 from libresvip.utils.binary.midi import (
     DEFAULT_PITCH_BEND_SENSITIVITY,
     MAX_PITCH_BEND_SENSITIVITY,
@@ -1,10 +1,10 @@
 import pathlib
 from importlib.resources import files
 
-from libresvip.core.compat import json
 from libresvip.extension import base as plugin_base
 from libresvip.model.base import Project
 from libresvip.model.reset_time_axis import reset_time_axis
+from libresvip.utils.jsonutils import dump_model_json
 
 from .model import Y77Project
 from .options import InputOptions, OutputOptions
@@ -33,6 +33,4 @@ class Y77Converter(plugin_base.SVSConverter):
         if len(project.song_tempo_list) != 1:
             project = reset_time_axis(project, options_obj.tempo)
         y77_project = Y77Generator(options_obj).generate_project(project)
-        path.write_bytes(
-            json.dumps(y77_project.model_dump(mode="json", by_alias=True)).encode("utf-8")
-        )
+        path.write_bytes(dump_model_json(y77_project, ensure_ascii=True, exclude_none=False))
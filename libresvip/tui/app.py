@@ -1,14 +1,10 @@
 import enum
-import io
 import pathlib
 import re
-import traceback
 from collections.abc import Coroutine
 from dataclasses import dataclass
 from typing import Any, cast, get_args, get_type_hints
-from zipfile import ZipFile
 
-import more_itertools
 from pydantic import BaseModel
 from pydantic_core import PydanticCustomError, PydanticUndefined
 from pydantic_extra_types.color import Color, parse_str
@@ -53,11 +49,11 @@ from textual.widgets import (
 )
 from textual.widgets.selection_list import Selection
 from textual_fspicker import FileOpen, SelectDirectory
-from upath import UPath
 
 import libresvip
 from libresvip.core.config import (
     LYRIC_REPLACE_MODE_PREFIX_SUFFIX,
+    ConversionMode,
     DarkMode,
     Language,
     LyricsReplacement,
@@ -65,7 +61,6 @@ from libresvip.core.config import (
     save_settings,
     settings,
 )
-from libresvip.core.warning_types import CatchWarnings
 from libresvip.extension.base import ReadOnlyConverterMixin, SVSConverter, WriteOnlyConverterMixin
 from libresvip.extension.manager import (
     get_svs_plugin_by_suffix,
@@ -73,8 +68,14 @@ from libresvip.extension.manager import (
     get_translation,
     middleware_manager,
     plugin_manager,
+    start_model_warmup,
+)
+from libresvip.model.base import BaseComplexModel
+from libresvip.tui.conversion import (
+    ConversionJob,
+    resolve_worker_count,
+    run_conversion_jobs,
 )
-from libresvip.model.base import BaseComplexModel, Project
 from libresvip.utils import translation
 from libresvip.utils.text import supported_charset_names
 from libresvip.utils.translation import gettext_lazy as _
@@ -716,7 +717,6 @@ class TUIApp(App[None]):
         self.theme = "textual-dark" if value else "textual-light"
 
     def on_mount(self) -> None:
-        self.temp_path = UPath("memory:/")
         theme_select = self.query_one("#theme_select")
 
         def update_theme(value: bool) -> None:
@@ -725,6 +725,7 @@ class TUIApp(App[None]):
                     theme_select._watch_value(int(value))
 
         theme_select.watch(self, "dark", update_theme, init=False)
+        start_model_warmup()
         if settings.last_input_format is not None:
             self.post_message(SelectFormats.InputFormatChanged(settings.last_input_format))
         if settings.last_output_format is not None:
@@ -832,127 +833,74 @@ class TUIApp(App[None]):
         if self.dark != changed.value:
             self.dark = bool(changed.value)
 
-    @work(thread=True)
-    def convert_one(
-        self, progress_bar: ProgressBar, task_row_item: ListItem, *sub_task_items: list[ListItem]
-    ) -> None:
-        tab_id = self.query_one("#task_list").current
-        task_row = task_row_item.get_child_by_type(TaskRow)
-        sub_tasks = [
-            cast("ListItem", sub_task_item).get_child_by_type(TaskRow)
-            for sub_task_item in sub_task_items
+    def build_conversion_jobs(
+        self, task_list_view: ListView
+    ) -> list[tuple[TaskRow, ConversionJob]]:
+        mode = ConversionMode[cast("str", task_list_view.id).upper()]
+        task_rows = [
+            cast("ListItem", task_row_item).get_child_by_type(TaskRow)
+            for task_row_item in task_list_view._nodes
         ]
-        task_row.log_text = ""
-        if settings.last_input_format is None or settings.last_output_format is None:
-            return
-        try:
-            with CatchWarnings() as w:
-                output_path = self.temp_path / task_row.stem
-                if tab_id != "split":
-                    output_path = output_path.with_suffix(
-                        f".{settings.last_output_format}",
-                    )
-                input_plugin = get_svs_plugin_by_value(settings.last_input_format)
-                output_plugin = get_svs_plugin_by_value(settings.last_output_format)
-                input_options = self.query_one("#input_options")
-                input_option = input_options.option_dict
-                if tab_id == "merge":
-                    child_projects = [
-                        input_plugin.load(
-                            sub_task.input_path,
-                            input_option,
-                        )
-                        for sub_task in more_itertools.value_chain(task_row, sub_tasks)
-                    ]
-                    project = Project.merge_projects(child_projects)
-                else:
-                    project = input_plugin.load(
-                        task_row.input_path,
-                        input_option,
-                    )
-                for (
-                    middleware_id,
-                    middleware,
-                ) in middleware_manager.plugins.get("middleware", {}).items():
-                    if self.query_one(f"#{middleware_id}_switch").value:
-                        option_form = self.query_one(f"#{middleware_id}_options")
-                        project = middleware.process(
-                            project,
-                            option_form.option_dict,
-                        )
-                output_options = self.query_one("#output_options")
-                output_option = output_options.option_dict
-                if tab_id == "split":
-                    output_path.mkdir(parents=True, exist_ok=True)
-                    for i, child_project in enumerate(
-                        project.split_tracks(settings.max_track_count), start=1
-                    ):
-                        output_plugin.dump(
-                            output_path / f"{task_row.stem}_{i:0=2d}.{settings.last_output_format}",
-                            child_project,
-                            output_option,
-                        )
-                else:
-                    output_plugin.dump(
-                        output_path,
-                        project,
-                        output_option,
-                    )
-            if w.output:
-                task_row.log_text = w.output
-            buffer = io.BytesIO()
-            if output_path.is_file():
-                buffer.write(output_path.read_bytes())
-            else:
-                with ZipFile(buffer, "w") as zip_file:
-                    for child_file in output_path.iterdir():
-                        if not child_file.is_file():
-                            continue
-                        zip_file.writestr(
-                            child_file.name,
-                            child_file.read_bytes(),
-                        )
-            self.call_from_thread(
-                self.deliver_text,
-                io.StringIO(buffer.getvalue().decode("latin-1")),
-                encoding="latin-1",
-                save_directory=settings.save_folder,
-                save_filename=output_path.name if tab_id != "split" else f"{task_row.stem}.zip",
-            )
-        except Exception:
-            task_row.log_text = traceback.format_exc()
-            self.call_from_thread(
-                self.notify,
-                f"Error occurred while converting {task_row.input_path}",
-                severity="error",
+        if mode == ConversionMode.MERGE:
+            input_path_groups = [[task_row.input_path for task_row in task_rows]]
+        else:
+            input_path_groups = [[task_row.input_path] for task_row in task_rows]
+        output_suffix = "zip" if mode == ConversionMode.SPLIT else settings.last_output_format
+        middleware_options = {
+            middleware_id: self.query_one(f"#{middleware_id}_options").option_dict
+            for middleware_id in middleware_manager.plugins.get("middleware", {})
+            if self.query_one(f"#{middleware_id}_switch").value
+        }
+        return [
+            (
+                task_row,
+                ConversionJob(
+                    mode=mode,
+                    input_paths=input_paths,
+                    output_path=settings.save_folder / f"{task_row.stem}.{output_suffix}",
+                    input_format=cast("str", settings.last_input_format),
+                    output_format=cast("str", settings.last_output_format),
+                    input_options=self.query_one("#input_options").option_dict,
+                    output_options=self.query_one("#output_options").option_dict,
+                    middleware_options=middleware_options,
+                    max_track_count=settings.max_track_count,
+                ),
             )
-        self.call_from_thread(progress_bar.advance, 1)
+            for task_row, input_paths in zip(task_rows, input_path_groups, strict=False)
+        ]
 
     @work(thread=True, exclusive=True)
-    def convert_all(self, task_list_view: ListView, progress_bar: ProgressBar) -> None:
-        total = len(task_list_view) if task_list_view.id != "merge" else 1
-        self.call_from_thread(progress_bar.update, total=total)
-        if task_list_view.id == "merge":
-            (task_row,), other_tasks = more_itertools.spy(task_list_view._nodes)
-            self.convert_one(
-                progress_bar,
-                task_row,
-                *other_tasks,
-            )
-        else:
-            for task_row in task_list_view._nodes:
-                self.convert_one(
-                    progress_bar,
-                    task_row,
+    def convert_all(
+        self, tasks: list[tuple[TaskRow, ConversionJob]], progress_bar: ProgressBar
+    ) -> None:
+        self.call_from_thread(progress_bar.update, total=len(tasks))
+        task_rows = [task_row for task_row, _job in tasks]
+        for task_row in task_rows:
+            task_row.log_text = ""
+        outcomes = run_conversion_jobs(
+            [job for _task_row, job in tasks],
+            resolve_worker_count(settings.conversion_workers, len(tasks)),
+            settings.model_copy(),
+        )
+        for task_row, outcome in zip(task_rows, outcomes, strict=True):
+            task_row.log_text = outcome.log_text
+            if not outcome.success:
+                self.call_from_thread(
+                    self.notify,
+                    f"Error occurred while converting {task_row.input_path}",
+                    severity="error",
                 )
+            self.call_from_thread(progress_bar.advance, 1)
 
     @on(Button.Pressed, "#start_conversion")
     async def handle_start_conversion(self, event: Button.Pressed) -> None:
+        if settings.last_input_format is None or settings.last_output_format is None:
+            return
         tab_id = self.query_one("#task_list").current
         task_list_view = self.query_one(f"ListView#{tab_id}")
         if len(task_list_view):
             progress_bar = self.query_one(ProgressBar)
-            self.convert_all(task_list_view, progress_bar)
+            self.convert_all(self.build_conversion_jobs(task_list_view), progress_bar)
 
     @on(Button.Pressed, "#delete_task")
     def handle_delete_task(self, event: Button.Pressed) -> None:
@@ -988,6 +936,11 @@ class TUIApp(App[None]):
             - set(selected.selection_list._selected.keys())
         )
 
+    @on(Input.Changed, "#conversion_workers")
+    def handle_conversion_workers_changed(self, event: Input.Changed) -> None:
+        if event.validation_result.is_valid:
+            settings.conversion_workers = int(event.value)
+
     @on(Input.Changed, "#max_track_count")
     def handle_max_track_count_changed(self, event: Input.Changed) -> None:
         if event.validation_result.is_valid:
@@ -1072,6 +1025,17 @@ class TUIApp(App[None]):
                             value=settings.reset_tasks_on_input_change,
                             id="reset_tasks_on_input_change",
                         )
+                    with Horizontal():
+                        yield Label(
+                            _("Conversion worker processes (0 for one per CPU)"),
+                            classes="text-middle",
+                        )
+                        yield Label("", classes="fill-width")
+                        yield Input(
+                            value=str(settings.conversion_workers),
+                            id="conversion_workers",
+                            validators=[Integer(minimum=0)],
+                        )
                 with Vertical(classes="card"):
                     yield Label(_("Output Settings"), classes="title")
                     with Horizontal():
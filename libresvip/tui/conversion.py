@@ -0,0 +1,85 @@
+import concurrent.futures
+import multiprocessing
+import os
+import pathlib
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+from libresvip.core.config import ConversionMode, LibreSvipBaseUISettings
+from libresvip.extension.base import OptionsDict
+from libresvip.extension.conversion import init_conversion_worker, run_conversion
+
+
+@dataclass
+class ConversionJob:
+    mode: ConversionMode
+    input_paths: list[pathlib.Path]
+    output_path: pathlib.Path
+    input_format: str
+    output_format: str
+    input_options: OptionsDict = field(default_factory=dict)
+    output_options: OptionsDict = field(default_factory=dict)
+    middleware_options: dict[str, OptionsDict] = field(default_factory=dict)
+    max_track_count: int = 1
+
+
+@dataclass
+class ConversionOutcome:
+    success: bool
+    log_text: str = ""
+
+
+def run_conversion_job(job: ConversionJob) -> ConversionOutcome:
+    """Convert one task and write the result into ``job.output_path``.
+
+    Split mode writes every child project into a zip archive at ``job.output_path``.
+    """
+    output = run_conversion(
+        job.input_paths,
+        mode=job.mode,
+        input_format=job.input_format,
+        output_format=job.output_format,
+        input_options=job.input_options,
+        output_options=job.output_options,
+        middleware_options=job.middleware_options,
+        max_track_count=job.max_track_count,
+        output_path=job.output_path,
+    )
+    return ConversionOutcome(
+        success=output.success,
+        log_text=(output.error if not output.success else output.warning) or "",
+    )
+
+
+def resolve_worker_count(requested: int, job_count: int) -> int:
+    """Map the ``conversion_workers`` setting to a pool size, ``0`` meaning one per CPU."""
+    workers = requested or os.cpu_count() or 1
+    return max(1, min(workers, job_count))
+
+
+def run_conversion_jobs(
+    jobs: list[ConversionJob],
+    workers: int,
+    ui_settings: LibreSvipBaseUISettings,
+) -> Iterator[ConversionOutcome]:
+    """Yield one outcome per job, in job order.
+
+    Jobs run on a pool of ``workers`` spawned processes, so each output file is written
+    as soon as its own conversion finishes; a single worker converts in the calling thread.
+    """
+    if workers <= 1:
+        yield from map(run_conversion_job, jobs)
+        return
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_conversion_worker,
+        initargs=(ui_settings,),
+    ) as executor:
+        futures = [executor.submit(run_conversion_job, job) for job in jobs]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,72 @@
+import io
+import pathlib
+import time
+from collections.abc import Iterable, Iterator
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+# outputs that are compressed or encrypted already, deflating them again only costs time
+STORED_SUFFIXES = frozenset({"acep", "acet", "ps_project", "zip"})
+
+CHUNK_SIZE = 1 << 16
+
+
+def compression_for(filename: str) -> int:
+    suffix = filename.rpartition(".")[-1].lower()
+    return ZIP_STORED if suffix in STORED_SUFFIXES else ZIP_DEFLATED
+
+
+def iter_file_chunks(path: pathlib.Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def write_chunks(path: pathlib.Path, chunks: Iterable[bytes]) -> None:
+    with path.open("wb") as file:
+        file.writelines(chunks)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Unseekable sink, so that ``ZipFile`` writes data descriptors instead of seeking back."""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def take(self) -> bytes:
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        return chunk
+
+
+def iter_zip(entries: Iterable[tuple[str, bytes | Iterable[bytes]]]) -> Iterator[bytes]:
+    """Build a zip archive incrementally and yield it chunk by chunk.
+
+    Each entry is a ``(filename, content)`` pair, the content being bytes or an iterable of
+    chunks. Entries are compressed according to :func:`compression_for`, and no more than one
+    input chunk of compressed output is held in memory at a time.
+    """
+    sink = _ChunkSink()
+    with ZipFile(sink, "w") as zip_file:
+        for filename, content in entries:
+            zip_info = ZipInfo(filename, date_time=time.localtime()[:6])
+            zip_info.compress_type = compression_for(filename)
+            with zip_file.open(zip_info, "w") as entry:
+                for chunk in (content,) if isinstance(content, bytes) else content:
+                    entry.write(chunk)
+                    if output := sink.take():
+                        yield output
+            if output := sink.take():
+                yield output
+    yield sink.take()
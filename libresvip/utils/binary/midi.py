@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, BinaryIO, Final
+import dataclasses
+import enum
+from typing import TYPE_CHECKING, BinaryIO, Final, TypeAlias
 
 from construct import (
     Byte,
@@ -52,6 +54,32 @@ EXPRESSION_CONSTANT: Final[float] = 2.0
 MIDI_HEADER_CHUNK: Final[bytes] = b"MThd"
 MIDI_TRACK_CHUNK: Final[bytes] = b"MTrk"
 MIDI_HEADER_DATA_LENGTH: Final[int] = 6
+META_EVENT: Final[int] = 0xFF
+SYSEX_EVENT: Final[int] = 0xF0
+ESCAPE_SEQUENCE: Final[int] = 0xF7
+
+# (absolute tick, status, data1, data2) for channel messages,
+# (absolute tick, 0xFF, meta type, payload) for meta events and
+# (absolute tick, 0xF0 or 0xF7, 0, payload) for sysex messages
+MidiEvent: TypeAlias = tuple[int, int, int, "int | bytes"]
+
+
+class ChannelMessageType(enum.IntEnum):
+    NOTE_OFF = 0x80
+    NOTE_ON = 0x90
+    POLYTOUCH = 0xA0
+    CONTROL_CHANGE = 0xB0
+    PROGRAM_CHANGE = 0xC0
+    AFTERTOUCH = 0xD0
+    PITCHWHEEL = 0xE0
+
+
+class MetaEventType(enum.IntEnum):
+    TRACK_NAME = 0x03
+    LYRICS = 0x05
+    END_OF_TRACK = 0x2F
+    SET_TEMPO = 0x51
+    TIME_SIGNATURE = 0x58
 
 
 def cc11_to_db_change(value: float) -> float:
@@ -76,23 +104,27 @@ class VarIntBE(Construct):
         if not isinstance(obj, integertypes):
             msg = f"value {obj} is not an integer"
             raise IntegerError(msg, path=path)
-        if obj < 0:
-            msg = f"VarIntBE cannot build from negative number {obj}"
-            raise IntegerError(msg, path=path)
-        # from https://github.com/musx-admin/musx/blob/main/musx/midi/midimsg.py
-        x = obj
-        b = bytearray()
-        for i in range(21, 0, -7):
-            if x >= (1 << i):
-                b.append(((x >> i) & 0x7F) | 0x80)
-        b.append(x & 0x7F)
-        stream_write(stream, bytes(b), len(b), path)
+        b = encode_var_int(obj)
+        stream_write(stream, b, len(b), path)
         return obj
 
     def _emitprimitivetype(self, ksy: object, bitwise: bool) -> str:
         return "vlq_base128_be"
 
 
+def encode_var_int(value: int) -> bytes:
+    if value < 0:
+        msg = f"VarIntBE cannot build from negative number {value}"
+        raise IntegerError(msg)
+    # from https://github.com/musx-admin/musx/blob/main/musx/midi/midimsg.py
+    b = bytearray()
+    for i in range(21, 0, -7):
+        if value >= (1 << i):
+            b.append(((value >> i) & 0x7F) | 0x80)
+    b.append(value & 0x7F)
+    return bytes(b)
+
+
 def remember_last(obj: int, ctx: Context) -> None:
     """Stores the last-seen status in the parsing context.
     Bit of a hack to make running status support work.
@@ -369,3 +401,161 @@ class MIDIFileStruct(Construct):
 
 
 MIDIFile = MIDIFileStruct
+
+
+_SINGLE_DATA_BYTE_STATUSES = frozenset(
+    range(ChannelMessageType.PROGRAM_CHANGE, ChannelMessageType.PITCHWHEEL)
+)
+_LENGTH_PREFIXED_STATUSES = frozenset((META_EVENT, SYSEX_EVENT, ESCAPE_SEQUENCE))
+
+
+def encode_pitch_bend(value: int) -> tuple[int, int]:
+    if not PITCH_MIN_VALUE <= value <= PITCH_MAX_VALUE:
+        msg = f"pitch bend value {value} out of range"
+        raise ValueError(msg)
+    return (value - PITCH_MIN_VALUE) & 0x7F, (value - PITCH_MIN_VALUE) >> 7
+
+
+def decode_pitch_bend(lsb: int, msb: int) -> int:
+    return ((msb << 7) | lsb) + PITCH_MIN_VALUE
+
+
+@dataclasses.dataclass
+class RawMidiFile:
+    """
+    A standard MIDI file as plain event tuples, see :data:`MidiEvent`.
+
+    A lighter counterpart of :data:`MIDIFile` for large files; the
+    construct definition stays the reference the codec is checked against.
+    """
+
+    type: int
+    ticks_per_beat: int
+    tracks: list[list[MidiEvent]] = dataclasses.field(default_factory=list)
+
+    @classmethod
+    def parse(cls, content: bytes | bytearray | memoryview) -> RawMidiFile:
+        data = memoryview(content).cast("B")
+        if bytes(data[:4]) != MIDI_HEADER_CHUNK:
+            msg = f"parsing expected {MIDI_HEADER_CHUNK!r} but parsed {bytes(data[:4])!r}"
+            raise ConstError(msg)
+        header_length = int.from_bytes(_read(data, 4, 4), "big")
+        if header_length < MIDI_HEADER_DATA_LENGTH:
+            msg = f"MIDI header length must be at least {MIDI_HEADER_DATA_LENGTH}"
+            raise StreamError(msg)
+        header = _read(data, 8, header_length)
+        midi_file = cls(
+            type=int.from_bytes(header[:2], "big"),
+            ticks_per_beat=int.from_bytes(header[4:6], "big", signed=True),
+        )
+        track_count = int.from_bytes(header[2:4], "big")
+        offset = 8 + header_length
+        while len(midi_file.tracks) < track_count:
+            chunk_magic = bytes(_read(data, offset, 4))
+            chunk_length = int.from_bytes(_read(data, offset + 4, 4), "big")
+            chunk_data = _read(data, offset + 8, chunk_length)
+            offset += 8 + chunk_length
+            if chunk_magic == MIDI_TRACK_CHUNK:
+                midi_file.tracks.append(_parse_track(chunk_data))
+        return midi_file
+
+    def build(self) -> bytes:
+        buffer = bytearray(MIDI_HEADER_CHUNK)
+        buffer += MIDI_HEADER_DATA_LENGTH.to_bytes(4, "big")
+        buffer += self.type.to_bytes(2, "big")
+        buffer += len(self.tracks).to_bytes(2, "big")
+        buffer += self.ticks_per_beat.to_bytes(2, "big", signed=True)
+        for track in self.tracks:
+            track_data = _build_track(track)
+            buffer += MIDI_TRACK_CHUNK
+            buffer += len(track_data).to_bytes(4, "big")
+            buffer += track_data
+        return bytes(buffer)
+
+
+def _read(data: memoryview, offset: int, length: int) -> memoryview:
+    if offset + length > len(data):
+        msg = (
+            f"stream read less than specified amount, expected {length}, "
+            f"found {max(len(data) - offset, 0)}"
+        )
+        raise StreamError(msg)
+    return data[offset : offset + length]
+
+
+def _parse_track(data: memoryview) -> list[MidiEvent]:
+    events: list[MidiEvent] = []
+    append = events.append
+    size = len(data)
+    pos = tick = 0
+    status = None
+    # like the GreedyRange in MIDITrack, a truncated trailing event ends the track
+    try:
+        while pos < size:
+            byte = data[pos]
+            pos += 1
+            delta = byte & 0x7F
+            while byte & 0x80:
+                byte = data[pos]
+                pos += 1
+                delta = (delta << 7) | (byte & 0x7F)
+            if data[pos] & 0x80:
+                status = data[pos]
+                pos += 1
+            elif status is None:
+                break
+            if status < SYSEX_EVENT:
+                if status in _SINGLE_DATA_BYTE_STATUSES:
+                    event = (tick + delta, status, data[pos], 0)
+                    pos += 1
+                else:
+                    event = (tick + delta, status, data[pos], data[pos + 1])
+                    pos += 2
+            elif status in _LENGTH_PREFIXED_STATUSES:
+                if status == META_EVENT:
+                    event_type = data[pos]
+                    pos += 1
+                else:
+                    event_type = 0
+                byte = data[pos]
+                pos += 1
+                length = byte & 0x7F
+                while byte & 0x80:
+                    byte = data[pos]
+                    pos += 1
+                    length = (length << 7) | (byte & 0x7F)
+                if pos + length > size:
+                    break
+                event = (tick + delta, status, event_type, bytes(data[pos : pos + length]))
+                pos += length
+            else:
+                event = (tick + delta, status, 0, 0)
+            tick = event[0]
+            append(event)
+    except IndexError:
+        pass
+    return events
+
+
+def _build_track(events: list[MidiEvent]) -> bytes:
+    buffer = bytearray()
+    append = buffer.append
+    prev_tick = 0
+    for tick, status, data1, data2 in events:
+        delta = tick - prev_tick
+        if 0 <= delta < 0x80:
+            append(delta)
+        else:
+            buffer += encode_var_int(delta)
+        prev_tick = tick
+        append(status)
+        if status < SYSEX_EVENT:
+            append(data1)
+            if status not in _SINGLE_DATA_BYTE_STATUSES:
+                append(data2)  # type: ignore[arg-type]
+        elif status in _LENGTH_PREFIXED_STATUSES:
+            if status == META_EVENT:
+                append(data1)
+            buffer += encode_var_int(len(data2))  # type: ignore[arg-type]
+            buffer += data2  # type: ignore[operator]
+    return bytes(buffer)
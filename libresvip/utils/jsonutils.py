@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+def dump_model_json(
+    model: BaseModel,
+    *,
+    indent: int | None = None,
+    ensure_ascii: bool = False,
+    exclude_none: bool = True,
+    trailing_nul: bool = False,
+) -> bytes:
+    """Serialize ``model`` by alias straight to UTF-8 JSON bytes.
+
+    Unlike ``json.dumps(model.model_dump(mode="json"))``, no intermediate tree of dicts and
+    lists is built. The output is compact unless ``indent`` is given, and ``trailing_nul``
+    appends the NUL terminator some formats expect.
+    """
+    content = to_json(
+        model,
+        indent=indent,
+        ensure_ascii=ensure_ascii,
+        by_alias=True,
+        exclude_none=exclude_none,
+    )
+    return content + b"\x00" if trailing_nul else content
@@ -1,3 +1,4 @@
+import codecs
 import contextlib
 import functools
 import re
@@ -5,7 +6,7 @@ import textwrap
 import uuid
 from collections.abc import Callable
 from encodings.aliases import aliases as encoding_aliases
-from typing import Any
+from typing import Any, NamedTuple
 
 import charset_normalizer.constant
 import zhon
@@ -67,10 +68,45 @@ class CustomBoundriesBlacklist(CustomBoundriesMixin, Blacklist):
     pass
 
 
+class DecodedText(NamedTuple):
+    text: str
+    encoding: str
+
+
+# checked longest first, the UTF-32 LE mark starts with the UTF-16 LE one
+BOM_ENCODINGS: tuple[tuple[bytes, str], ...] = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+DETECTION_SAMPLE_SIZE = 1 << 16
+
+
+def decode_text(content: bytes) -> DecodedText:
+    """Decode text of unknown encoding, trying the cheap guesses before charset detection.
+
+    A byte order mark wins, then strict UTF-8. Otherwise the encoding detected on the first
+    :data:`DETECTION_SAMPLE_SIZE` bytes is used if it decodes the whole content, and the
+    whole content is only run through detection when it does not.
+    """
+    for bom, encoding in BOM_ENCODINGS:
+        if content.startswith(bom):
+            return DecodedText(content.decode(encoding), encoding)
+    with contextlib.suppress(UnicodeDecodeError):
+        return DecodedText(content.decode("utf-8"), "utf-8")
+    if len(content) > DETECTION_SAMPLE_SIZE:
+        sample = content[:DETECTION_SAMPLE_SIZE]
+        if encoding := charset_normalizer.detect(sample)["encoding"]:
+            with contextlib.suppress(UnicodeDecodeError, LookupError):
+                return DecodedText(content.decode(encoding), encoding)
+    encoding = charset_normalizer.detect(content)["encoding"] or "utf-8"
+    return DecodedText(content.decode(encoding), encoding)
+
+
 def to_unicode(content: bytes) -> str:
-    guessed_charset = charset_normalizer.detect(content)
-    encoding = guessed_charset["encoding"] or "utf-8"
-    return content.decode(encoding)
+    return decode_text(content).text
 
 
 @functools.cache
@@ -0,0 +1,204 @@
+import asyncio
+import concurrent.futures
+import dataclasses
+import functools
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from loguru import logger
+
+from libresvip.core.config import (
+    ConversionMode,
+    LibreSvipBaseUISettings,
+    LibreSVIPSettingsContainer,
+)
+from libresvip.extension.base import OptionsDict
+from libresvip.extension.conversion import ConversionOutput, init_conversion_worker, run_conversion
+
+R = TypeVar("R")
+
+
+def convert_contents(
+    ui_settings: LibreSvipBaseUISettings,
+    mode: ConversionMode,
+    max_track_count: int,
+    file_contents: list[bytes],
+    input_format: str,
+    output_format: str,
+    input_options: OptionsDict,
+    output_options: OptionsDict,
+    middleware_options: dict[str, OptionsDict],
+) -> ConversionOutput:
+    with LibreSVIPSettingsContainer.state.init(ui_settings):
+        return run_conversion(
+            file_contents,
+            mode=mode,
+            input_format=input_format,
+            output_format=output_format,
+            input_options=input_options,
+            output_options=output_options,
+            middleware_options=middleware_options,
+            max_track_count=max_track_count,
+        )
+
+
+def settings_snapshot(settings: LibreSvipBaseUISettings) -> LibreSvipBaseUISettings:
+    """Copy the fields worker processes need, dropping subclasses they cannot import."""
+    return LibreSvipBaseUISettings.model_construct(
+        **{name: getattr(settings, name) for name in LibreSvipBaseUISettings.model_fields}
+    )
+
+
+@dataclasses.dataclass
+class _QueuedCall:
+    future: asyncio.Future[Any]
+    call: Callable[[], Any]
+
+
+class ConversionScheduler:
+    """Shares one executor between every web session.
+
+    Each session queues its calls separately and sessions take turns in round-robin
+    order whenever a worker frees up, so a large batch cannot starve other users.
+    At most ``max_per_session`` calls of one session run at the same time. When the
+    executor breaks, e.g. because a worker process was killed, the calls running on it
+    fail and ``executor_factory`` provides a new one for the next calls.
+    """
+
+    def __init__(
+        self,
+        executor: concurrent.futures.Executor | None,
+        *,
+        max_workers: int,
+        max_per_session: int,
+        executor_factory: Callable[[], concurrent.futures.Executor] | None = None,
+    ) -> None:
+        self._executor = executor
+        self._executor_factory = executor_factory
+        self._max_workers = max_workers
+        self._max_per_session = max(1, min(max_per_session, max_workers))
+        self._queues: dict[Hashable, deque[_QueuedCall]] = {}
+        self._running: dict[Hashable, set[asyncio.Future[Any]]] = {}
+        self._running_count = 0
+
+    @classmethod
+    def create(cls, workers: int = 0, max_per_session: int = 0) -> "ConversionScheduler":
+        """Build a scheduler over spawned worker processes.
+
+        ``workers`` defaults to the CPU count and ``max_per_session`` to half of the workers.
+        """
+        workers = workers or os.cpu_count() or 1
+        executor_factory = functools.partial(
+            concurrent.futures.ProcessPoolExecutor,
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_conversion_worker,
+        )
+        return cls(
+            executor_factory(),
+            max_workers=workers,
+            max_per_session=max_per_session or max(1, workers // 2),
+            executor_factory=executor_factory,
+        )
+
+    @property
+    def queued_count(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def running_count(self) -> int:
+        return self._running_count
+
+    def submit(
+        self, session_id: Hashable, func: Callable[..., R], /, *args: Any
+    ) -> asyncio.Future[R]:
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(session_id, deque()).append(
+            _QueuedCall(future, functools.partial(func, *args))
+        )
+        self._dispatch()
+        return future
+
+    def cancel_session(self, session_id: Hashable) -> None:
+        """Cancel every queued call of the session and drop results of its running ones."""
+        for queued in self._queues.pop(session_id, ()):
+            queued.future.cancel()
+        for future in self._running.get(session_id, ()):
+            future.cancel()
+
+    def shutdown(self) -> None:
+        for session_id in list(self._queues):
+            self.cancel_session(session_id)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _next_call(self) -> tuple[Hashable, _QueuedCall] | None:
+        for session_id in list(self._queues):
+            if len(self._running.get(session_id, ())) >= self._max_per_session:
+                continue
+            queue = self._queues.pop(session_id)
+            while queue and queue[0].future.cancelled():
+                queue.popleft()
+            if not queue:
+                continue
+            queued = queue.popleft()
+            if queue:
+                # moving the session to the back of the dict is what makes the turns fair
+                self._queues[session_id] = queue
+            return session_id, queued
+        return None
+
+    def _dispatch(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._running_count < self._max_workers and (item := self._next_call()):
+            session_id, queued = item
+            self._running.setdefault(session_id, set()).add(queued.future)
+            self._running_count += 1
+            executor = self._executor
+            try:
+                inner = loop.run_in_executor(executor, queued.call)
+            except concurrent.futures.BrokenExecutor:
+                executor = self._replace_executor(executor)
+                inner = loop.run_in_executor(executor, queued.call)
+            inner.add_done_callback(
+                functools.partial(self._on_done, session_id, queued.future, executor)
+            )
+
+    def _replace_executor(
+        self, broken: concurrent.futures.Executor | None
+    ) -> concurrent.futures.Executor | None:
+        # calls failing on the same broken executor must not rebuild it more than once
+        if self._executor is broken and self._executor_factory is not None:
+            logger.warning("Conversion executor is broken, starting a new one")
+            if broken is not None:
+                broken.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._executor_factory()
+        return self._executor
+
+    def _on_done(
+        self,
+        session_id: Hashable,
+        future: asyncio.Future[Any],
+        executor: concurrent.futures.Executor | None,
+        inner: asyncio.Future[Any],
+    ) -> None:
+        if not inner.cancelled() and isinstance(
+            inner.exception(), concurrent.futures.BrokenExecutor
+        ):
+            self._replace_executor(executor)
+        self._running_count -= 1
+        running = self._running[session_id]
+        running.discard(future)
+        if not running:
+            del self._running[session_id]
+        if not future.done():
+            if inner.cancelled():
+                future.cancel()
+            elif (exc := inner.exception()) is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(inner.result())
+        self._dispatch()
@@ -4,7 +4,6 @@ import asyncio
 import dataclasses
 import enum
 import functools
-import io
 import math
 import os
 import pathlib
@@ -15,8 +14,7 @@ import shutil
 import textwrap
 import traceback
 import webbrowser
-from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Iterator
 from importlib.resources import as_file
 from operator import not_
 from typing import (
@@ -27,11 +25,9 @@ from typing import (
     get_args,
     get_type_hints,
 )
-from urllib.parse import quote, unquote
-from zipfile import ZipFile
+from urllib.parse import quote
 
 import anyio
-import more_itertools
 from nicegui import PageArguments, app, binding, ui
 from nicegui.context import context
 from nicegui.elements.switch import Switch
@@ -46,6 +42,7 @@ from pydantic import RootModel, create_model
 from pydantic.config import JsonValue
 from pydantic_core import PydanticUndefined
 from pydantic_extra_types.color import Color
+from starlette.responses import Response, StreamingResponse
 from typing_extensions import ParamSpec
 from upath import UPath
 
@@ -60,7 +57,6 @@ from libresvip.core.config import (
     LyricsReplaceMode,
 )
 from libresvip.core.constants import app_dir, res_dir
-from libresvip.core.warning_types import CatchWarnings
 from libresvip.extension.base import ReadOnlyConverterMixin, SVSConverter, WriteOnlyConverterMixin
 from libresvip.extension.manager import (
     get_svs_plugin_by_suffix,
@@ -69,11 +65,18 @@ from libresvip.extension.manager import (
     middleware_manager,
     plugin_manager,
 )
-from libresvip.model.base import BaseComplexModel, Project
+from libresvip.model.base import BaseComplexModel
+from libresvip.utils.archive import iter_file_chunks, iter_zip, write_chunks
 from libresvip.utils.search import find_index
 from libresvip.utils.text import shorten_error_message, supported_charset_names, uuid_str
 from libresvip.utils.translation import gettext_lazy as _
 from libresvip.utils.translation import lazy_translation
+from libresvip.web.executor import (
+    ConversionOutput,
+    ConversionScheduler,
+    convert_contents,
+    settings_snapshot,
+)
 
 if TYPE_CHECKING:
     from nicegui.elements.select import Select
@@ -141,6 +144,12 @@ class ConversionTask:
     success: bool | None
     error: str | None
     warning: str | None
+    upload_content: bytes | None = None
+
+    def read_upload(self) -> bytes:
+        if self.upload_content is not None:
+            return self.upload_content
+        return self.upload_path.read_bytes()
 
     def reset(self) -> None:
         self.running = False
@@ -254,6 +263,23 @@ def index() -> None:
     ui.sub_pages({"/": main_wrapper(header)}).classes("w-full")
 
 
+@app.get("/export/{client_id}")
+@app.get("/export/{client_id}/{filename}")
+def export_files(client_id: str, filename: str = "") -> Response:
+    selected_formats = getattr(app.state, f"{client_id}_selected_formats", None)
+    if selected_formats is None:
+        return Response(status_code=404)
+    result = selected_formats.export_one(filename) if filename else selected_formats.export_all()
+    if result is None:
+        return Response(status_code=404)
+    save_filename, media_type, chunks = result
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={quote(save_filename)}"},
+    )
+
+
 def main_wrapper(header: ui.header) -> Callable[[PageArguments], None]:
     def main_page(args: PageArguments) -> None:
         lang: str | None = args.query_parameters.get("lang")
@@ -825,9 +851,10 @@ def main_wrapper(header: ui.header) -> Callable[[PageArguments], None]:
                         self.input_format = detected_plugin.info.suffix
                 if isinstance(content, pathlib.Path):
                     upload_path = content
+                    upload_content = None
                 else:
                     upload_path = self.temp_path / name
-                    upload_path.write_bytes(content)
+                    upload_content = content
                 output_path = self.temp_path / uuid_str()
                 conversion_task = ConversionTask(
                     name=name,
@@ -837,6 +864,7 @@ def main_wrapper(header: ui.header) -> Callable[[PageArguments], None]:
                     success=None,
                     error=None,
                     warning=None,
+                    upload_content=upload_content,
                 )
                 self.files_to_convert[name] = conversion_task
                 self.tasks_container.refresh()
@@ -860,103 +888,73 @@ def main_wrapper(header: ui.header) -> Callable[[PageArguments], None]:
             def task_count(self) -> int:
                 return len(self.files_to_convert)
 
-            @context_vars_wrapper
-            def convert_one(self, task: ConversionTask, *sub_tasks: list[ConversionTask]) -> None:
+            def apply_output(self, task: ConversionTask, output: ConversionOutput) -> None:
+                task.success = output.success
+                task.warning = output.warning
+                task.error = output.error
+                if not output.success:
+                    return
+                if self._conversion_mode == ConversionMode.SPLIT:
+                    task.output_path.mkdir(parents=True, exist_ok=True)
+                    for i, content in enumerate(output.file_contents):
+                        (
+                            task.output_path
+                            / f"{task.upload_path.stem}_{i + 1:0=2d}.{self.output_format}"
+                        ).write_bytes(content)
+                else:
+                    task.output_path = task.output_path.with_suffix(f".{self.output_format}")
+                    task.output_path.write_bytes(output.file_contents[0])
+
+            async def convert_group(
+                self, task: ConversionTask, file_contents: list[bytes]
+            ) -> ConversionOutput:
+                scheduler: ConversionScheduler = app.state.conversion_scheduler
                 task.reset()
                 task.running = True
                 try:
-                    with CatchWarnings() as w:
-                        input_plugin = get_svs_plugin_by_value(self.input_format)
-                        output_plugin = get_svs_plugin_by_value(self.output_format)
-                        if self._conversion_mode == ConversionMode.MERGE:
-                            child_projects = [
-                                input_plugin.load(
-                                    sub_task.upload_path,
-                                    self.input_options,
-                                )
-                                for sub_task in more_itertools.value_chain(task, sub_tasks)
-                            ]
-                            project = Project.merge_projects(child_projects)
-                        else:
-                            project = input_plugin.load(
-                                task.upload_path,
-                                self.input_options,
-                            )
-                        if self._conversion_mode != ConversionMode.SPLIT:
-                            task.output_path = task.output_path.with_suffix(
-                                f".{self.output_format}",
-                            )
-                        for (
-                            middleware_abbr,
-                            enabled,
-                        ) in self.middleware_enabled_states.model_dump().items():
-                            if enabled and (
-                                middleware_option := self.middleware_options.get(middleware_abbr)
-                            ):
-                                middleware = middleware_manager.plugins.get("middleware", {})[
-                                    middleware_abbr
-                                ]
-                                project = middleware.process(
-                                    project,
-                                    middleware_option.model_dump(),
-                                )
-                        if self._conversion_mode == ConversionMode.SPLIT:
-                            task.output_path.mkdir(parents=True, exist_ok=True)
-                            for i, child_project in enumerate(
-                                project.split_tracks(settings.max_track_count)
-                            ):
-                                output_plugin.dump(
-                                    task.output_path
-                                    / f"{task.upload_path.stem}_{i + 1:0=2d}.{self.output_format}",
-                                    child_project,
-                                    self.output_options,
-                                )
-                        else:
-                            output_plugin.dump(
-                                task.output_path,
-                                project,
-                                self.output_options,
+                    output = await scheduler.submit(
+                        context.client.id,
+                        convert_contents,
+                        settings_snapshot(settings),
+                        self._conversion_mode,
+                        settings.max_track_count,
+                        file_contents,
+                        self.input_format,
+                        self.output_format,
+                        self.input_options,
+                        self.output_options,
+                        {
+                            middleware_abbr: middleware_option.model_dump()
+                            for middleware_abbr, enabled in (
+                                self.middleware_enabled_states.model_dump().items()
                             )
-                        task.success = True
-                    if w.output:
-                        task.warning = w.output
+                            if enabled
+                            and (middleware_option := self.middleware_options.get(middleware_abbr))
+                        },
+                    )
                 except Exception:
-                    task.success = False
-                    task.error = traceback.format_exc()
-                task.running = False
+                    output = ConversionOutput(success=False, error=traceback.format_exc())
+                finally:
+                    task.running = False
+                self.apply_output(task, output)
+                return output
 
             @context_vars_wrapper
             async def batch_convert(self) -> None:
-                loop = asyncio.get_running_loop()
-                running_tasks = []
-                with ThreadPoolExecutor(
-                    max_workers=min(len(self.files_to_convert), 4),
-                ) as executor:
-                    futures: list[asyncio.Future[None]]
-                    if self._conversion_mode == ConversionMode.MERGE:
-                        (task,), other_tasks = more_itertools.spy(self.files_to_convert.values())
-                        futures = [
-                            loop.run_in_executor(
-                                executor,
-                                self.convert_one,
-                                task,
-                                *other_tasks,
-                            )
-                        ]
-                        running_tasks.append(task)
-                    else:
-                        running_tasks = list(self.files_to_convert.values())
-                        futures = [
-                            loop.run_in_executor(
-                                executor,
-                                self.convert_one,
-                                task,
-                            )
-                            for task in running_tasks
-                        ]
-                    for future in asyncio.as_completed(futures):
-                        await future
-                if any(not task.success for task in running_tasks):
+                running_tasks = list(self.files_to_convert.values())
+                if self._conversion_mode == ConversionMode.MERGE:
+                    groups = [
+                        self.convert_group(
+                            running_tasks[0], [task.read_upload() for task in running_tasks]
+                        )
+                    ]
+                    running_tasks = running_tasks[:1]
+                else:
+                    groups = [
+                        self.convert_group(task, [task.read_upload()]) for task in running_tasks
+                    ]
+                outputs = await asyncio.gather(*groups)
+                if any(not output.success for output in outputs):
                     ui.notification(
                         _("Conversion Failed"), type="negative", close_button=_("Close")
                     )
@@ -965,66 +963,47 @@ def main_wrapper(header: ui.header) -> Callable[[PageArguments], None]:
                         _("Conversion Successful"), type="positive", close_button=_("Close")
                     )
 
-            def _export_one(self, filename: str) -> tuple[bytes, int, dict[str, str], str] | None:
+            def export_one(self, filename: str) -> tuple[str, str, Iterator[bytes]] | None:
                 if not (task := self.files_to_convert.get(filename)) or not task.success:
                     return None
                 if self._conversion_mode == ConversionMode.SPLIT:
-                    buffer = io.BytesIO()
-                    with ZipFile(buffer, "w") as zip_file:
-                        for child_file in task.output_path.iterdir():
-                            if not child_file.is_file():
-                                continue
-                            zip_file.writestr(
-                                child_file.name,
-                                child_file.read_bytes(),
-                            )
-                    content = buffer.getvalue()
-                    filename_header = quote(task.upload_path.with_suffix(".zip").name)
-                else:
-                    content = task.output_path.read_bytes()
-                    filename_header = quote(
-                        task.upload_path.with_suffix(task.output_path.suffix).name
+                    return (
+                        task.upload_path.with_suffix(".zip").name,
+                        "application/zip",
+                        iter_zip(
+                            (child_file.name, iter_file_chunks(child_file))
+                            for child_file in task.output_path.iterdir()
+                            if child_file.is_file()
+                        ),
                     )
                 return (
-                    content,
-                    200,
-                    {
-                        "Content-Disposition": f"attachment; filename={filename_header}",
-                    },
+                    task.upload_path.with_suffix(task.output_path.suffix).name,
                     "application/octet-stream",
+                    iter_file_chunks(task.output_path),
                 )
 
-            def _export_all(
-                self,
-            ) -> tuple[bytes, int, dict[str, str], str] | None:
+            def export_all(self) -> tuple[str, str, Iterator[bytes]] | None:
                 if len(self.files_to_convert) == 0:
                     return None
                 elif len(self.files_to_convert) == 1:
                     filename = next(iter(self.files_to_convert))
-                    return self._export_one(filename)
-                buffer = io.BytesIO()
-                with ZipFile(buffer, "w") as zip_file:
+                    return self.export_one(filename)
+
+                def entries() -> Iterator[tuple[str, Iterator[bytes]]]:
                     for task in self.files_to_convert.values():
-                        if task.success:
-                            if task.output_path.is_dir():
-                                for i, child_file in enumerate(task.output_path.iterdir()):
-                                    if not child_file.is_file():
-                                        continue
-                                    zip_file.writestr(
-                                        child_file.name,
-                                        child_file.read_bytes(),
-                                    )
-                            else:
-                                zip_file.writestr(
-                                    task.upload_path.with_suffix(task.output_path.suffix).name,
-                                    task.output_path.read_bytes(),
-                                )
-                return (
-                    buffer.getvalue(),
-                    200,
-                    {"Content-Disposition": "attachment; filename=export.zip"},
-                    "application/zip",
-                )
+                        if not task.success:
+                            continue
+                        if task.output_path.is_dir():
+                            for child_file in task.output_path.iterdir():
+                                if child_file.is_file():
+                                    yield child_file.name, iter_file_chunks(child_file)
+                        else:
+                            yield (
+                                task.upload_path.with_suffix(task.output_path.suffix).name,
+                                iter_file_chunks(task.output_path),
+                            )
+
+                return "export.zip", "application/zip", iter_zip(entries())
 
             @context_vars_wrapper
             async def add_upload(self) -> None:
@@ -1083,13 +1062,11 @@ def main_wrapper(header: ui.header) -> Callable[[PageArguments], None]:
             @context_vars_wrapper
             async def save_file(self, file_name: str = "") -> None:
                 nonlocal select_output
-                result = self._export_one(file_name) if file_name else self._export_all()
+                result = self.export_one(file_name) if file_name else self.export_all()
                 if result is None:
                     ui.notification(_("Save failed!"), type="negative", close_button=_("Close"))
                     return
-                save_filename = unquote(
-                    result[2]["Content-Disposition"].removeprefix("attachment; filename=")
-                )
+                save_filename, _media_type, chunks = result
                 if app.native.main_window is not None and hasattr(
                     app.native.main_window, "create_file_dialog"
                 ):
@@ -1109,13 +1086,15 @@ def main_wrapper(header: ui.header) -> Callable[[PageArguments], None]:
                         return
                     elif not isinstance(save_path, str):  # list[str]
                         save_path = save_path[0]
-                    async with await anyio.open_file(save_path, "wb") as content:
-                        await content.write(result[0])
+                    await anyio.to_thread.run_sync(
+                        functools.partial(write_chunks, pathlib.Path(save_path), chunks)
+                    )
                     ui.notification(_("Saved"), type="positive", close_button=_("Close"))
                 else:
-                    ui.download.content(
-                        content=result[0], filename=save_filename, media_type=result[3]
-                    )
+                    export_url = f"/export/{context.client.id}"
+                    if file_name:
+                        export_url += f"/{quote(file_name)}"
+                    ui.download.from_url(export_url, filename=save_filename)
 
         dark_toggler = ui.dark_mode(dark_mode2bool(getattr(DarkMode, dark_mode.upper())))
         dark_toggler.on_value_change(
@@ -1123,18 +1102,19 @@ def main_wrapper(header: ui.header) -> Callable[[PageArguments], None]:
         )
         selected_formats = SelectedFormats()
         uploader.on_upload(selected_formats.add_task)
-        if app.native.main_window is None:
-            setattr(
-                app.state,
-                f"{context.client.id}_selected_formats",
-                selected_formats,
-            )
+        # also looked up by the export route, which streams results to the browser
+        setattr(
+            app.state,
+            f"{context.client.id}_selected_formats",
+            selected_formats,
+        )
 
-            def recycle_state() -> None:
-                if hasattr(app.state, f"{context.client.id}_selected_formats"):
-                    delattr(app.state, f"{context.client.id}_selected_formats")
+        def recycle_state() -> None:
+            app.state.conversion_scheduler.cancel_session(context.client.id)
+            if hasattr(app.state, f"{context.client.id}_selected_formats"):
+                delattr(app.state, f"{context.client.id}_selected_formats")
 
-            context.client.on_disconnect(recycle_state)
+        context.client.on_disconnect(recycle_state)
         ui.add_head_html(
             textwrap.dedent(
                 """
@@ -2250,6 +2230,18 @@ def main() -> None:
     arg_parser.add_argument("--port", type=int, default=8080)
     arg_parser.add_argument("--server", action="store_true")
     arg_parser.add_argument("--daemon", action="store_true")
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="number of conversion worker processes shared by all sessions, 0 for one per CPU",
+    )
+    arg_parser.add_argument(
+        "--session-workers",
+        type=int,
+        default=0,
+        help="maximum number of conversions one session runs at once, 0 for half the workers",
+    )
     args, _argv = arg_parser.parse_known_args()
 
     if shutil.which("termux-open-url") is not None:
@@ -2263,6 +2255,8 @@ def main() -> None:
     storage_secret = secrets_path.read_text()
     if args.server:
         os.environ["LIBRESVIP_SETTINGS_BACKEND"] = "remote"
+    app.state.conversion_scheduler = ConversionScheduler.create(args.workers, args.session_workers)
+    app.on_shutdown(app.state.conversion_scheduler.shutdown)
 
     with as_file(res_dir / "libresvip.ico") as icon_path:
         ui.run(
@@ -15,6 +15,16 @@ def pinyin_example() -> list[str]:
     ]
 
 
+@pytest.fixture(params=[True, False], ids=["numpy", "pure-python"])
+def use_numpy(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run the test with and without numpy in the module named by ``NUMPY_MODULE``."""
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(request.module.NUMPY_MODULE, "np", None)
+    return request.param
+
+
 @pytest.fixture
 def _pretty_construct() -> None:
     from enum import IntEnum
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from libresvip.core.time_sync import TimeSynchronizer
+from libresvip.model.base import SongTempo
+from libresvip.plugins.acep import base_pitch_curve
+from libresvip.plugins.acep.base_pitch_curve import BasePitchCurve
+from libresvip.plugins.acep.model import AcepNote, AcepVibrato
+
+NUMPY_MODULE = base_pitch_curve
+
+
+def test_semitone_values_at_matches_semitone_value_at(use_numpy: bool) -> None:
+    rng = random.Random(7)
+    notes = []
+    pos = 0
+    for _ in range(40):
+        pos += rng.choice([0, 60, 240])
+        dur = rng.choice([30, 240, 960])
+        vibrato = (
+            AcepVibrato(
+                amplitude=rng.random(),
+                frequency=5.5,
+                start_pos=dur / 3,
+                attack_ratio=0.2,
+                attack_level=1.0,
+                release_ratio=0.1,
+                release_level=0.5,
+            )
+            if rng.random() < 0.5
+            else None
+        )
+        notes.append(AcepNote(pos=pos, dur=dur, pitch=rng.randint(48, 72), vibrato=vibrato))
+        pos += dur
+    synchronizer = TimeSynchronizer(
+        [SongTempo(position=0, bpm=120), SongTempo(position=9600, bpm=90)]
+    )
+    curve = BasePitchCurve(notes, synchronizer)
+    seconds = [rng.uniform(-0.5, 20.0) for _ in range(2000)]
+    seconds.extend(sorted(seconds))
+    assert curve.semitone_values_at(seconds) == pytest.approx(
+        [curve.semitone_value_at(second) for second in seconds]
+    )
+    assert curve.semitone_values_at([]) == []
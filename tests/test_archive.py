@@ -0,0 +1,34 @@
+import io
+import os
+import zipfile
+
+from libresvip.utils.archive import iter_zip
+
+
+def test_iter_zip_streams_valid_archive() -> None:
+    binary = os.urandom(300_000)
+    text = [b"[#0000]\nLyric=a\n" * 4096] * 8
+    chunks = list(
+        iter_zip(
+            [
+                ("song_01.ust", iter(text)),
+                ("song.acep", binary),
+                ("empty.mid", b""),
+            ]
+        )
+    )
+    assert len(chunks) > 3
+    assert max(map(len, chunks)) < len(binary) + 1024
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zip_file:
+        assert zip_file.testzip() is None
+        infos = {info.filename: info for info in zip_file.infolist()}
+        assert infos["song_01.ust"].compress_type == zipfile.ZIP_DEFLATED
+        assert infos["song.acep"].compress_type == zipfile.ZIP_STORED
+        assert zip_file.read("song_01.ust") == b"".join(text)
+        assert zip_file.read("song.acep") == binary
+        assert zip_file.read("empty.mid") == b""
+
+
+def test_iter_zip_empty() -> None:
+    with zipfile.ZipFile(io.BytesIO(b"".join(iter_zip([])))) as zip_file:
+        assert zip_file.namelist() == []
@@ -0,0 +1,44 @@
+import pathlib
+
+import pytest
+
+from libresvip.extension.manager import plugin_manager
+from libresvip.model.base import Note, Project, SingingTrack, SongTempo, TimeSignature
+
+
+def make_project() -> Project:
+    return Project(
+        song_tempo_list=[SongTempo(position=0, bpm=120)],
+        time_signature_list=[TimeSignature()],
+        track_list=[
+            SingingTrack(
+                title="Track",
+                note_list=[
+                    Note(start_pos=i * 480, length=480, key_number=60 + i, lyric="la")
+                    for i in range(8)
+                ],
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize("plugin_id", ["svp", "svip", "mid", "tssln", "acep", "ust"])
+def test_loads_dumps_round_trip(plugin_id: str, tmp_path: pathlib.Path) -> None:
+    plugin = plugin_manager.plugins["svs"].get(plugin_id)
+    if plugin is None:
+        pytest.skip(f"{plugin_id} plugin is not available")
+    input_options = plugin.input_option_cls().model_dump()
+    output_options = plugin.output_option_cls().model_dump()
+    project = make_project()
+
+    content = plugin.dumps(project, output_options)
+    assert isinstance(content, bytes)
+    loaded = plugin.loads(memoryview(content), input_options)
+    assert len(loaded.track_list[0].note_list) == 8
+
+    path = tmp_path / f"project.{plugin.info.suffix}"
+    plugin.dump(path, project, output_options)
+    from_path = plugin.load(path, input_options)
+    assert [
+        (note.start_pos, note.length, note.key_number) for note in from_path.track_list[0].note_list
+    ] == [(note.start_pos, note.length, note.key_number) for note in loaded.track_list[0].note_list]
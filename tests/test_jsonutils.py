@@ -0,0 +1,47 @@
+import json
+
+from libresvip.model.base import Note, Project, SingingTrack, SongTempo, TimeSignature
+from libresvip.plugins.svp.model import SVProject
+from libresvip.utils.jsonutils import dump_model_json
+
+
+def make_project() -> Project:
+    return Project(
+        song_tempo_list=[SongTempo(position=0, bpm=120)],
+        time_signature_list=[TimeSignature()],
+        track_list=[
+            SingingTrack(
+                title="トラック",
+                note_list=[
+                    Note(start_pos=i * 480, length=480, key_number=60 + i, lyric="あ")
+                    for i in range(4)
+                ],
+            )
+        ],
+    )
+
+
+def test_matches_model_dump() -> None:
+    project = make_project()
+    content = dump_model_json(project, exclude_none=False)
+    assert "トラック".encode() in content
+    assert json.loads(content) == project.model_dump(mode="json", by_alias=True)
+    assert json.loads(dump_model_json(project)) == project.model_dump(
+        mode="json", by_alias=True, exclude_none=True
+    )
+    assert b"\n" not in content
+    assert json.loads(dump_model_json(project, indent=2, exclude_none=False)) == json.loads(content)
+
+
+def test_format_quirks() -> None:
+    project = make_project()
+    content = dump_model_json(project, ensure_ascii=True, trailing_nul=True)
+    assert content.isascii()
+    assert content.endswith(b"}\x00")
+    assert json.loads(content[:-1]) == json.loads(dump_model_json(project))
+
+
+def test_vendor_model_round_trip() -> None:
+    sv_project = SVProject.model_validate({"version": 153, "library": [], "tracks": []})
+    content = dump_model_json(sv_project, trailing_nul=True)
+    assert SVProject.model_validate_json(content[:-1]) == sv_project
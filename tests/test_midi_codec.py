@@ -0,0 +1,130 @@
+import random
+
+import pytest
+from construct import Container
+
+from libresvip.core.warning_types import CatchWarnings
+from libresvip.extension.manager import get_svs_plugin_by_value
+from libresvip.utils.binary.midi import (
+    META_EVENT,
+    MidiEvent,
+    MIDIFile,
+    RawMidiFile,
+    decode_pitch_bend,
+    encode_pitch_bend,
+    encode_var_int,
+)
+
+
+def make_track(rng: random.Random, running_status: bool) -> bytes:
+    track = bytearray()
+    track += b"\x00\xff\x51\x03\x07\xa1\x20"
+    track += b"\x00\xff\x03\x05track"
+    status = None
+    for _ in range(500):
+        track += encode_var_int(rng.choice([0, 5, 120, 480, 20000]))
+        next_status = rng.choice([0x90, 0x80, 0xB1, 0xE0, 0xC2, 0xFF])
+        if next_status == META_EVENT:
+            text = bytes(rng.randrange(0x61, 0x7B) for _ in range(rng.randint(0, 200)))
+            track += b"\xff\x05" + encode_var_int(len(text)) + text
+            status = META_EVENT
+            continue
+        if not running_status or next_status != status:
+            track.append(next_status)
+        status = next_status
+        track.append(rng.randrange(128))
+        if next_status != 0xC2:
+            track.append(rng.randrange(128))
+    track += b"\x00\xff\x2f\x00"
+    return b"MTrk" + len(track).to_bytes(4, "big") + bytes(track)
+
+
+def make_midi(seed: int, running_status: bool) -> bytes:
+    rng = random.Random(seed)
+    tracks = [make_track(rng, running_status) for _ in range(3)]
+    return (
+        b"MThd"
+        + (6).to_bytes(4, "big")
+        + (1).to_bytes(2, "big")
+        + len(tracks).to_bytes(2, "big")
+        + (480).to_bytes(2, "big")
+        + b"".join(tracks)
+    )
+
+
+def to_event(tick: int, message: Container) -> MidiEvent:
+    detail = message.detail
+    if detail.type == "meta":
+        data = detail.data
+        if data.type == "set_tempo":
+            payload = data.tempo.to_bytes(3, "big")
+        elif data.type == "end_of_track":
+            payload = b""
+        else:
+            payload = data.get("text", data.get("name"))
+        return tick, message.status, detail.event_type, payload
+    data = detail.data
+    if data.type == "pitchwheel":
+        return tick, message.status, (data.pitch + 8192) & 0x7F, (data.pitch + 8192) >> 7
+    values = [value for key, value in data.items() if key not in ("type", "_io")]
+    return tick, message.status, values[0], values[1] if len(values) > 1 else 0
+
+
+@pytest.mark.parametrize("running_status", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_construct_definition(seed: int, running_status: bool) -> None:
+    content = make_midi(seed, running_status)
+    reference = MIDIFile.parse(content)
+    midi_file = RawMidiFile.parse(memoryview(content))
+    assert midi_file.ticks_per_beat == reference.ticks_per_beat
+    for track, reference_track in zip(midi_file.tracks, reference.tracks, strict=True):
+        tick = 0
+        expected = []
+        for message in reference_track:
+            tick += message.time
+            expected.append(to_event(tick, message))
+        assert track == expected
+    if not running_status:
+        assert midi_file.build() == content == MIDIFile.build(reference)
+    assert RawMidiFile.parse(midi_file.build()) == midi_file
+
+
+def test_truncated_event_ends_track() -> None:
+    track = b"\x00\x90\x3c\x64\x60\x3c"
+    content = (
+        b"MThd\x00\x00\x00\x06\x00\x00\x00\x01\x01\xe0MTrk" + len(track).to_bytes(4, "big") + track
+    )
+    assert RawMidiFile.parse(content).tracks == [[(0, 0x90, 0x3C, 0x64)]]
+    assert len(MIDIFile.parse(content).tracks[0]) == 1
+
+
+@pytest.mark.parametrize(
+    ("meta_event", "warning"),
+    [
+        (b"\xff\x58\x01\x04", "time signature"),
+        (b"\xff\x58\x04\x00\x02\x18\x08", "time signature"),
+        (b"\xff\x51\x00", "tempo"),
+        (b"\xff\x51\x02\x07\xa1", "tempo"),
+        (b"\xff\x51\x03\x00\x00\x00", "tempo"),
+    ],
+)
+def test_malformed_meta_event_is_skipped(meta_event: bytes, warning: str) -> None:
+    track = b"\x00" + meta_event + b"\x00\x90\x3c\x64\x83\x60\x80\x3c\x00\x00\xff\x2f\x00"
+    content = (
+        b"MThd\x00\x00\x00\x06\x00\x00\x00\x01\x01\xe0MTrk" + len(track).to_bytes(4, "big") + track
+    )
+    plugin = get_svs_plugin_by_value("mid")
+    with CatchWarnings() as w:
+        project = plugin.loads(content, plugin.input_option_cls().model_dump())
+    assert f"malformed {warning} event" in w.output
+    assert [(ts.numerator, ts.denominator) for ts in project.time_signature_list] == [(4, 4)]
+    assert len(project.track_list[0].note_list) == 1
+
+
+def test_pitch_bend_round_trip() -> None:
+    assert encode_pitch_bend(0) == (0, 0x40)
+    assert all(
+        decode_pitch_bend(*encode_pitch_bend(value)) == value for value in range(-8192, 8192)
+    )
+    with pytest.raises(ValueError, match="out of range"):
+        encode_pitch_bend(8192)
@@ -0,0 +1,70 @@
+import functools
+import math
+import operator
+import random
+
+import portion
+import pytest
+
+from libresvip.core import time_interval
+from libresvip.core.time_interval import PiecewiseFunction, PiecewiseIntervalDict
+from libresvip.utils.music_math import cosine_easing_in_out_interpolation
+
+NUMPY_MODULE = time_interval
+
+INTERVAL_FACTORIES = [portion.closed, portion.open, portion.closedopen, portion.openclosed]
+
+
+def random_interval(rnd: random.Random) -> portion.Interval:
+    lower = rnd.randint(0, 80) / 4
+    return rnd.choice(INTERVAL_FACTORIES)(lower, lower + rnd.randint(0, 24) / 4)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_matches_interval_dict(seed: int) -> None:
+    rnd = random.Random(seed)
+    interval_dict = PiecewiseIntervalDict()
+    function = PiecewiseFunction()
+    for value in range(rnd.randint(1, 8)):
+        interval = functools.reduce(
+            operator.or_, (random_interval(rnd) for _ in range(rnd.randint(1, 3)))
+        )
+        if rnd.random() < 0.5:
+            value = functools.partial(operator.add, value * 100)
+        # every part is its own segment, see the PiecewiseFunction docstring
+        for atomic in interval:
+            interval_dict[atomic] = value
+        function[interval] = value
+    xs = [x / 8 for x in range(-8, 240)]
+    expected = [interval_dict.get(x) for x in xs]
+    assert [function.get(x) for x in xs] == expected
+    assert function.get_many(xs) == expected
+    assert function.get_many(xs[::-1]) == expected[::-1]
+
+
+def test_segment_kinds(use_numpy: bool) -> None:
+    function = PiecewiseFunction()
+    function.set_constant(-math.inf, 1, 60)
+    function.set_linear((1, 60), (2, 62))
+    function.set_portamento((2, 62), (3, 58), cosine_easing_in_out_interpolation)
+    function.set_vibrato(3, 4, origin=3, frequency=5.5, phase=0.25, amplitude=0.5)
+    function.set_function(5, math.inf, lambda x: x * 2)
+    xs = [0, 1, 1.5, 2, 2.5, 3, 3.3, 4, 4.5, 6]
+    expected = [
+        60,
+        60,
+        61,
+        62,
+        cosine_easing_in_out_interpolation(2.5, (2, 62), (3, 58)),
+        math.sin(math.pi * (2 * 0 * 5.5 - 0.25)) * 0.5,
+        math.sin(math.pi * (2 * (3.3 - 3) * 5.5 - 0.25)) * 0.5,
+        math.sin(math.pi * (2 * (4 - 3) * 5.5 - 0.25)) * 0.5,
+        None,
+        12,
+    ]
+    assert function.get_many(xs) == expected
+    evaluated = function.evaluate(xs)
+    assert math.isnan(evaluated[8])
+    assert evaluated[:8] + evaluated[9:] == pytest.approx(expected[:8] + expected[9:], abs=1e-12)
+    with pytest.raises(KeyError):
+        function[4.5]
@@ -0,0 +1,106 @@
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+from libresvip.extension import manager
+from libresvip.extension.manager import get_svs_plugin_by_suffix, plugin_manager
+from libresvip.extension.plugin_index import LazyPluginLoader, PluginIndexEntry
+from libresvip.extension.vendor import pluginlib
+
+
+def test_index_matches_plugin_classes() -> None:
+    for identifier, plugin in plugin_manager.plugins.get("svs", {}).items():
+        entry = plugin_manager.entries["svs"][identifier]
+        assert entry.version == plugin.version
+        assert entry.suffixes == plugin.info.suffixes
+        assert entry.load_option_cls("input_option_cls") is plugin.input_option_cls
+        assert entry.load_option_cls("output_option_cls") is plugin.output_option_cls
+
+
+def test_index_matches_eager_loader() -> None:
+    eager_loader = pluginlib.PluginLoader(
+        modules=plugin_manager.modules,
+        paths=plugin_manager.paths,
+        type_filter=["svs"],
+        prefix_package=plugin_manager.prefix_package,
+        blacklist=plugin_manager.blacklist,
+    )
+    assert sorted(plugin_manager.plugins.get("svs", {}).items()) == sorted(
+        eager_loader.plugins.get("svs", {}).items()
+    )
+    assert sorted(plugin_manager.available_entries("svs")) == sorted(
+        eager_loader.plugins.get("svs", {})
+    )
+
+
+def test_skipload_plugin_is_not_registered(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "skipped_plugin.py").write_text(
+        "from libresvip.extension.base import SVSConverter\n"
+        "\n"
+        "\n"
+        "class SkippedConverter(SVSConverter):\n"
+        "    _alias_ = 'skipped'\n"
+        "    _skipload_ = True\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    loader = LazyPluginLoader(type_filter=["svs"])
+    loader._index = {
+        "svs": {
+            "skipped": PluginIndexEntry(
+                plugin_type="svs",
+                identifier="skipped",
+                module="skipped_plugin",
+                class_name="SkippedConverter",
+                version=None,
+                metadata_file="skipped.yapsy-plugin",
+                suffixes=("skipped",),
+            )
+        }
+    }
+    loader.loaded = True
+    assert "skipped" in loader.plugins.get("svs", {})
+    assert loader.get_plugin("svs", "skipped") is None
+    assert "skipped" in loader.failed_identifiers
+    assert loader.entries["svs"] == {}
+    assert dict(loader.plugins.get("svs", {})) == {}
+    monkeypatch.setattr(manager, "plugin_manager", loader)
+    manager.invalidate_plugin_caches()
+    try:
+        assert get_svs_plugin_by_suffix("skipped") is None
+    finally:
+        manager.invalidate_plugin_caches()
+
+
+def test_suffix_lookup_imports_single_plugin() -> None:
+    code = (
+        "import sys\n"
+        "from libresvip.extension.manager import get_svs_plugin_by_suffix, plugin_manager\n"
+        "assert 'ust' in plugin_manager.plugins.get('svs', {})\n"
+        "assert not any(m.startswith('libresvip.plugins.') for m in sys.modules)\n"
+        "assert get_svs_plugin_by_suffix('ust') is not None\n"
+        "print(sorted({m.split('.')[2] for m in sys.modules if m.startswith('libresvip.plugins.')}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "['ust']"
+
+
+def test_models_build_on_first_use_or_warm_up() -> None:
+    code = (
+        "from libresvip.extension.manager import warm_up_models\n"
+        "from libresvip.plugins.svp.model import SVProject\n"
+        "from libresvip.plugins.ust.model import UTAUProject\n"
+        "assert not SVProject.__pydantic_complete__\n"
+        "assert not UTAUProject.__pydantic_complete__\n"
+        "UTAUProject()\n"
+        "assert UTAUProject.__pydantic_complete__\n"
+        "warm_up_models()\n"
+        "assert SVProject.__pydantic_complete__\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
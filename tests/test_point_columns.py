@@ -0,0 +1,100 @@
+import copy
+import pickle
+
+import pytest
+
+from libresvip.model.base import ParamCurve, Points
+from libresvip.model.point import Point, PointColumns
+
+
+def test_point_columns_behaves_like_list() -> None:
+    points = [Point(0, 1), Point(5, -2), Point(10, 3)]
+    columns = PointColumns(points)
+    assert columns == points
+    assert len(columns) == 3
+    assert columns[1] == Point(5, -2)
+    assert columns[-1].x == 10
+    assert columns[1:] == points[1:]
+    assert list(reversed(columns)) == points[::-1]
+    assert Point(5, -2) in columns
+    assert columns.index(Point(10, 3)) == 2
+
+    columns.append(Point(15, 4))
+    columns.insert(0, (-5, 0))
+    columns[1] = Point(1, 1)
+    del columns[2]
+    assert columns == [Point(-5, 0), Point(1, 1), Point(10, 3), Point(15, 4)]
+    assert columns.pop() == Point(15, 4)
+    assert [Point(-10, 0)] + columns == [Point(-10, 0), *columns]  # noqa: RUF005
+    columns.extend(PointColumns([Point(20, 5)]))
+    assert columns[-1] == Point(20, 5)
+    columns.sort(key=lambda point: -point.x)
+    assert columns[0] == Point(20, 5)
+
+
+def test_point_columns_widen_out_of_int32_range() -> None:
+    columns = PointColumns([Point(0, 0)])
+    columns.append(Point(2**40, -(2**40)))
+    columns.extend([Point(1, 1)])
+    assert columns == [Point(0, 0), Point(2**40, -(2**40)), Point(1, 1)]
+
+
+def test_point_columns_round_float_coordinates() -> None:
+    columns = PointColumns([(1.4, 2.6)])
+    assert columns == [Point(1, 3)]
+    columns.append(Point(10, 5.5))
+    columns.insert(0, (-0.6, 0))
+    columns[1] = (1, 2.2)
+    assert columns == [Point(-1, 0), Point(1, 2), Point(10, 6)]
+    assert columns.xs.typecode == columns.ys.typecode == "i"
+
+
+@pytest.mark.parametrize("bad_point", [(1, "a"), (1, 2**70), (1, 2, 3)])
+def test_point_columns_unchanged_by_rejected_point(bad_point: tuple) -> None:
+    columns = PointColumns([Point(0, 0)])
+    with pytest.raises((TypeError, ValueError, OverflowError)):
+        columns.append(bad_point)
+    with pytest.raises((TypeError, ValueError, OverflowError)):
+        columns[0] = bad_point
+    assert columns == [Point(0, 0)]
+    assert len(columns.xs) == len(columns.ys) == 1
+
+
+def test_point_columns_round_widened_float_coordinates() -> None:
+    columns = PointColumns([(2**40, 0.4)])
+    columns.append(Point(1, 1.5))
+    assert columns == [Point(2**40, 0), Point(1, 2)]
+
+
+def test_param_curve_serialization() -> None:
+    curve = ParamCurve(points=[Point.start_point(), (0, 100), [480, -50], Point.end_point()])
+    assert isinstance(curve.points.root, PointColumns)
+    assert curve.model_dump(by_alias=True)["PointList"][1] == (0, 100)
+    assert ParamCurve.model_validate_json(curve.model_dump_json(by_alias=True)) == curve
+    assert pickle.loads(pickle.dumps(curve)) == curve
+    assert copy.deepcopy(curve) == curve
+
+    curve.points.root = [Point(1, 2)]
+    assert isinstance(curve.points.root, PointColumns)
+    assert Points(root=[Point(1, 2)]) == curve.points
+
+
+def test_reduce_sample_rate_keeps_interruptions() -> None:
+    curve = ParamCurve(
+        points=[
+            Point(0, -100),
+            Point(10, 10),
+            Point(11, 20),
+            Point(12, 30),
+            Point(13, 40),
+            Point(20, 50),
+            Point(21, -100),
+        ]
+    )
+    assert curve.reduce_sample_rate(5, -100).points.root == [
+        Point(0, -100),
+        Point(10, 10),
+        Point(12, 30),
+        Point(20, 50),
+        Point(21, -100),
+    ]
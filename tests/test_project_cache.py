@@ -0,0 +1,126 @@
+import pathlib
+
+import pytest
+
+from libresvip.core.config import LibreSVIPSettingsContainer, settings
+from libresvip.core.warning_types import CatchWarnings, show_warning
+from libresvip.extension.manager import get_svs_plugin_by_value
+from libresvip.extension.project_cache import ProjectCache, load_project, project_cache
+from libresvip.model import project_codec
+
+UST_DIR = pathlib.Path(__file__).parent / "files" / "ust"
+
+
+@pytest.fixture
+def ust_plugin() -> type:
+    return get_svs_plugin_by_value("ust")
+
+
+def test_memory_tier_hits_and_evicts(ust_plugin: type) -> None:
+    options = ust_plugin.input_option_cls().model_dump()
+    paths = sorted(UST_DIR.glob("*.ust"))
+    cache = ProjectCache(max_size=1 << 20)
+    projects = [cache.load(ust_plugin, path, options) for path in paths]
+    assert cache.stats.misses == len(paths)
+    assert [cache.load(ust_plugin, path, options) for path in paths] == projects
+    assert cache.stats.hits == len(paths)
+
+    cached = cache.load(ust_plugin, paths[0], options)
+    cached.track_list.clear()
+    assert cache.load(ust_plugin, paths[0], options) == projects[0]
+
+    cache.max_size = cache.size - 1
+    cache.load(ust_plugin, paths[-1].read_bytes(), {**options, "fast_parse": False})
+    assert cache.stats.evictions >= 1
+    assert cache.size <= cache.max_size
+
+
+def test_key_tracks_plugin_version(ust_plugin: type, monkeypatch: pytest.MonkeyPatch) -> None:
+    content = (UST_DIR / "basic.ust").read_bytes()
+    key = ProjectCache.make_key(content, ust_plugin, {})
+    assert ProjectCache.make_key(content, ust_plugin, {}) == key
+    assert ProjectCache.make_key(content, ust_plugin, {"encoding": "utf-8"}) != key
+    monkeypatch.setattr(ust_plugin, "_version_", "999.0.0")
+    assert ProjectCache.make_key(content, ust_plugin, {}) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(project_codec, "FORMAT_VERSION", project_codec.FORMAT_VERSION + 1)
+    assert ProjectCache.make_key(content, ust_plugin, {}) != key
+
+
+def test_key_tracks_source_path(ust_plugin: type, tmp_path: pathlib.Path) -> None:
+    options = ust_plugin.input_option_cls().model_dump()
+    content = (UST_DIR / "basic.ust").read_bytes()
+    first, second = tmp_path / "a" / "song.ust", tmp_path / "b" / "song.ust"
+    for path in (first, second):
+        path.parent.mkdir()
+        path.write_bytes(content)
+    cache = ProjectCache(max_size=1 << 20)
+    cache.load(ust_plugin, first, options)
+    cache.load(ust_plugin, second, options)
+    assert (cache.stats.hits, cache.stats.misses) == (0, 2)
+    cache.load(ust_plugin, tmp_path / "b" / ".." / "a" / "song.ust", options)
+    assert cache.stats.hits == 1
+
+
+def test_disk_tier_survives_restart(ust_plugin: type, tmp_path: pathlib.Path) -> None:
+    options = ust_plugin.input_option_cls().model_dump()
+    path = UST_DIR / "multi_track.ust"
+    legacy_file = tmp_path / f"{'0' * 64}.json"
+    legacy_file.write_text("{}")
+    project = ProjectCache(1 << 20, tmp_path).load(ust_plugin, path, options)
+    (cache_file,) = tmp_path.glob("*.bin")
+    assert not legacy_file.exists()
+
+    cache = ProjectCache(1 << 20, tmp_path)
+    assert cache.load(ust_plugin, path, options) == project
+    assert (cache.stats.disk_hits, cache.stats.misses) == (1, 0)
+    assert cache.load(ust_plugin, path, options) == project
+    assert cache.stats.hits == 1
+
+    cache.max_disk_size = cache_file.stat().st_size
+    cache.load(ust_plugin, path, {**options, "fast_parse": False})
+    assert not cache_file.exists()
+    assert len(list(tmp_path.glob("*.bin"))) == 1
+
+
+def test_unreadable_disk_entry_is_a_miss(ust_plugin: type, tmp_path: pathlib.Path) -> None:
+    options = ust_plugin.input_option_cls().model_dump()
+    path = UST_DIR / "multi_track.ust"
+    project = ProjectCache(1 << 20, tmp_path).load(ust_plugin, path, options)
+    (cache_file,) = tmp_path.glob("*.bin")
+    cache_file.write_bytes(cache_file.read_bytes()[:-10])
+
+    cache = ProjectCache(1 << 20, tmp_path)
+    assert cache.load(ust_plugin, path, options) == project
+    assert (cache.stats.disk_hits, cache.stats.misses) == (0, 1)
+    cache.clear()
+    assert cache.load(ust_plugin, path, options) == project
+    assert cache.stats.disk_hits == 1
+
+
+def test_hit_shows_parser_warnings(ust_plugin: type, monkeypatch: pytest.MonkeyPatch) -> None:
+    loads = ust_plugin.loads
+
+    def warning_loads(content: bytes, options: dict) -> object:
+        show_warning("No tempo labels found")
+        return loads(content, options)
+
+    monkeypatch.setattr(ust_plugin, "loads", warning_loads)
+    content = (UST_DIR / "basic.ust").read_bytes()
+    options = ust_plugin.input_option_cls().model_dump()
+    cache = ProjectCache(1 << 20)
+    for _ in range(2):
+        with CatchWarnings() as w:
+            cache.load(ust_plugin, content, options)
+        assert w.output == "No tempo labels found"
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_load_project_is_opt_in(ust_plugin: type) -> None:
+    path = UST_DIR / "basic.ust"
+    options = ust_plugin.input_option_cls().model_dump()
+    ui_settings = settings.model_copy(update={"project_cache_size": 0})
+    with LibreSVIPSettingsContainer.state.init(ui_settings):
+        stats = (project_cache.stats.hits, project_cache.stats.misses)
+        load_project(ust_plugin, path, options)
+        assert (project_cache.stats.hits, project_cache.stats.misses) == stats
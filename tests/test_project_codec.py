@@ -0,0 +1,77 @@
+import pathlib
+
+import pytest
+
+from libresvip.extension.manager import get_svs_plugin_by_value
+from libresvip.model.base import (
+    InstrumentalTrack,
+    Note,
+    ParamCurve,
+    Params,
+    Phones,
+    Points,
+    Project,
+    SingingTrack,
+    SongTempo,
+    TimeSignature,
+    VibratoParam,
+)
+from libresvip.model.point import Point
+
+UST_DIR = pathlib.Path(__file__).parent / "files" / "ust"
+
+
+def test_round_trip_parsed_projects() -> None:
+    ust_plugin = get_svs_plugin_by_value("ust")
+    options = ust_plugin.input_option_cls().model_dump()
+    for path in sorted(UST_DIR.glob("*.ust")):
+        project = ust_plugin.load(path, options)
+        assert Project.from_bytes(project.to_bytes()) == project
+
+
+def test_round_trip_all_fields() -> None:
+    project = Project(
+        song_tempo_list=[SongTempo(position=0, bpm=120), SongTempo(position=1920, bpm=97.5)],
+        time_signature_list=[TimeSignature(), TimeSignature(bar_index=4, numerator=3)],
+        track_list=[
+            SingingTrack(
+                title="歌",
+                mute=True,
+                ai_singer_name="singer",
+                note_list=[
+                    Note(
+                        start_pos=0,
+                        length=480,
+                        key_number=60,
+                        lyric="あ",
+                        pronunciation="a",
+                        head_tag="V",
+                        edited_phones=Phones(head_length_in_secs=0.05, mid_ratio_over_tail=1.5),
+                        vibrato=VibratoParam(
+                            start_percent=0.25,
+                            amplitude=ParamCurve(points=Points(root=[Point(0, 10), Point(5, -3)])),
+                        ),
+                    )
+                ],
+                edited_params=Params(
+                    pitch=ParamCurve(
+                        points=Points(root=[Point(-192000, -100), Point(0, 2**40), Point(5, 0)])
+                    ),
+                ),
+            ),
+            InstrumentalTrack(title="bgm", audio_file_path="bgm.wav", offset=-120, volume=0.5),
+        ],
+    )
+    decoded = Project.from_bytes(project.to_bytes())
+    assert decoded == project
+    assert decoded.track_list[0].edited_params.pitch.points[1] == Point(0, 2**40)
+
+
+def test_rejects_unknown_header() -> None:
+    data = Project().to_bytes()
+    with pytest.raises(ValueError, match="Not a binary"):
+        Project.from_bytes(data[:4])
+    with pytest.raises(ValueError, match="Not a binary"):
+        Project.from_bytes(b"{}" + data[2:])
+    with pytest.raises(ValueError, match="version"):
+        Project.from_bytes(data[:4] + b"\xff" + data[5:])
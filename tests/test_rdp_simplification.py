@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from libresvip.model.point import Point
+from libresvip.plugins.ust import rdp_simplification
+from libresvip.plugins.ust.rdp_simplification import (
+    perpendicular_distance,
+    simplify_shape,
+    simplify_shape_to,
+)
+
+NUMPY_MODULE = rdp_simplification
+
+
+def recursive_simplify_shape(point_list: list[Point], epsilon: float) -> list[Point]:
+    if len(point_list) < 2:
+        return point_list
+    dmax = 0.0
+    index = 0
+    end = len(point_list) - 1
+    for i in range(1, end):
+        d = perpendicular_distance(point_list[i], point_list[0], point_list[end])
+        if d > dmax:
+            index = i
+            dmax = d
+    if dmax <= epsilon:
+        return [point_list[0], point_list[-1]]
+    return recursive_simplify_shape(point_list[: index + 1], epsilon)[
+        :-1
+    ] + recursive_simplify_shape(point_list[index:], epsilon)
+
+
+def random_curve(seed: int) -> list[Point]:
+    rng = random.Random(seed)
+    y = 0
+    point_list = []
+    for i in range(rng.randint(0, 200)):
+        y += rng.randint(-3, 3)
+        point_list.append(Point(i * 5, y))
+    return point_list
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_simplify_shape_matches_recursive(use_numpy: bool, seed: int) -> None:
+    point_list = random_curve(seed)
+    for epsilon in (0.05, 1, 3.3, 10):
+        assert simplify_shape(point_list, epsilon) == recursive_simplify_shape(point_list, epsilon)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_simplify_shape_to_keeps_most_significant(use_numpy: bool, seed: int) -> None:
+    point_list = random_curve(seed)
+    for max_point_count in (3, 10, 40):
+        result = simplify_shape_to(point_list, max_point_count)
+        assert len(result) < max_point_count or len(result) == min(len(point_list), 2)
+        if len(point_list) >= 2:
+            assert result[0] == point_list[0]
+            assert result[-1] == point_list[-1]
+        assert set(simplify_shape_to(point_list, max_point_count // 2 + 2)) <= set(result)
@@ -0,0 +1,62 @@
+import functools
+import random
+import re
+
+from libresvip.core.config import LyricsReplacement, LyricsReplaceMode
+from libresvip.middlewares.replace_lyric.replace_lyric import (
+    FullMatchRuleGroup,
+    get_replacement_plan,
+    replace_lyric,
+)
+
+
+def make_rules(rng: random.Random, count: int) -> list[LyricsReplacement]:
+    syllables = ["a", "ka", "Ka", "sa", "ta", "na", "n", "kan", "x.y"]
+    rules = []
+    for _ in range(count):
+        mode = rng.choice(list(LyricsReplaceMode))
+        if mode == LyricsReplaceMode.REGEX:
+            rules.append(
+                LyricsReplacement(
+                    replacement=r"<\g<0>>",
+                    pattern_main=rng.choice(syllables)[0] + "+",
+                    mode=mode,
+                )
+            )
+        else:
+            rules.append(
+                LyricsReplacement(
+                    replacement=rng.choice([*syllables, "-", "ん"]),
+                    pattern_main=rng.choice(syllables),
+                    flags=rng.choice([re.IGNORECASE, re.UNICODE]),
+                    mode=mode,
+                )
+            )
+    return rules
+
+
+def test_plan_matches_rule_by_rule_replacement() -> None:
+    rng = random.Random(0)
+    lyrics = ["a", "A", "ka", "KA", "kan", "sa ta", "x.y", "xzy", "", "n", "あ"]
+    for _ in range(50):
+        rules = make_rules(rng, rng.randint(1, 30))
+        plan = get_replacement_plan(rules)
+        for lyric in lyrics:
+            assert plan.replace(lyric) == functools.reduce(
+                lambda text, rule: replace_lyric(text, rule), rules, lyric
+            )
+
+
+def test_full_rules_are_merged_and_plan_follows_edits() -> None:
+    rules = [
+        LyricsReplacement(replacement=kana, pattern_main=romaji)
+        for romaji, kana in [("ka", "か"), ("sa", "さ"), ("ta", "た")]
+    ]
+    plan = get_replacement_plan(rules)
+    assert len(plan.steps) == 1
+    assert isinstance(plan.steps[0], FullMatchRuleGroup)
+    assert [plan.replace(lyric) for lyric in ["KA", "sa", "kata"]] == ["か", "さ", "kata"]
+    assert get_replacement_plan(rules) is plan
+
+    rules[0].replacement = "カ"
+    assert get_replacement_plan(rules).replace("ka") == "カ"
@@ -0,0 +1,63 @@
+import asyncio
+import concurrent.futures
+
+import pytest
+
+pytest.importorskip("grpclib")
+
+from libresvip.cli.rpc.libresvip_pb import (
+    ConversionGroup,
+    ConversionMode,
+    ConversionRequest,
+)
+from libresvip.cli.rpc.server import Conversion, create_conversion_pool
+from libresvip.core.config import LibreSVIPSettingsContainer, settings
+from libresvip.extension.manager import get_svs_plugin_by_value
+from libresvip.model.base import Note, Project, SingingTrack, SongTempo, TimeSignature
+
+
+def make_request(group_count: int) -> ConversionRequest:
+    mid_plugin = get_svs_plugin_by_value("mid")
+    groups = []
+    for i in range(group_count):
+        project = Project(
+            song_tempo_list=[SongTempo(position=0, bpm=120)],
+            time_signature_list=[TimeSignature()],
+            track_list=[
+                SingingTrack(
+                    note_list=[
+                        Note(start_pos=j * 480, length=480, key_number=60 + i, lyric="a")
+                        for j in range(4)
+                    ]
+                )
+            ],
+        )
+        content = mid_plugin.dumps(project, mid_plugin.output_option_cls().model_dump())
+        groups.append(ConversionGroup(group_id=str(i), file_contents=[content]))
+    return ConversionRequest(
+        input_format="mid",
+        output_format="ust",
+        mode=ConversionMode.DIRECT,
+        groups=groups,
+    )
+
+
+async def convert(
+    executor: concurrent.futures.Executor | None, request: ConversionRequest
+) -> dict[str, bytes]:
+    conversion = Conversion(executor, max_concurrency=2, max_request_concurrency=1)
+    with LibreSVIPSettingsContainer.state.init(settings):
+        response = await conversion.convert(request)
+    assert all(result.success for result in response.group_results.values())
+    return {
+        group_id: result.file_contents[0] for group_id, result in response.group_results.items()
+    }
+
+
+def test_process_pool_matches_threads() -> None:
+    request = make_request(4)
+    thread_results = asyncio.run(convert(None, request))
+    with create_conversion_pool(2) as executor:
+        pool_results = asyncio.run(convert(executor, request))
+    assert pool_results == thread_results
+    assert sorted(pool_results) == ["0", "1", "2", "3"]
@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from libresvip.extension.manager import get_svs_plugin_by_value
+from libresvip.model.base import Note, Project, SingingTrack, SongTempo, TimeSignature
+from libresvip.plugins.svip.msnrbf.svip_reader import SvipReader
+from libresvip.plugins.svip.msnrbf.svip_writer import SvipWriter
+
+
+def make_svip(note_count: int) -> bytes:
+    plugin = get_svs_plugin_by_value("svip")
+    project = Project(
+        song_tempo_list=[SongTempo(position=0, bpm=120)],
+        time_signature_list=[TimeSignature()],
+        track_list=[
+            SingingTrack(
+                note_list=[
+                    Note(start_pos=i * 480, length=480, key_number=60, lyric="a")
+                    for i in range(note_count)
+                ]
+            )
+        ],
+    )
+    return plugin.dumps(project, plugin.output_option_cls().model_dump())
+
+
+def test_nested_readers_keep_separate_registries() -> None:
+    first, second = make_svip(3), make_svip(5)
+    with SvipReader() as outer:
+        with SvipReader() as inner:
+            _, inner_model = inner.parse(second)
+        _, outer_model = outer.parse(first)
+    assert len(outer_model.track_list.items[0].note_list.buf.items) == 3
+    assert len(inner_model.track_list.items[0].note_list.buf.items) == 5
+
+
+def test_concurrent_round_trips_are_stable() -> None:
+    contents = [make_svip(note_count) for note_count in range(1, 9)]
+
+    def round_trip(content: bytes) -> bytes:
+        with SvipReader() as reader:
+            version, model = reader.parse(content)
+        with SvipWriter() as writer:
+            return writer.build(version, model)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(round_trip, contents * 4))
+    assert results == [round_trip(content) for content in contents * 4]
@@ -0,0 +1,59 @@
+import random
+
+import portion
+import pytest
+
+from libresvip.model.point import Point
+from libresvip.plugins.svp import param_expression
+from libresvip.plugins.svp.param_expression import CurveGenerator, ParamExpression
+from libresvip.utils.music_math import (
+    cosine_easing_in_out_interpolation,
+    cubic_interpolation,
+    linear_interpolation,
+)
+
+NUMPY_MODULE = param_expression
+
+
+def make_curve(
+    rng: random.Random,
+    interpolation: object,
+    base_value: int,
+    interval: portion.Interval | None = None,
+) -> CurveGenerator:
+    positions = sorted(rng.sample(range(-200, 5000), 60))
+    return CurveGenerator(
+        _point_list=[Point(pos, rng.randint(-1000, 1000)) for pos in positions],
+        _interpolation=interpolation,
+        _base_value=base_value,
+        interval=interval,
+    )
+
+
+@pytest.mark.parametrize(
+    "interpolation",
+    [linear_interpolation, cosine_easing_in_out_interpolation, cubic_interpolation],
+)
+def test_values_at_ticks_matches_value_at_ticks(use_numpy: bool, interpolation: object) -> None:
+    rng = random.Random(42)
+    expressions: list[ParamExpression] = [
+        make_curve(rng, interpolation, 0),
+        make_curve(
+            rng, interpolation, 1000, portion.closed(500, 2000) | portion.closed(3000, 3500)
+        ),
+        CurveGenerator(_point_list=[], _interpolation=interpolation, _base_value=7),
+    ]
+    expressions.extend(
+        (
+            expressions[0] + expressions[1],
+            (expressions[0] - expressions[1]) * 0.5 + 3,
+            expressions[0] * expressions[2] / 2.0,
+        )
+    )
+    ascending = list(range(-300, 5200, 5))
+    shuffled = rng.sample(ascending, len(ascending))
+    for expression in expressions:
+        for ticks in (ascending, shuffled, []):
+            assert expression.values_at_ticks(ticks) == pytest.approx(
+                [expression.value_at_ticks(tick) for tick in ticks]
+            )
@@ -0,0 +1,59 @@
+import math
+
+from libresvip.model.base import ParamCurve, Points, SongTempo
+from libresvip.model.point import Point
+from libresvip.model.techno_speech_pitch import (
+    TechnoSpeechParamEvent,
+    TechnoSpeechTrackPitchData,
+    generate_for_techno_speech,
+    pitch_from_techno_speech_track,
+)
+
+TEMPOS = [SongTempo(position=0, bpm=120), SongTempo(position=3840, bpm=150)]
+
+
+def dense_events(count: int) -> list[TechnoSpeechParamEvent]:
+    return [
+        TechnoSpeechParamEvent(100 if i == 0 else None, None, math.log(440.0)) for i in range(count)
+    ]
+
+
+def test_vibrato_modulates_dense_events() -> None:
+    data = TechnoSpeechTrackPitchData(
+        dense_events(200),
+        TEMPOS[:1],
+        1920,
+        [TechnoSpeechParamEvent(150, 50, 30.0)],
+        [TechnoSpeechParamEvent(150, 50, 6.0)],
+    )
+    curve = pitch_from_techno_speech_track(data)
+    assert curve is not None
+    modulated = [point for point in curve.points.root if point.y not in (6900, -100)]
+    assert all(2640 <= point.x <= 2880 for point in modulated)
+    assert 25 < max(point.y for point in modulated) - 6900 <= 30
+    assert -30 <= min(point.y for point in modulated) - 6900 < -25
+
+
+def test_unset_vibrato_amplitude_defaults_to_one() -> None:
+    data = TechnoSpeechTrackPitchData(
+        dense_events(200), TEMPOS[:1], 1920, [], [TechnoSpeechParamEvent(150, 50, 6.0)]
+    )
+    curve = pitch_from_techno_speech_track(data)
+    assert curve is not None
+    assert {point.y for point in curve.points.root} == {-100, 6899, 6900, 6901}
+
+
+def test_round_trip() -> None:
+    points = [Point(1920 + i * 5, 6000 + (i % 40) * 10) for i in range(2000)]
+    curve = ParamCurve(
+        points=Points(root=[Point.start_point(), *points, Point(11920, -100), Point.end_point()])
+    )
+    data = generate_for_techno_speech(curve, TEMPOS[:1], 1920)
+    assert data is not None
+    data.tempos = TEMPOS[:1]
+    restored = pitch_from_techno_speech_track(data)
+    assert restored is not None
+    restored_points = restored.points.root[1:-3]
+    assert restored_points[0] == Point(1920, 6000)
+    assert {point.y for point in restored_points} <= {point.y for point in points}
+    assert abs(restored.points[-2].x - 11920) <= 10
@@ -0,0 +1,57 @@
+import codecs
+
+import pytest
+
+from libresvip.utils import text
+from libresvip.utils.text import decode_text, to_unicode
+
+LYRICS = "name: 歌詞テスト\nlyric: あいうえお\n"
+KANA = "あかさたなはまやらわん"
+LONG_TEXT = "\n".join(
+    f"- position: {i * 480}\n  tone: {60 + i % 12}\n  lyric: {KANA[i % len(KANA)]}"
+    for i in range(2000)
+)
+
+
+@pytest.mark.parametrize(
+    ("content", "encoding"),
+    [
+        (codecs.BOM_UTF8 + LYRICS.encode(), "utf-8-sig"),
+        (LYRICS.encode("utf-16"), "utf-16"),
+        (LYRICS.encode("utf-32"), "utf-32"),
+        (LYRICS.encode(), "utf-8"),
+    ],
+)
+def test_bom_and_utf8_skip_detection(
+    content: bytes, encoding: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(text.charset_normalizer, "detect", pytest.fail)
+    assert decode_text(content) == (LYRICS, encoding)
+
+
+def test_large_content_detected_on_sample(monkeypatch: pytest.MonkeyPatch) -> None:
+    content = LONG_TEXT.encode("shift_jis")
+    assert len(content) > text.DETECTION_SAMPLE_SIZE
+    sizes = []
+    detect = text.charset_normalizer.detect
+
+    def recording_detect(data: bytes) -> dict:
+        sizes.append(len(data))
+        return detect(data)
+
+    monkeypatch.setattr(text.charset_normalizer, "detect", recording_detect)
+    decoded = decode_text(content)
+    assert decoded.text == LONG_TEXT
+    assert codecs.lookup(decoded.encoding).name in {"cp932", "shift_jis"}
+    assert sizes == [text.DETECTION_SAMPLE_SIZE]
+
+
+def test_falls_back_to_full_detection(monkeypatch: pytest.MonkeyPatch) -> None:
+    content = LONG_TEXT.encode("shift_jis")
+    detect = text.charset_normalizer.detect
+    monkeypatch.setattr(
+        text.charset_normalizer,
+        "detect",
+        lambda data: {"encoding": "ascii"} if len(data) < len(content) else detect(data),
+    )
+    assert to_unicode(content) == LONG_TEXT
@@ -0,0 +1,33 @@
+import random
+
+from libresvip.core.time_sync import TimeSynchronizer
+from libresvip.model.base import SongTempo
+
+
+def _naive_actual_ticks(tempo_list: list[SongTempo], default_tempo: float, ticks: int) -> float:
+    res = 0.0
+    idx = max(sum(1 for tempo in tempo_list if tempo.position <= ticks) - 1, 0)
+    for i in range(idx):
+        res += (tempo_list[i + 1].position - tempo_list[i].position) * (
+            default_tempo / tempo_list[i].bpm
+        )
+    res += (ticks - tempo_list[idx].position) * default_tempo / tempo_list[idx].bpm
+    return res
+
+
+def test_actual_ticks_from_ticks() -> None:
+    rng = random.Random(42)
+    tempo_list = [SongTempo(position=0, bpm=120)] + [
+        SongTempo(position=i * 480, bpm=rng.uniform(60, 240)) for i in range(1, 200)
+    ]
+    synchronizer = TimeSynchronizer(tempo_list, _is_absolute_time_code=True, _default_tempo=120)
+    ticks_list = [rng.randint(-1920, 200 * 480) for _ in range(1000)]
+    expected = [_naive_actual_ticks(tempo_list, 120, ticks) for ticks in ticks_list]
+    assert [synchronizer.get_actual_ticks_from_ticks(ticks) for ticks in ticks_list] == expected
+    assert synchronizer.get_actual_ticks_from_ticks_batch(ticks_list) == expected
+
+
+def test_actual_ticks_from_ticks_relative_time_code() -> None:
+    synchronizer = TimeSynchronizer([SongTempo(position=0, bpm=90)])
+    assert synchronizer.get_actual_ticks_from_ticks(960) == 960
+    assert synchronizer.get_actual_ticks_from_ticks_batch([960, 0]) == [960, 0]
@@ -0,0 +1,53 @@
+import random
+
+from libresvip.model.base import Note, SongTempo
+from libresvip.model.timeline import NoteTimeline, TempoTimeline, TimelineIndex
+from libresvip.utils.search import find_index, find_last_index
+
+
+def random_notes(rng: random.Random) -> list[Note]:
+    notes = []
+    pos = 0
+    for _ in range(rng.randint(0, 30)):
+        pos += rng.choice([0, 60, 240, 480])
+        notes.append(Note(start_pos=pos, length=rng.choice([30, 240, 960]), key_number=60))
+    return notes
+
+
+def test_lookups_match_linear_search() -> None:
+    rng = random.Random(3)
+    for _ in range(50):
+        notes = random_notes(rng)
+        timeline = NoteTimeline(notes)
+        cursor = timeline.cursor()
+        positions = sorted(rng.randint(-100, 8000) for _ in range(50))
+        for position in positions + positions[::-1]:
+            last_index = find_last_index(notes, lambda note: note.start_pos <= position)
+            first_index = find_index(notes, lambda note: note.start_pos >= position)
+            assert timeline.last_index_at(position) == last_index
+            assert timeline.first_index_at(position) == first_index
+            assert timeline.first_index_after(position) == find_index(
+                notes, lambda note: note.start_pos > position
+            )
+            assert cursor.last_index_at(position) == last_index
+            assert cursor.first_index_at(position) == first_index
+            expected_note = notes[last_index] if last_index >= 0 else None
+            if expected_note is not None and expected_note.end_pos <= position:
+                expected_note = None
+            assert timeline.note_at(position) is expected_note
+            end = position + rng.randint(0, 1000)
+            assert timeline.overlapping(position, end) == [
+                note for note in notes if note.start_pos < end and note.end_pos > position
+            ]
+            assert timeline.items_between(position, end) == [
+                note for note in notes if position <= note.start_pos < end
+            ]
+
+
+def test_tempo_at() -> None:
+    tempos = [SongTempo(position=0, bpm=120), SongTempo(position=1920, bpm=90)]
+    timeline = TempoTimeline(tempos)
+    assert timeline.tempo_at(-10).bpm == 120
+    assert timeline.tempo_at(1919).bpm == 120
+    assert timeline.tempo_at(1920).bpm == 90
+    assert TimelineIndex([], []).item_at(0) is None
@@ -0,0 +1,107 @@
+import pathlib
+import zipfile
+
+import pytest
+
+from libresvip.core.config import ConversionMode, settings
+from libresvip.extension.manager import get_svs_plugin_by_value
+from libresvip.model.base import Note, Project, SingingTrack, SongTempo, TimeSignature
+from libresvip.tui.conversion import ConversionJob, resolve_worker_count, run_conversion_jobs
+
+
+def make_inputs(tmp_path: pathlib.Path, count: int) -> list[pathlib.Path]:
+    mid_plugin = get_svs_plugin_by_value("mid")
+    input_paths = []
+    for i in range(count):
+        project = Project(
+            song_tempo_list=[SongTempo(position=0, bpm=120)],
+            time_signature_list=[TimeSignature()],
+            track_list=[
+                SingingTrack(
+                    note_list=[
+                        Note(start_pos=j * 480, length=480, key_number=60 + i + k, lyric="a")
+                        for j in range(4)
+                    ]
+                )
+                for k in range(2)
+            ],
+        )
+        input_path = tmp_path / f"input_{i}.mid"
+        mid_plugin.dump(input_path, project, mid_plugin.output_option_cls().model_dump())
+        input_paths.append(input_path)
+    return input_paths
+
+
+def make_jobs(
+    input_paths: list[pathlib.Path], output_dir: pathlib.Path, mode: ConversionMode
+) -> list[ConversionJob]:
+    suffix = "zip" if mode == ConversionMode.SPLIT else "ust"
+    return [
+        ConversionJob(
+            mode=mode,
+            input_paths=[input_path],
+            output_path=output_dir / f"{input_path.stem}.{suffix}",
+            input_format="mid",
+            output_format="ust",
+        )
+        for input_path in input_paths
+    ]
+
+
+def test_process_pool_matches_single_worker(tmp_path: pathlib.Path) -> None:
+    input_paths = make_inputs(tmp_path, 3)
+    input_paths.insert(1, tmp_path / "missing.mid")
+    for workers, output_dir in ((1, tmp_path / "serial"), (2, tmp_path / "pool")):
+        output_dir.mkdir()
+        outcomes = list(
+            run_conversion_jobs(
+                make_jobs(input_paths, output_dir, ConversionMode.DIRECT),
+                workers,
+                settings.model_copy(),
+            )
+        )
+        assert [outcome.success for outcome in outcomes] == [True, False, True, True]
+        assert "missing.mid" in outcomes[1].log_text
+    assert sorted(path.name for path in (tmp_path / "pool").iterdir()) == [
+        "input_0.ust",
+        "input_1.ust",
+        "input_2.ust",
+    ]
+    for path in (tmp_path / "pool").iterdir():
+        assert path.read_bytes() == (tmp_path / "serial" / path.name).read_bytes()
+
+
+def test_split_writes_zip(tmp_path: pathlib.Path) -> None:
+    (job,) = make_jobs(make_inputs(tmp_path, 1), tmp_path, ConversionMode.SPLIT)
+    (outcome,) = run_conversion_jobs([job], 1, settings.model_copy())
+    assert outcome.success
+    with zipfile.ZipFile(job.output_path) as zip_file:
+        assert zip_file.namelist() == ["input_0_01.ust", "input_0_02.ust"]
+
+
+@pytest.mark.parametrize("mode", [ConversionMode.DIRECT, ConversionMode.SPLIT])
+def test_failed_dump_leaves_no_partial_file(
+    mode: ConversionMode, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (job,) = make_jobs(make_inputs(tmp_path, 1), tmp_path / "out", mode)
+    job.output_path.parent.mkdir()
+    job.output_path.write_bytes(b"previous")
+    ust_plugin = get_svs_plugin_by_value("ust")
+
+    def failing_dump(path: pathlib.Path, project: Project, options: dict) -> None:
+        path.write_bytes(b"partial")
+        raise RuntimeError
+
+    monkeypatch.setattr(ust_plugin, "dump", failing_dump)
+    (outcome,) = run_conversion_jobs([job], 1, settings.model_copy())
+    assert not outcome.success
+    assert "RuntimeError" in outcome.log_text
+    assert list(job.output_path.parent.iterdir()) == [job.output_path]
+    assert job.output_path.read_bytes() == b"previous"
+
+
+def test_resolve_worker_count() -> None:
+    assert resolve_worker_count(3, 10) == 3
+    assert resolve_worker_count(3, 2) == 2
+    assert resolve_worker_count(0, 1) == 1
+    assert resolve_worker_count(0, 0) == 1
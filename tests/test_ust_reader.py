@@ -0,0 +1,37 @@
+import io
+import pathlib
+
+import pytest
+
+from libresvip.extension.manager import plugin_manager
+from libresvip.plugins.ust.model import UstWalker, get_ust_grammar
+from libresvip.plugins.ust.ust_reader import MalformedUstError, read_ust
+
+ust_test_base_path = pathlib.Path(__file__).parent / "files" / "ust"
+USTConverter = plugin_manager.plugins["svs"]["ust"]
+
+
+@pytest.mark.parametrize(
+    "test_file", sorted(ust_test_base_path.glob("*.ust")), ids=lambda p: p.stem
+)
+def test_ust_reader_matches_grammar(test_file: pathlib.Path) -> None:
+    ust_text = test_file.read_bytes().decode("utf-8")
+    expected = UstWalker().walk(get_ust_grammar().parse(ust_text))
+    actual = read_ust(io.StringIO(ust_text, newline=""))
+    assert actual == expected
+
+    options = {"encoding": "utf-8"}
+    assert USTConverter.load(test_file, {**options, "fast_parse": True}) == USTConverter.load(
+        test_file, {**options, "fast_parse": False}
+    )
+
+
+def test_ust_reader_rejects_unsupported_values(tmp_path: pathlib.Path) -> None:
+    ust_text = "[#SETTING]\nTempo=120\n[#0000]\nLength=+480\nLyric=a\nNoteNum=60\n[#TRACKEND]\n"
+    with pytest.raises(MalformedUstError):
+        read_ust(io.StringIO(ust_text, newline=""))
+
+    test_file = tmp_path / "fallback.ust"
+    test_file.write_text(ust_text, encoding="utf-8")
+    project = USTConverter.load(test_file, {"encoding": "utf-8"})
+    assert project.track_list[0].note_list[0].lyric == "a"
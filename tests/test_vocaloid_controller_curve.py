@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from libresvip.model.vocaloid.controller_models import ControllerCurve, ControllerEvent
+
+
+def value_at(curve: ControllerCurve, pos: int) -> int:
+    value = curve.default_value
+    for event in curve.events:
+        if event.pos <= pos:
+            value = event.value
+    return value
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_indexed_lookups_match_scan(seed: int) -> None:
+    rng = random.Random(seed)
+    pit = ControllerCurve(
+        name="pitch_bend",
+        events=[
+            ControllerEvent(pos=rng.randint(0, 300), value=rng.randint(-8192, 8191))
+            for _ in range(rng.randint(0, 40))
+        ],
+    )
+    pbs = ControllerCurve(
+        name="pitch_bend_sens",
+        events=[
+            ControllerEvent(pos=rng.randint(0, 300), value=rng.randint(1, 24))
+            for _ in range(rng.randint(0, 5))
+        ],
+        default_value=2,
+    )
+    for pos in range(-2, 305):
+        assert pit.get_value_at(pos) == value_at(pit, pos)
+
+    positions = sorted({event.pos for event in pit.events} | {event.pos for event in pbs.events})
+    assert list(pit.combine(pbs)) == [
+        (pos, value_at(pit, pos), value_at(pbs, pos)) for pos in positions
+    ]
+
+    start_pos, end_pos = sorted((rng.randint(-5, 310), rng.randint(-5, 310)))
+    expected = [
+        (event.pos, event.value) for event in pit.events if start_pos <= event.pos <= end_pos
+    ]
+    assert pit.get_value_range(start_pos, end_pos) == expected
+    assert [(point.x, point.y) for point in pit.to_points(start_pos, end_pos)] == expected
+    assert len(pit.to_points()) == len(pit.events)
@@ -0,0 +1,154 @@
+import asyncio
+import concurrent.futures
+import functools
+import multiprocessing
+import operator
+import os
+import threading
+import time
+
+import pytest
+
+from libresvip.core.config import ConversionMode, settings
+from libresvip.extension.manager import get_svs_plugin_by_value
+from libresvip.model.base import Note, Project, SingingTrack, SongTempo, TimeSignature
+from libresvip.web.executor import ConversionScheduler, convert_contents, settings_snapshot
+
+
+class Recorder:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.started: list[str] = []
+        self.running: dict[str, int] = {}
+        self.max_running: dict[str, int] = {}
+
+    def __call__(self, session_id: str, name: str) -> str:
+        with self.lock:
+            self.started.append(name)
+            self.running[session_id] = self.running.get(session_id, 0) + 1
+            self.max_running[session_id] = max(
+                self.max_running.get(session_id, 0), self.running[session_id]
+            )
+        time.sleep(0.02)
+        with self.lock:
+            self.running[session_id] -= 1
+        return name
+
+
+def test_sessions_take_turns() -> None:
+    recorder = Recorder()
+
+    async def run() -> list[str]:
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            scheduler = ConversionScheduler(executor, max_workers=1, max_per_session=1)
+            futures = [scheduler.submit("a", recorder, "a", f"a{i}") for i in range(4)]
+            futures += [scheduler.submit("b", recorder, "b", f"b{i}") for i in range(2)]
+            return await asyncio.gather(*futures)
+
+    results = asyncio.run(run())
+    assert results == ["a0", "a1", "a2", "a3", "b0", "b1"]
+    assert recorder.started.index("b1") < recorder.started.index("a3")
+
+
+def test_session_concurrency_cap() -> None:
+    recorder = Recorder()
+
+    async def run() -> None:
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            scheduler = ConversionScheduler(executor, max_workers=4, max_per_session=2)
+            futures = [scheduler.submit("a", recorder, "a", f"a{i}") for i in range(6)]
+            futures += [scheduler.submit("b", recorder, "b", f"b{i}") for i in range(6)]
+            assert scheduler.running_count == 4
+            assert scheduler.queued_count == 8
+            await asyncio.gather(*futures)
+            assert scheduler.running_count == scheduler.queued_count == 0
+
+    asyncio.run(run())
+    assert recorder.max_running == {"a": 2, "b": 2}
+
+
+def test_cancel_session_drops_queued_calls() -> None:
+    recorder = Recorder()
+
+    async def run() -> None:
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            scheduler = ConversionScheduler(executor, max_workers=1, max_per_session=1)
+            cancelled = [scheduler.submit("a", recorder, "a", f"a{i}") for i in range(3)]
+            kept = scheduler.submit("b", recorder, "b", "b0")
+            scheduler.cancel_session("a")
+            assert scheduler.queued_count == 1
+            assert await kept == "b0"
+            for future in cancelled:
+                with pytest.raises(asyncio.CancelledError):
+                    await future
+
+    asyncio.run(run())
+    assert recorder.started == ["a0", "b0"]
+
+
+def test_broken_process_pool_is_replaced() -> None:
+    executor_factory = functools.partial(
+        concurrent.futures.ProcessPoolExecutor,
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    async def run() -> None:
+        scheduler = ConversionScheduler(
+            executor_factory(),
+            max_workers=1,
+            max_per_session=1,
+            executor_factory=executor_factory,
+        )
+        try:
+            crashed = scheduler.submit("a", os._exit, 1)
+            after_crash = scheduler.submit("b", operator.add, 1, 2)
+            with pytest.raises(concurrent.futures.process.BrokenProcessPool):
+                await crashed
+            assert await after_crash == 3
+            assert await scheduler.submit("a", operator.add, 2, 3) == 5
+        finally:
+            scheduler.shutdown()
+
+    asyncio.run(run())
+
+
+def test_process_pool_conversion() -> None:
+    mid_plugin = get_svs_plugin_by_value("mid")
+    project = Project(
+        song_tempo_list=[SongTempo(position=0, bpm=120)],
+        time_signature_list=[TimeSignature()],
+        track_list=[
+            SingingTrack(
+                note_list=[
+                    Note(start_pos=j * 480, length=480, key_number=60 + k, lyric="a")
+                    for j in range(4)
+                ]
+            )
+            for k in range(2)
+        ],
+    )
+    content = mid_plugin.dumps(project, mid_plugin.output_option_cls().model_dump())
+    args = (
+        settings_snapshot(settings),
+        ConversionMode.SPLIT,
+        1,
+        [content],
+        "mid",
+        "ust",
+        {},
+        {},
+        {},
+    )
+
+    async def run() -> None:
+        scheduler = ConversionScheduler.create(2)
+        try:
+            output = await scheduler.submit("a", convert_contents, *args)
+        finally:
+            scheduler.shutdown()
+        assert output == convert_contents(*args)
+        assert output.success
+        assert len(output.file_contents) == 2
+
+    asyncio.run(run())